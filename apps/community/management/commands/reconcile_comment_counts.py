@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.community.utils.comment_count import reconcile_comment_counts
+
+
+class Command(BaseCommand):
+    help = "게시글의 comment_count 를 실제 댓글 수와 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("post_ids", nargs="*", type=int, help="보정할 게시글 ID (생략하면 전체)")
+
+    def handle(self, *args, **options):
+        updated = reconcile_comment_counts(options["post_ids"] or None)
+        self.stdout.write(self.style.SUCCESS(f"comment_count 보정 완료: {updated}건"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0004_remove_postimage_img_url_remove_postimage_updated_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postimage",
+            name="thumbnail_url",
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="postimage",
+            name="webp_url",
+            field=models.URLField(blank=True, null=True),
+        ),
+    ]
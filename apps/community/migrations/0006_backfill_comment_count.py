@@ -0,0 +1,25 @@
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_count(apps, schema_editor):
+    Post = apps.get_model("community", "Post")
+    Comment = apps.get_model("community", "Comment")
+
+    # 지금까지 갱신되지 않던 comment_count 를 실제 댓글 수로 채운다
+    counts = (
+        Comment.objects.filter(post=OuterRef("pk")).order_by().values("post").annotate(count=Count("*")).values("count")
+    )
+    Post.objects.update(comment_count=Coalesce(Subquery(counts, output_field=IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0005_image_variants"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_comment_count, migrations.RunPython.noop),
+    ]
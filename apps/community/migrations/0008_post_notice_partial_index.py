@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0007_comment_post_created_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_notice", True)), fields=["-created_at"], name="posts_notice_created_idx"
+            ),
+        ),
+    ]
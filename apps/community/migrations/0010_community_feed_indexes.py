@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:21
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 테이블에 쓰기 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능)
+    atomic = False
+
+    dependencies = [
+        ("community", "0009_pending_upload"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_notice", False)), fields=["-created_at", "-id"], name="posts_feed_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_notice", False)),
+                fields=["category", "-created_at", "-id"],
+                name="posts_feed_category_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_notice", False)), fields=["-view_count", "-id"], name="posts_feed_views_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_notice", False)), fields=["-likes_count", "-id"], name="posts_feed_likes_idx"
+            ),
+        ),
+    ]
@@ -32,6 +32,27 @@ class Post(models.Model):
 
     class Meta:
         db_table = "posts"
+        indexes = [
+            # 상단 고정 공지만 담는 부분 인덱스 (공지 목록 조회 시 전체 게시글을 정렬하지 않도록)
+            models.Index(fields=["-created_at"], condition=models.Q(is_notice=True), name="posts_notice_created_idx"),
+            # 게시글 목록 (공지 제외) 의 정렬 기준별 부분 인덱스. 숨김 게시글은 드물어서 is_visible 은 스캔 중 필터로 처리
+            # -> 사용자 목록(is_visible=True)과 어드민 목록(is_visible 선택)이 같은 인덱스를 사용
+            # 정렬 값이 같은 게시글의 페이지 순서가 고정되도록 목록의 "-id" 보조 정렬까지 인덱스에 포함
+            models.Index(
+                fields=["-created_at", "-id"], condition=models.Q(is_notice=False), name="posts_feed_created_idx"
+            ),
+            models.Index(
+                fields=["category", "-created_at", "-id"],
+                condition=models.Q(is_notice=False),
+                name="posts_feed_category_idx",
+            ),
+            models.Index(
+                fields=["-view_count", "-id"], condition=models.Q(is_notice=False), name="posts_feed_views_idx"
+            ),
+            models.Index(
+                fields=["-likes_count", "-id"], condition=models.Q(is_notice=False), name="posts_feed_likes_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.id}] {self.title}"
@@ -56,6 +77,9 @@ class PostImage(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="images")  # 삽입된 게시글
     image_url = models.URLField()
     image_name = models.CharField(max_length=50)
+    # Celery 에서 생성하는 변환본 (목록용 썸네일, 본문용 WebP)
+    thumbnail_url = models.URLField(null=True, blank=True)
+    webp_url = models.URLField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -65,6 +89,19 @@ class PostImage(models.Model):
         return f"Image for Post {self.post.id}"
 
 
+# 게시글 등록 중 업로드한 S3 파일 (outbox)
+# 업로드 전에 기록하고 게시글 저장 트랜잭션에서 삭제 -> 남아 있는 행은 DB 저장에 실패한 파일이므로 백그라운드에서 정리
+class PendingUpload(models.Model):
+    s3_key = models.CharField(max_length=500)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "pending_uploads"
+
+    def __str__(self) -> str:
+        return self.s3_key
+
+
 # 댓글
 class Comment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="comments")  # 댓글 단 게시글
@@ -77,6 +114,10 @@ class Comment(models.Model):
 
     class Meta:
         db_table = "comments"
+        indexes = [
+            # 게시글 별 댓글 목록 (최신순 커서 페이지네이션)
+            models.Index(fields=["post", "-created_at", "id"], name="comments_post_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.author} - {self.content[:20]}"
@@ -1,6 +1,27 @@
 from rest_framework import serializers
 
 from apps.community.models import PostAttachment, PostImage
+from core.utils.s3_file_upload import UploadPolicy
+from core.utils.validators import (
+    ALLOWED_IMAGE_EXTENSIONS,
+    BLOCKED_ATTACHMENT_EXTENSIONS,
+)
+
+# 게시글 파일 S3 직접 업로드 조건 (게시글 작성 시 multipart 업로드와 같은 제한)
+POST_FILE_UPLOAD_POLICIES = {
+    "image": UploadPolicy(
+        prefix="oz_externship_be/community/images",
+        max_size_mb=5,
+        allowed_extensions=ALLOWED_IMAGE_EXTENSIONS,
+        content_type_prefix="image/",
+    ),
+    "attachment": UploadPolicy(
+        prefix="oz_externship_be/community/attachments",
+        max_size_mb=10,
+        blocked_extensions=BLOCKED_ATTACHMENT_EXTENSIONS,
+    ),
+}
+POST_FILE_MAX_COUNTS = {"image": 5, "attachment": 3}
 
 
 # 첨부 파일 응답
@@ -20,4 +41,19 @@ class PostImageResponseSerializer(serializers.ModelSerializer):  # 실제 저장
 
     class Meta:
         model = PostImage
-        fields = ["id", "image_url", "image_name"]
+        fields = ["id", "image_url", "image_name", "thumbnail_url", "webp_url"]
+        read_only_fields = ["thumbnail_url", "webp_url"]
+
+
+# S3 직접 업로드(presigned) 발급 요청
+class PostFilePresignedUploadSerializer(serializers.Serializer):
+    file_type = serializers.ChoiceField(choices=list(POST_FILE_UPLOAD_POLICIES))
+    file_name = serializers.CharField(max_length=50)
+    content_type = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(min_value=1)
+
+
+# S3 직접 업로드 완료 요청
+class PostFilePresignedCompleteSerializer(serializers.Serializer):
+    file_type = serializers.ChoiceField(choices=list(POST_FILE_UPLOAD_POLICIES))
+    upload_token = serializers.CharField()
@@ -34,7 +34,10 @@ class PostListViewSerializer(serializers.ModelSerializer):
     def get_thumbnail(self, obj):
         image = obj.images.first()
         if image is not None:
-            return PostImageResponseSerializer(image).data
+            data = PostImageResponseSerializer(image).data
+            # 목록에서는 썸네일 변환본을 우선 사용 (아직 없으면 원본)
+            data["image_url"] = image.thumbnail_url or image.image_url
+            return data
         return None
 
     def get_summary(self, obj):
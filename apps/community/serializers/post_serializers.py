@@ -13,6 +13,8 @@ from apps.community.serializers.category_serializers import (
 from apps.community.serializers.comment_serializers import CommentResponseSerializer
 from apps.community.serializers.fields import FileListField
 from apps.community.serializers.post_author_serializers import AuthorSerializer
+from apps.community.tasks import generate_post_image_variants
+from core.utils.image_variants import enqueue_image_variants
 from core.utils.s3_file_upload import S3Uploader
 from core.utils.validators import (
     ALLOWED_IMAGE_EXTENSIONS,
@@ -148,6 +150,7 @@ class PostUpdateSerializer(serializers.ModelSerializer[Post]):
                     uploader.delete_file(old.image_url)
                 instance.images.all().delete()
                 PostImage.objects.bulk_create(new_images)
+                enqueue_image_variants(generate_post_image_variants, [image.id for image in new_images])
 
             validated_data.pop("attachments", [])
             validated_data.pop("images", [])
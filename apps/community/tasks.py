@@ -0,0 +1,59 @@
+import logging
+
+from celery import shared_task  # type: ignore
+
+from apps.community.models import Post
+from apps.community.utils.image_variants import post_image_variants
+from apps.community.utils.orphan_files import post_file_collector
+from apps.community.utils.post_feed import bump_feed_version
+from apps.community.utils.post_like import post_like_buffer
+from apps.community.utils.view_count import post_view_counter
+
+logger = logging.getLogger(__name__)
+
+
+# Redis 에 쌓인 게시글 조회수를 1분마다 DB에 반영
+@shared_task
+def flush_post_view_counts():
+    flushed = post_view_counter.flush()
+    logger.info(f"[Celery] 게시글 조회수 반영 완료: {flushed}건")
+
+
+# Redis 에 쌓인 게시글 좋아요 변경을 1분마다 DB에 반영 (write-behind 모드)
+@shared_task
+def flush_post_likes():
+    flushed = post_like_buffer.flush()
+    logger.info(f"[Celery] 게시글 좋아요 반영 완료: {flushed}건")
+
+
+# 어디에서도 참조하지 않는 게시글 이미지/첨부파일을 매일 S3 에서 삭제
+@shared_task
+def delete_orphaned_post_files():
+    deleted = post_file_collector.sweep()
+    logger.info(f"[Celery] 참조되지 않는 게시글 파일 삭제 완료: {deleted}건")
+
+
+# 새로 등록된 게시글 이미지의 썸네일/WebP 변환본 생성 (EXIF 제거)
+@shared_task
+def generate_post_image_variants(image_ids):
+    # post_detail -> serializers -> tasks 순환 import 방지
+    from apps.community.utils.post_detail import invalidate_post_detail
+
+    updated = post_image_variants.generate(image_ids)
+    post_ids = {image.post_id for image in updated}
+    for post_id in post_ids:
+        invalidate_post_detail(post_id)
+    if post_ids:
+        # 목록 썸네일이 변환본으로 바뀌므로 목록 캐시도 무효화
+        bump_feed_version(*Post.objects.filter(id__in=post_ids).values_list("category_id", flat=True).distinct())
+    logger.info(f"[Celery] 게시글 이미지 변환 완료: {len(updated)}건")
+
+
+# 게시글 등록 중 DB 저장에 실패해서 outbox 에 남은 업로드 파일을 10분마다 S3 에서 삭제
+@shared_task
+def cleanup_pending_post_uploads():
+    # post_publish -> tasks 순환 import 방지
+    from apps.community.utils.post_publish import cleanup_pending_uploads
+
+    deleted = cleanup_pending_uploads()
+    logger.info(f"[Celery] 게시글 미완료 업로드 파일 삭제 완료: {deleted}건")
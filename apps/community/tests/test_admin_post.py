@@ -8,6 +8,7 @@ from django.urls import reverse
 from rest_framework.test import APIClient
 
 from apps.community.models import Post, PostCategory
+from apps.community.utils.notices import NOTICE_CATEGORY_NAME, get_notice_category_id
 
 User = get_user_model()
 
@@ -47,6 +48,37 @@ class AdminPostTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(self.post.id, [p["id"] for p in response.json()["results"]])
 
+    def test_admin_post_list_pins_notices(self):
+        notice_category = PostCategory.objects.create(name=NOTICE_CATEGORY_NAME)
+        notices = [
+            Post.objects.create(
+                title=f"공지 {i}", content="본문", category=notice_category, author=self.admin, is_notice=True
+            )
+            for i in range(2)
+        ]
+        for i in range(12):
+            Post.objects.create(title=f"일반 {i}", content="본문", category=self.category, author=self.admin)
+
+        url = reverse("admin-posts-list")
+        first = self.client.get(url, {"size": 5}).json()
+        self.assertEqual(first["count"], 15)
+        self.assertEqual([p["id"] for p in first["results"][:2]], [notices[1].id, notices[0].id])
+        self.assertEqual(first["results"][2]["title"], "일반 11")
+
+        last = self.client.get(url, {"size": 5, "page": 3}).json()
+        self.assertEqual([p["title"] for p in last["results"]][-1], "기존 게시글")
+        self.assertFalse(any(p["id"] in {n.id for n in notices} for p in last["results"]))
+
+    def test_notice_category_id_is_cached(self):
+        category_id = get_notice_category_id()
+        self.assertEqual(PostCategory.objects.get(id=category_id).name, NOTICE_CATEGORY_NAME)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_notice_category_id(), category_id)
+
+        self.client.delete(reverse("admin_category_detail", kwargs={"category_id": category_id}))
+        self.assertNotEqual(get_notice_category_id(), category_id)
+
     def test_admin_post_detail(self):
         url = reverse("admin-post-detail", kwargs={"post_id": self.post.id})
         response = self.client.get(url)
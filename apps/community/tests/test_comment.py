@@ -1,9 +1,14 @@
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 
 from apps.community.models import Comment, CommentTags, Post, PostCategory
+from apps.community.utils.mentions import extract_mentions, sync_comment_tags
+from apps.users.utils.nickname_cache import get_user_ids_by_nickname
 
 User = get_user_model()
 
@@ -42,6 +47,34 @@ class UserCommentTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 3)
 
+    def test_comment_list_cursor_pages(self):
+        comments = Comment.objects.bulk_create(
+            [Comment(post=self.post, author=self.other_user, content=f"댓글{i}") for i in range(24)]
+        )
+        CommentTags.objects.bulk_create(
+            [CommentTags(comment=comment, tagged_user=self.tagged_user) for comment in comments]
+        )
+        Post.objects.filter(pk=self.post.pk).update(comment_count=25)
+
+        url = reverse("comment-list", kwargs={"post_id": self.post.id})
+        seen = []
+        while url:
+            # 게시글 댓글 수 1 + 댓글(작성자 JOIN) 1 + 태그(태그된 사용자 JOIN) 1
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data["count"], 25)
+            seen.extend(comment["id"] for comment in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len(set(seen)), 25)
+        self.assertEqual(seen[-1], self.comment.id)
+
+    def test_comment_list_missing_post(self):
+        response = self.client.get(reverse("comment-list", kwargs={"post_id": self.post.id + 1000}))
+        self.assertEqual(response.status_code, 404)
+
     def test_create_comment(self):
         url = reverse("comment-create", kwargs={"post_id": self.post.id})
         data = {"content": "새 댓글입니다"}
@@ -57,6 +90,41 @@ class UserCommentTestCase(TestCase):
         comment = Comment.objects.get(content__icontains=self.tagged_user.nickname)
         self.assertTrue(CommentTags.objects.filter(comment=comment, tagged_user=self.tagged_user).exists())
 
+    def test_create_comment_with_duplicate_and_unknown_mentions(self):
+        url = reverse("comment-create", kwargs={"post_id": self.post.id})
+        data = {"content": "@tagged1 @other1 @tagged1 @nobody 같이 봐요"}
+        response = self.client.post(url, data, format="multipart")
+        self.assertEqual(response.status_code, 201)
+
+        tagged_ids = CommentTags.objects.filter(comment_id=response.data["id"]).values_list("tagged_user_id", flat=True)
+        self.assertCountEqual(tagged_ids, [self.tagged_user.id, self.other_user.id])
+
+    def test_mentions_resolved_from_cache(self):
+        self.assertEqual(extract_mentions("@a @b @a"), ["a", "b"])
+        get_user_ids_by_nickname(["tagged1", "other1"])
+
+        with self.assertNumQueries(0):
+            user_ids = get_user_ids_by_nickname(["tagged1", "other1"])
+        self.assertEqual(user_ids, {"tagged1": self.tagged_user.id, "other1": self.other_user.id})
+
+    def test_update_comment_resyncs_tags(self):
+        CommentTags.objects.create(comment=self.comment, tagged_user=self.tagged_user)
+
+        url = reverse("comment-update", kwargs={"comment_id": self.comment.id})
+        response = self.client.patch(url, {"content": "@other1 로 변경"}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+
+        tagged_ids = CommentTags.objects.filter(comment=self.comment).values_list("tagged_user_id", flat=True)
+        self.assertEqual(list(tagged_ids), [self.other_user.id])
+
+    def test_sync_comment_tags_keeps_unchanged_tags(self):
+        tag = CommentTags.objects.create(comment=self.comment, tagged_user=self.tagged_user)
+
+        sync_comment_tags(self.comment, "@tagged1 @other1")
+
+        self.assertTrue(CommentTags.objects.filter(pk=tag.pk).exists())
+        self.assertEqual(CommentTags.objects.filter(comment=self.comment).count(), 2)
+
     def test_create_comment_empty_content_fail(self):
         url = reverse("comment-create", kwargs={"post_id": self.post.id})
         data = {"content": ""}
@@ -95,3 +163,26 @@ class UserCommentTestCase(TestCase):
         url = reverse("comment-delete", kwargs={"comment_id": comment_by_other.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, 403)
+
+    def test_comment_count_follows_create_and_delete(self):
+        create_url = reverse("comment-create", kwargs={"post_id": self.post.id})
+        self.client.post(create_url, {"content": "첫 댓글"}, format="multipart")
+        response = self.client.post(create_url, {"content": "둘째 댓글"}, format="multipart")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+
+        self.client.delete(reverse("comment-delete", kwargs={"comment_id": response.data["id"]}))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+        list_response = self.client.get(reverse("post-list"))
+        self.assertEqual(list_response.data["results"][0]["comment_count"], 1)
+
+    def test_reconcile_comment_counts_command(self):
+        Post.objects.filter(pk=self.post.pk).update(comment_count=7)
+        out = StringIO()
+        call_command("reconcile_comment_counts", stdout=out)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertIn("1건", out.getvalue())
@@ -42,6 +42,30 @@ class PostExtraTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertFalse(PostLike.objects.filter(post=self.post, user=self.user, is_liked=True).exists())
 
+    def test_like_and_unlike_are_idempotent(self):
+        like_url = reverse("post-like", kwargs={"post_id": self.post.id})
+        unlike_url = reverse("post-unlike", kwargs={"post_id": self.post.id})
+
+        self.client.post(unlike_url)  # 기록 없이 취소해도 그대로
+        self.client.post(like_url)
+        self.client.post(like_url)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+
+        self.client.post(unlike_url)
+        self.client.post(unlike_url)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 0)
+
+        self.client.post(like_url)  # 취소했던 좋아요 복원
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(PostLike.objects.filter(post=self.post).count(), 1)
+
+    def test_like_missing_post(self):
+        response = self.client.post(reverse("post-like", kwargs={"post_id": 0}))
+        self.assertEqual(response.status_code, 404)
+
     def test_post_detail_includes_attachments_and_thumbnail(self):
         PostAttachment.objects.create(post=self.post, file_url="http://test.com/file1.pdf", file_name="file1.pdf")
         PostImage.objects.create(post=self.post, image_url="http://test.com/img.jpg", image_name="img.jpg")
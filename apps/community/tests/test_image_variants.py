@@ -0,0 +1,104 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.community.models import Post, PostCategory, PostImage
+from apps.community.tasks import generate_post_image_variants
+from apps.qna.dummy.fake_s3_server import start_fake_s3_server
+from core.utils.s3_file_upload import S3Uploader
+
+User = get_user_model()
+
+
+def make_jpeg(size=(800, 400), orientation=None):
+    image = Image.new("RGB", size, "red")
+    exif = Image.Exif()
+    exif[0x010F] = "TestCamera"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+class PostImageVariantTestCase(TestCase):
+    def setUp(self):
+        self.server, self.storage = start_fake_s3_server()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        endpoint = override_settings(AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{self.server.server_address[1]}")
+        endpoint.enable()
+        self.addCleanup(endpoint.disable)
+        self.uploader = S3Uploader()
+
+        self.user = User.objects.create_user(
+            email="user1@test.com", name="정승원", nickname="seoungwon", phone_number="01011112222", password="testpass"
+        )
+        category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="제목", content="내용", category=category, author=self.user)
+
+    def _create_image(self, data, key="oz_externship_be/community/images/photo.jpg"):
+        url = self.uploader.upload_file(SimpleUploadedFile("photo.jpg", data, content_type="image/jpeg"), key)
+        return PostImage.objects.create(post=self.post, image_url=url, image_name="photo.jpg")
+
+    def _stored_image(self, url):
+        content_type, body = self.storage.objects[(self.uploader.bucket, self.uploader.get_key(url))]
+        self.assertEqual(content_type, "image/webp")
+        return Image.open(io.BytesIO(body))
+
+    def test_generates_thumbnail_and_webp_without_exif(self):
+        # orientation 6 = 90도 회전해서 보여야 하는 세로 사진
+        image = self._create_image(make_jpeg(size=(3200, 1600), orientation=6))
+
+        generate_post_image_variants([image.id])
+
+        image.refresh_from_db()
+        self.assertTrue(image.thumbnail_url.endswith("images/photo_thumb.webp"))
+        self.assertTrue(image.webp_url.endswith("images/photo_display.webp"))
+
+        thumbnail = self._stored_image(image.thumbnail_url)
+        self.assertEqual(thumbnail.size, (240, 240))
+        webp = self._stored_image(image.webp_url)
+        self.assertEqual(webp.size, (800, 1600))
+        self.assertEqual(len(webp.getexif()), 0)
+
+    def test_webp_original_is_not_overwritten(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (3200, 1600), "blue").save(buffer, format="WEBP")
+        original = buffer.getvalue()
+        image = self._create_image(original, key="oz_externship_be/community/images/photo.webp")
+
+        generate_post_image_variants([image.id])
+
+        image.refresh_from_db()
+        self.assertTrue(image.webp_url.endswith("images/photo_display.webp"))
+        self.assertNotEqual(image.webp_url, image.image_url)
+        # 원본은 그대로 남아 있음
+        _, body = self.storage.objects[(self.uploader.bucket, self.uploader.get_key(image.image_url))]
+        self.assertEqual(body, original)
+        self.assertEqual(self._stored_image(image.webp_url).size, (1600, 800))
+
+    def test_broken_image_keeps_original(self):
+        image = self._create_image(b"not an image")
+        generate_post_image_variants([image.id])
+
+        image.refresh_from_db()
+        self.assertIsNone(image.thumbnail_url)
+
+    def test_list_serves_thumbnail_with_fallback(self):
+        image = self._create_image(make_jpeg())
+        client = APIClient()
+        url = reverse("post-list")
+
+        response = client.get(url)
+        self.assertEqual(response.data["results"][0]["thumbnail"]["image_url"], image.image_url)
+
+        generate_post_image_variants([image.id])
+        image.refresh_from_db()
+        response = client.get(url)
+        self.assertEqual(response.data["results"][0]["thumbnail"]["image_url"], image.thumbnail_url)
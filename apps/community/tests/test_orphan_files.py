@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.community.models import Post, PostAttachment, PostCategory, PostImage
+from apps.community.utils.orphan_files import post_file_collector
+from apps.qna.dummy.fake_s3_server import start_fake_s3_server
+from core.utils.s3_file_upload import S3Uploader
+
+User = get_user_model()
+
+
+class PostOrphanFileTestCase(TestCase):
+    def setUp(self):
+        self.server, self.storage = start_fake_s3_server()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        endpoint = override_settings(AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{self.server.server_address[1]}")
+        endpoint.enable()
+        self.addCleanup(endpoint.disable)
+        self.uploader = S3Uploader()
+
+        user = User.objects.create_user(
+            email="user1@test.com", name="정승원", nickname="seoungwon", phone_number="01011112222", password="testpass"
+        )
+        category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="제목", content="내용", category=category, author=user)
+
+    def _upload(self, key, days_ago=0):
+        url = self.uploader.upload_file(SimpleUploadedFile("f.png", b"data", content_type="image/png"), key)
+        self.storage.modified[(self.uploader.bucket, key)] -= timedelta(days=days_ago)
+        return url
+
+    def test_sweep_deletes_only_old_unreferenced_files(self):
+        prefix = "oz_externship_be/community"
+        image_url = self._upload(f"{prefix}/images/used.png", days_ago=3)
+        attachment_url = self._upload(f"{prefix}/attachments/used.pdf", days_ago=3)
+        self._upload(f"{prefix}/images/orphan.png", days_ago=3)
+        self._upload(f"{prefix}/images/recent.png")
+        self._upload("qna/images/other.png", days_ago=3)
+        PostImage.objects.create(post=self.post, image_url=image_url, image_name="used.png")
+        PostAttachment.objects.create(post=self.post, file_url=attachment_url, file_name="used.pdf")
+
+        self.assertEqual(post_file_collector.find_orphans(self.uploader), [f"{prefix}/images/orphan.png"])
+        self.assertEqual(post_file_collector.sweep(self.uploader), 1)
+        self.assertEqual(
+            sorted(key for _, key in self.storage.objects),
+            [
+                f"{prefix}/attachments/used.pdf",
+                f"{prefix}/images/recent.png",
+                f"{prefix}/images/used.png",
+                "qna/images/other.png",
+            ],
+        )
+
+    def test_paginated_listing(self):
+        for index in range(1005):
+            self.storage.objects[(self.uploader.bucket, f"oz_externship_be/community/images/{index}.png")] = ("", b"")
+            self.storage.modified[(self.uploader.bucket, f"oz_externship_be/community/images/{index}.png")] = (
+                timezone.now() - timedelta(days=3)
+            )
+
+        self.assertEqual(post_file_collector.sweep(self.uploader), 1005)
+        self.assertEqual(self.storage.delete_requests, 2)
+        self.assertEqual(self.storage.objects, {})
@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import (
+    Comment,
+    CommentTags,
+    Post,
+    PostAttachment,
+    PostCategory,
+    PostImage,
+)
+
+User = get_user_model()
+
+
+class PostDetailQueryTestCase(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"user{i}@test.com",
+                name="작성자",
+                nickname=f"writer{i}",
+                phone_number=f"0102222000{i}",
+                password="pass",
+            )
+            for i in range(5)
+        ]
+        category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="상세", content="내용", category=category, author=self.users[0])
+
+        PostAttachment.objects.create(post=self.post, file_url="http://test.com/a.pdf", file_name="a.pdf")
+        PostImage.objects.create(post=self.post, image_url="http://test.com/i.jpg", image_name="i.jpg")
+        comments = Comment.objects.bulk_create(
+            [Comment(post=self.post, author=self.users[i % 5], content=f"댓글 {i}") for i in range(100)]
+        )
+        CommentTags.objects.bulk_create(
+            [CommentTags(comment=comment, tagged_user=self.users[(i + 1) % 5]) for i, comment in enumerate(comments)]
+        )
+        self.url = reverse("post-detail", kwargs={"post_id": self.post.id})
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.users[1])
+
+    def _get(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries.captured_queries)
+
+    def test_query_count_does_not_grow_with_comments(self):
+        response, cold_queries = self._get()
+        # 카운터 1 + 게시글 1 + 첨부 1 + 이미지 1 + 댓글 1 + 태그 1 + 좋아요 여부 1
+        self.assertLessEqual(cold_queries, 7)
+        self.assertEqual(len(response.data["comments"]), 100)
+        self.assertEqual(response.data["comments"][0]["tagged_user_nicknames"], ["writer1"])
+
+        _, warm_queries = self._get()
+        self.assertLessEqual(warm_queries, 2)
+
+    def test_new_comment_invalidates_cache(self):
+        self._get()
+        self.client.post(
+            reverse("comment-create", kwargs={"post_id": self.post.id}),
+            {"content": "@writer3 새 댓글"},
+            format="multipart",
+        )
+        response, _ = self._get()
+        self.assertEqual(len(response.data["comments"]), 101)
+        self.assertEqual(response.data["comments"][-1]["tagged_user_nicknames"], ["writer3"])
+        self.assertEqual(response.data["comment_count"], 1)  # 기존 댓글은 ORM 으로 직접 생성
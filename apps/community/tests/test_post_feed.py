@@ -0,0 +1,166 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import Post, PostCategory
+from apps.community.utils.post_feed import POST_FEED_VERSION_KEY
+
+User = get_user_model()
+
+
+class PostFeedCacheTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="feed@test.com", name="피드", nickname="feeder", phone_number="01055556666", password="pass1234"
+        )
+        self.admin = User.objects.create_user(
+            email="feedadmin@test.com",
+            name="관리자",
+            nickname="feedadmin",
+            phone_number="01055557777",
+            password="pass1234",
+            role="ADMIN",
+        )
+        self.free = PostCategory.objects.create(name="자유")
+        self.study = PostCategory.objects.create(name="스터디")
+        self.posts = [
+            Post.objects.create(title=f"자유 {i}", content="내용", author=self.user, category=self.free)
+            for i in range(12)
+        ]
+        self.study_post = Post.objects.create(
+            title="스터디 모집", content="내용", author=self.user, category=self.study
+        )
+
+        self.client = APIClient()
+        self.url = reverse("post-list")
+
+    def test_second_request_served_from_cache(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.data["count"], 13)
+        self.assertIsNotNone(second.data["next"])
+        self.assertIsNone(second.data["previous"])
+
+    def test_category_filter_and_page_links(self):
+        response = self.client.get(self.url, {"category_id": self.free.id, "page": 2})
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        cached = self.client.get(self.url, {"category_id": self.free.id, "page": 2})
+        self.assertIsNone(cached.data["next"])
+        self.assertNotIn("page=", cached.data["previous"])
+
+    def test_create_invalidates_feed(self):
+        self.client.get(self.url)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("post-create"),
+            {"title": "새 글", "content": "내용", "category_id": self.free.id, "is_visible": True},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 14)
+        self.assertEqual(response.data["results"][0]["title"], "새 글")
+
+    def test_visibility_toggle_invalidates_only_its_category(self):
+        study_version = cache.get(POST_FEED_VERSION_KEY.format(scope=self.study.id))
+        self.client.get(self.url)
+
+        self.client.force_authenticate(user=self.admin)
+        toggle_url = reverse("admin-post-toggle-visibility", kwargs={"post_id": self.posts[-1].id})
+        self.assertEqual(self.client.patch(toggle_url).status_code, 200)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(cache.get(POST_FEED_VERSION_KEY.format(scope=self.study.id)), study_version)
+
+    def test_counter_changes_refresh_lazily(self):
+        self.client.get(self.url)
+        Post.objects.filter(pk=self.posts[-1].pk).update(likes_count=5)
+
+        # 카운터 변경은 버전을 올리지 않으므로 TTL 동안은 캐시된 값이 유지됨
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["results"][0]["likes_count"], 0)
+
+    def test_search_is_not_cached(self):
+        self.client.get(self.url, {"keyword": "스터디"})
+        Post.objects.filter(pk=self.study_post.pk).update(title="스터디 마감")
+
+        response = self.client.get(self.url, {"keyword": "스터디"})
+        self.assertEqual(response.data["results"][0]["title"], "스터디 마감")
+
+    def test_notices_pinned_in_front_of_feed(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            reverse("admin-notice"),
+            {"title": "필독 공지", "content": "내용", "is_notice": True, "is_visible": True},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get(self.url)
+        self.assertNotIn("notices", response.data)
+        self.assertEqual(response.data["count"], 14)
+        self.assertEqual(response.data["results"][0]["title"], "필독 공지")
+        # 정렬 기준이 달라도 공지는 앞쪽에 고정
+        response = self.client.get(self.url, {"ordering": "old"})
+        self.assertEqual(response.data["results"][0]["title"], "필독 공지")
+        response = self.client.get(self.url, {"page": 2})
+        self.assertNotIn("필독 공지", [post["title"] for post in response.data["results"]])
+
+        # 검색 결과에는 공지도 일반 게시글처럼 포함
+        response = self.client.get(self.url, {"keyword": "필독"})
+        self.assertEqual(response.data["results"][0]["title"], "필독 공지")
+
+    def test_every_notice_is_reachable_through_pages(self):
+        notice_category = PostCategory.objects.create(name="공지사항")
+        for i in range(12):
+            Post.objects.create(
+                title=f"공지 {i}", content="내용", author=self.admin, category=notice_category, is_notice=True
+            )
+
+        titles = []
+        for page in (1, 2, 3):
+            response = self.client.get(self.url, {"page": page})
+            titles += [post["title"] for post in response.data["results"]]
+        self.assertEqual(response.data["count"], 25)
+        # 공지 12개가 최신순으로 먼저, 이어서 일반 게시글
+        self.assertEqual(titles[:12], [f"공지 {i}" for i in reversed(range(12))])
+        self.assertEqual(len(set(titles)), 25)
+
+        # 공지사항 카테고리 목록도 그대로 페이징
+        response = self.client.get(self.url, {"category_id": notice_category.id, "page": 2})
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual([post["title"] for post in response.data["results"]], ["공지 1", "공지 0"])
+
+    def test_only_notices_inside_the_page_are_loaded(self):
+        notice_category = PostCategory.objects.create(name="공지사항")
+        for i in range(12):
+            Post.objects.create(
+                title=f"공지 {i}", content="내용", author=self.admin, category=notice_category, is_notice=True
+            )
+
+        def notice_selects(page):
+            with CaptureQueriesContext(connection) as captured:
+                self.client.get(self.url, {"page": page})
+            return [
+                query["sql"]
+                for query in captured.captured_queries
+                if 'AND "posts"."is_notice")' in query["sql"] and "COUNT(" not in query["sql"]
+            ]
+
+        # 2페이지는 남은 공지 2개만 가져오고, 공지가 모두 지난 3페이지에서는 개수만 센다
+        (page2,) = notice_selects(2)
+        self.assertIn("LIMIT 2 OFFSET 10", page2)
+        self.assertEqual(notice_selects(3), [])
@@ -0,0 +1,84 @@
+import httpx
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import Post, PostAttachment, PostCategory, PostImage
+from apps.qna.dummy.fake_s3_server import start_fake_s3_server
+
+User = get_user_model()
+
+
+class PostFilePresignedUploadTestCase(TestCase):
+    def setUp(self):
+        self.server, self.storage = start_fake_s3_server()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        endpoint = override_settings(AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{self.server.server_address[1]}")
+        endpoint.enable()
+        self.addCleanup(endpoint.disable)
+
+        self.user = User.objects.create_user(
+            email="user1@test.com", name="정승원", nickname="seoungwon", phone_number="01011112222", password="testpass"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="제목", content="내용", category=self.category, author=self.user)
+
+    def _issue(self, file_type, file_name, content_type, size):
+        return self.client.post(
+            reverse("post-file-presigned"),
+            {"file_type": file_type, "file_name": file_name, "content_type": content_type, "size": size},
+            format="json",
+        )
+
+    def _complete(self, file_type, upload_token):
+        return self.client.post(
+            reverse("post-file-presigned-complete", kwargs={"post_id": self.post.id}),
+            {"file_type": file_type, "upload_token": upload_token},
+            format="json",
+        )
+
+    def test_presigned_post_upload_registers_image(self):
+        issued = self._issue("image", "photo.png", "image/png", 4).data
+
+        response = httpx.post(
+            issued["post_url"], data=issued["post_fields"], files={"file": ("photo.png", b"\x89PNG", "image/png")}
+        )
+        self.assertEqual(response.status_code, 204)
+
+        response = self._complete("image", issued["upload_token"])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["image_url"], issued["file_url"])
+        self.assertTrue(PostImage.objects.filter(post=self.post, image_name="photo.png").exists())
+
+    def test_issue_rejects_disallowed_type_and_size(self):
+        self.assertEqual(self._issue("image", "script.exe", "image/png", 10).status_code, 400)
+        self.assertEqual(self._issue("image", "photo.png", "text/html", 10).status_code, 400)
+        self.assertEqual(self._issue("attachment", "big.zip", "application/zip", 11 * 1024 * 1024).status_code, 400)
+
+    def test_complete_rejects_oversized_put_upload_and_deletes_object(self):
+        issued = self._issue("attachment", "doc.pdf", "application/pdf", 10).data
+
+        # PUT 은 크기 제한을 강제할 수 없으므로 완료 확인(HEAD) 단계에서 걸러진다
+        httpx.put(issued["put_url"], content=b"x" * (11 * 1024 * 1024), headers={"Content-Type": "application/pdf"})
+        self.assertEqual(len(self.storage.objects), 1)
+
+        response = self._complete("attachment", issued["upload_token"])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PostAttachment.objects.exists())
+        self.assertEqual(self.storage.objects, {})
+
+    def test_complete_rejects_token_of_other_user(self):
+        issued = self._issue("image", "photo.png", "image/png", 4).data
+        other = User.objects.create_user(
+            email="user2@test.com", name="다른사람", nickname="other", phone_number="01099998888", password="testpass"
+        )
+        self.client.force_authenticate(user=other)
+        self.post.author = other
+        self.post.save(update_fields=["author"])
+
+        response = self._complete("image", issued["upload_token"])
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import Post, PostCategory, PostLike
+from apps.community.utils.post_like import post_like_buffer
+
+User = get_user_model()
+
+
+class PostLikeWriteBehindTestCase(TestCase):
+    def setUp(self):
+        post_like_buffer.enabled = True
+        self.addCleanup(setattr, post_like_buffer, "enabled", False)
+
+        self.users = [
+            User.objects.create_user(
+                email=f"liker{i}@test.com",
+                name="좋아요",
+                nickname=f"liker{i}",
+                phone_number=f"0101111000{i}",
+                password="pass",
+            )
+            for i in range(3)
+        ]
+        category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="인기글", content="내용", category=category, author=self.users[0])
+        # write-behind 모드 전환 전에 DB 에 있던 좋아요
+        PostLike.objects.create(post=self.post, user=self.users[0])
+        Post.objects.filter(pk=self.post.pk).update(likes_count=1)
+
+    def _client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def _toggle(self, user, liked):
+        name = "post-like" if liked else "post-unlike"
+        return self._client(user).post(reverse(name, kwargs={"post_id": self.post.id}))
+
+    def test_likes_are_buffered_and_flushed(self):
+        self._toggle(self.users[0], True)  # 이미 DB 에 좋아요 상태
+        self._toggle(self.users[1], True)
+        self._toggle(self.users[1], True)
+        self._toggle(self.users[2], True)
+        self._toggle(self.users[0], False)
+
+        # DB 는 아직 그대로, 상세 응답은 Redis 기준
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        response = self._client(self.users[1]).get(reverse("post-detail", kwargs={"post_id": self.post.id}))
+        self.assertEqual(response.data["likes_count"], 2)
+        self.assertTrue(response.data["liked"])
+
+        self.assertEqual(post_like_buffer.flush(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 2)
+        self.assertEqual(
+            set(PostLike.objects.filter(post=self.post, is_liked=True).values_list("user_id", flat=True)),
+            {self.users[1].id, self.users[2].id},
+        )
+        self.assertEqual(post_like_buffer.flush(), 0)
+
+    def test_state_served_from_redis(self):
+        self._toggle(self.users[1], True)
+        self.assertEqual(post_like_buffer.get_state(self.post.id, self.users[1].id), (2, True))
+        self.assertEqual(post_like_buffer.get_state(self.post.id, self.users[2].id), (2, False))
+        self.assertEqual(post_like_buffer.get_state(self.post.id, None), (2, False))
@@ -0,0 +1,102 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.community.models import (
+    PendingUpload,
+    Post,
+    PostAttachment,
+    PostCategory,
+    PostImage,
+)
+from apps.community.utils.post_publish import cleanup_pending_uploads, publish_post
+from apps.qna.dummy.fake_s3_server import start_fake_s3_server
+from core.utils.s3_file_upload import S3Uploader
+
+User = get_user_model()
+
+
+class PostPublishTestCase(TestCase):
+    def _start_s3(self, **kwargs):
+        self.server, self.storage = start_fake_s3_server(**kwargs)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        endpoint = override_settings(AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{self.server.server_address[1]}")
+        endpoint.enable()
+        self.addCleanup(endpoint.disable)
+        self.uploader = S3Uploader()
+
+    def setUp(self):
+        self._start_s3()
+        self.user = User.objects.create_user(
+            email="writer@test.com", name="작성자", nickname="writer", phone_number="01033334444", password="pass1234"
+        )
+        self.category = PostCategory.objects.create(name="자유")
+
+    def _post_data(self):
+        return {"title": "제목", "content": "내용", "author": self.user, "category": self.category}
+
+    def _files(self, count, prefix="file"):
+        return [SimpleUploadedFile(f"{prefix}{i}.txt", b"data", content_type="text/plain") for i in range(count)]
+
+    def test_publish_uploads_files_and_clears_outbox(self):
+        post = publish_post(self._post_data(), self._files(2), self._files(2, "image"), uploader=self.uploader)
+
+        self.assertEqual(PostAttachment.objects.filter(post=post).count(), 2)
+        self.assertEqual(PostImage.objects.filter(post=post).count(), 2)
+        self.assertFalse(PendingUpload.objects.exists())
+        self.assertEqual(len(self.storage.objects), 4)
+
+    def test_uploads_run_concurrently(self):
+        self._start_s3(delay=0.3)
+
+        started = time.monotonic()
+        publish_post(self._post_data(), self._files(4), self._files(4, "image"), uploader=self.uploader)
+
+        # 8개를 순서대로 올리면 2.4초 이상 걸림
+        self.assertLess(time.monotonic() - started, 1.2)
+
+    def test_upload_failure_removes_uploaded_files(self):
+        self._start_s3(fail_marker="broken")
+
+        with self.assertRaises(serializers.ValidationError):
+            publish_post(self._post_data(), self._files(2) + self._files(1, "broken"), [], uploader=self.uploader)
+
+        self.assertFalse(Post.objects.exists())
+        self.assertEqual(self.storage.objects, {})
+        self.assertFalse(PendingUpload.objects.exists())
+
+    def test_db_failure_rolls_back_and_removes_files(self):
+        with mock.patch.object(PostImage.objects, "bulk_create", side_effect=RuntimeError("db down")):
+            with self.assertRaises(serializers.ValidationError):
+                publish_post(self._post_data(), self._files(1), self._files(1, "image"), uploader=self.uploader)
+
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(PostAttachment.objects.exists())
+        self.assertEqual(self.storage.objects, {})
+        self.assertFalse(PendingUpload.objects.exists())
+
+    def test_outbox_cleanup_when_immediate_delete_fails(self):
+        with (
+            mock.patch.object(PostImage.objects, "bulk_create", side_effect=RuntimeError("db down")),
+            mock.patch.object(S3Uploader, "delete_keys", return_value=False),
+        ):
+            with self.assertRaises(serializers.ValidationError):
+                publish_post(self._post_data(), self._files(1), self._files(1, "image"), uploader=self.uploader)
+
+        self.assertEqual(PendingUpload.objects.count(), 2)
+        self.assertEqual(len(self.storage.objects), 2)
+
+        # 유예 기간 안의 행은 아직 진행 중인 요청일 수 있으므로 건드리지 않음
+        self.assertEqual(cleanup_pending_uploads(self.uploader), 0)
+
+        PendingUpload.objects.update(created_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(cleanup_pending_uploads(self.uploader), 2)
+        self.assertEqual(self.storage.objects, {})
+        self.assertFalse(PendingUpload.objects.exists())
@@ -0,0 +1,208 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.community.models import Comment, Post, PostCategory, PostLike
+from core.utils.query_plan import explain, has_sort, seq_scanned_tables, used_indexes
+
+User = get_user_model()
+
+SEED_POSTS = 20000
+SEED_COMMENTS = 3000
+
+
+class CommunityQueryPlanTestCase(TestCase):
+    """실제 뷰가 실행하는 SQL 을 캡처해서 EXPLAIN 으로 인덱스 사용 여부 확인 (시드 데이터 + ANALYZE 후 플래너 선택 검증)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(42)
+        cls.users = User.objects.bulk_create(
+            [
+                User(
+                    email=f"plan{i}@test.com",
+                    name=f"유저{i}",
+                    nickname=f"plan{i}",
+                    phone_number=f"0109000{i:04d}",
+                    role="ADMIN" if i == 0 else "USER",
+                )
+                for i in range(50)
+            ]
+        )
+        cls.categories = PostCategory.objects.bulk_create([PostCategory(name=f"카테고리{i}") for i in range(10)])
+        # 마지막 카테고리는 게시글이 적은 게시판 (약 1%)
+        category_weights = [11] * 9 + [1]
+
+        now = timezone.now()
+        posts = Post.objects.bulk_create(
+            [
+                Post(
+                    title=f"게시글 {i}",
+                    content="내용",
+                    author=rng.choice(cls.users),
+                    category=rng.choices(cls.categories, weights=category_weights)[0],
+                    view_count=rng.randint(0, 10000),
+                    likes_count=rng.randint(0, 500),
+                    is_visible=rng.random() > 0.02,
+                    is_notice=i % 2000 == 0,
+                )
+                for i in range(SEED_POSTS)
+            ],
+            batch_size=2000,
+        )
+        # created_at 은 auto_now_add 라서 생성 후 분산
+        Post.objects.update(created_at=now - timedelta(days=365))
+        for post in rng.sample(posts, 500):
+            post.created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+        Post.objects.bulk_update(posts, ["created_at"], batch_size=2000)
+
+        cls.hot_post = posts[1]
+        Comment.objects.bulk_create(
+            [
+                Comment(post=cls.hot_post if i % 3 else rng.choice(posts), author=rng.choice(cls.users), content="댓글")
+                for i in range(SEED_COMMENTS)
+            ],
+            batch_size=1000,
+        )
+        PostLike.objects.bulk_create(
+            [
+                PostLike(post=post, user=user, is_liked=rng.random() > 0.3)
+                for post in posts[:2000]
+                for user in rng.sample(cls.users, 5)
+            ],
+            batch_size=2000,
+        )
+
+        # 목록 쿼리가 JOIN 하는 users/post_categories 도 통계를 갱신해야 앞선 테스트에 따라 플래너 선택이 바뀌지 않음
+        with connection.cursor() as cursor:
+            for table in ("posts", "comments", "post_likes", "users", "post_categories"):
+                cursor.execute(f"ANALYZE {table}")
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def _captured_plan(self, url, params, table):
+        """요청 중 실행된 쿼리 중 해당 테이블의 페이지(LIMIT) 쿼리 실행 계획"""
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+
+        page_queries = [
+            query["sql"]
+            for query in captured.captured_queries
+            if f'FROM "{table}"' in query["sql"] and "LIMIT" in query["sql"] and "ORDER BY" in query["sql"]
+        ]
+        self.assertTrue(page_queries, f"{table} 페이지 쿼리를 찾지 못했습니다")
+        return explain(page_queries[-1])
+
+    def assertIndexScan(self, plan, index_name, table):
+        self.assertIn(index_name, used_indexes(plan), plan)
+        self.assertFalse(has_sort(plan), plan)
+        self.assertNotIn(table, seq_scanned_tables(plan))
+
+    def test_user_feed_orderings(self):
+        url = reverse("post-list")
+        # 1페이지는 고정 공지로 채워지므로 일반 게시글 쿼리가 실행되는 2페이지를 확인
+        for ordering, index_name in [
+            ("recent", "posts_feed_created_idx"),
+            ("old", "posts_feed_created_idx"),
+            ("views", "posts_feed_views_idx"),
+            ("likes", "posts_feed_likes_idx"),
+        ]:
+            with self.subTest(ordering=ordering):
+                plan = self._captured_plan(url, {"ordering": ordering, "page": 2}, "posts")
+                self.assertIndexScan(plan, index_name, "posts")
+
+    def test_user_feed_category(self):
+        url = reverse("post-list")
+        # 게시글이 적은 카테고리는 카테고리 인덱스로 바로 찾아감
+        plan = self._captured_plan(url, {"category_id": self.categories[-1].id}, "posts")
+        self.assertIndexScan(plan, "posts_feed_category_idx", "posts")
+
+        # 큰 카테고리는 최신순 인덱스를 따라가며 필터링해도 LIMIT 안에 끝나므로 어느 쪽이든 정렬 없이 처리되면 됨
+        plan = self._captured_plan(url, {"category_id": self.categories[0].id}, "posts")
+        self.assertTrue(used_indexes(plan) & {"posts_feed_category_idx", "posts_feed_created_idx"})
+        self.assertFalse(has_sort(plan))
+        self.assertNotIn("posts", seq_scanned_tables(plan))
+
+    def test_admin_post_list(self):
+        self.client.force_authenticate(user=self.users[0])
+        url = reverse("admin-posts-list")
+        # 1페이지는 고정 공지로 채워지므로 일반 게시글 쿼리가 실행되는 3페이지를 확인
+        for params, index_name in [
+            ({}, "posts_feed_created_idx"),
+            ({"ordering": "view"}, "posts_feed_views_idx"),
+            ({"is_visible": "true", "ordering": "like"}, "posts_feed_likes_idx"),
+            ({"category_id": self.categories[-1].id}, "posts_feed_category_idx"),
+        ]:
+            with self.subTest(params=params):
+                plan = self._captured_plan(url, {**params, "page": 3}, "posts")
+                self.assertIndexScan(plan, index_name, "posts")
+
+    def test_admin_post_list_pages_are_stable_with_ties(self):
+        # 시드 게시글 대부분이 같은 created_at 이라 "-id" 보조 정렬이 없으면 OFFSET 페이지가 겹치거나 빠질 수 있음
+        self.client.force_authenticate(user=self.users[0])
+        url = reverse("admin-posts-list")
+        with CaptureQueriesContext(connection) as captured:
+            pages = [
+                [post["id"] for post in self.client.get(url, {"page": page}).data["results"]]
+                for page in (100, 101, 102)
+            ]
+        ids = [post_id for page in pages for post_id in page]
+        self.assertEqual(len(ids), 30)
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+        page_queries = [query["sql"] for query in captured.captured_queries if "LIMIT" in query["sql"]]
+        self.assertTrue(page_queries)
+        for sql in page_queries:
+            self.assertIn('"posts"."created_at" DESC, "posts"."id" DESC', sql)
+
+    def test_user_feed_pages_are_stable_with_ties(self):
+        url = reverse("post-list")
+        for ordering, order_by, reverse_ids in [
+            ("recent", '"posts"."created_at" DESC, "posts"."id" DESC', True),
+            ("old", '"posts"."created_at" ASC, "posts"."id" ASC', False),
+        ]:
+            with self.subTest(ordering=ordering), CaptureQueriesContext(connection) as captured:
+                pages = [
+                    [post["id"] for post in self.client.get(url, {"ordering": ordering, "page": page}).data["results"]]
+                    for page in (1000, 1001, 1002)
+                ]
+                ids = [post_id for page in pages for post_id in page]
+                self.assertEqual(len(ids), 30)
+                self.assertEqual(ids, sorted(ids, reverse=reverse_ids))
+
+                page_queries = [
+                    query["sql"]
+                    for query in captured.captured_queries
+                    if 'FROM "posts"' in query["sql"] and "ORDER BY" in query["sql"] and "LIMIT" in query["sql"]
+                ]
+                self.assertTrue(page_queries)
+                for sql in page_queries:
+                    self.assertIn(order_by, sql)
+
+    def test_comment_thread(self):
+        self.client.force_authenticate(user=self.users[1])
+        url = reverse("comment-list", kwargs={"post_id": self.hot_post.id})
+        plan = self._captured_plan(url, {}, "comments")
+        self.assertIndexScan(plan, "comments_post_created_idx", "comments")
+
+    def test_liked_users_lookup(self):
+        # (post, user) 조회는 unique_together 인덱스, 게시글 별 조회는 FK 인덱스로 충분 (별도 인덱스 불필요)
+        post = Post.objects.order_by("id").first()
+        user = self.users[0]
+        with CaptureQueriesContext(connection) as captured:
+            list(PostLike.objects.filter(post=post, is_liked=True).values_list("user_id", flat=True))
+            PostLike.objects.filter(post=post, user=user, is_liked=True).exists()
+
+        for query in captured.captured_queries:
+            plan = explain(query["sql"])
+            self.assertTrue(used_indexes(plan))
+            self.assertNotIn("post_likes", seq_scanned_tables(plan))
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.community.models import Post, PostCategory
+from apps.community.utils.view_count import post_view_counter
+
+User = get_user_model()
+
+
+class PostViewCountTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="viewer@test.com", name="조회유저", nickname="viewer1", phone_number="01033334444", password="pass"
+        )
+        self.client = APIClient()
+        self.category = PostCategory.objects.create(name="자유 게시판")
+        self.post = Post.objects.create(title="조회수 테스트", content="내용", category=self.category, author=self.user)
+        self.url = reverse("post-detail", kwargs={"post_id": self.post.id})
+
+    def test_detail_view_buffers_count_without_db_write(self):
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["view_count"], 1)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 0)
+
+    def test_same_viewer_counted_once(self):
+        self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.data["view_count"], 1)
+
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.data["view_count"], 2)
+
+    def test_rotating_forwarded_for_does_not_inflate_count(self):
+        for i in range(3):
+            response = self.client.get(self.url, REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR=f"1.1.1.{i}")
+        self.assertEqual(response.data["view_count"], 1)
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_behind_proxy_uses_proxy_appended_hop(self):
+        for i in range(3):
+            response = self.client.get(
+                self.url, REMOTE_ADDR="172.16.0.1", HTTP_X_FORWARDED_FOR=f"1.1.1.{i}, 203.0.113.7"
+            )
+        self.assertEqual(response.data["view_count"], 1)
+
+        response = self.client.get(self.url, REMOTE_ADDR="172.16.0.1", HTTP_X_FORWARDED_FOR="203.0.113.8")
+        self.assertEqual(response.data["view_count"], 2)
+
+    def test_flush_applies_buffered_counts(self):
+        other_post = Post.objects.create(title="다른 글", content="내용", category=self.category, author=self.user)
+        post_view_counter.incr(self.post.id)
+        post_view_counter.incr(self.post.id)
+        post_view_counter.incr(other_post.id)
+
+        self.assertEqual(post_view_counter.flush(), 2)
+
+        self.post.refresh_from_db()
+        other_post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 2)
+        self.assertEqual(other_post.view_count, 1)
+        self.assertEqual(post_view_counter.get_pending(self.post.id), 0)
@@ -26,6 +26,10 @@ from apps.community.views.user.comment_views import (
 from apps.community.views.user.post_create_views import PostCreateAPIView
 from apps.community.views.user.post_delete import PostDeleteAPIView
 from apps.community.views.user.post_detail_views import UserPostDetailAPIView
+from apps.community.views.user.post_file_views import (
+    PostFilePresignedCompleteAPIView,
+    PostFilePresignedUploadAPIView,
+)
 from apps.community.views.user.post_like_views import (
     PostLikeFalseAPIView,
     PostLikeTrueAPIView,
@@ -73,6 +77,12 @@ urlpatterns = [
     path("comments/<int:comment_id>/delete/", CommentDeleteAPIView.as_view(), name="comment-delete"),
     path("posts/<int:post_id>/comments/", CommentListAPIView.as_view(), name="comment-list"),
     path("posts/create/", PostCreateAPIView.as_view(), name="post-create"),
+    path("posts/files/presigned/", PostFilePresignedUploadAPIView.as_view(), name="post-file-presigned"),
+    path(
+        "posts/<int:post_id>/files/presigned/complete/",
+        PostFilePresignedCompleteAPIView.as_view(),
+        name="post-file-presigned-complete",
+    ),
     path("posts/<int:post_id>/like/", PostLikeTrueAPIView.as_view(), name="post-like"),
     path("posts/<int:post_id>/unlike/", PostLikeFalseAPIView.as_view(), name="post-unlike"),
     path("posts/list", PostListAPIView.as_view(), name="post-list"),
@@ -0,0 +1,31 @@
+from typing import Iterable, Optional
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.community.models import Comment, Post
+
+
+def change_comment_count(post_id: int, delta: int) -> None:
+    """댓글 작성/삭제와 같은 트랜잭션에서 Post.comment_count 를 DB 에서 증감 (0 미만으로는 내려가지 않음)"""
+    posts = Post.objects.filter(pk=post_id)
+    if delta < 0:
+        posts = posts.filter(comment_count__gte=-delta)
+    posts.update(comment_count=F("comment_count") + delta)
+
+
+def reconcile_comment_counts(post_ids: Optional[Iterable[int]] = None) -> int:
+    """실제 댓글 수와 다른 게시글의 comment_count 를 UPDATE 한 번으로 보정하고 보정된 게시글 수 반환"""
+    actual = Coalesce(
+        Subquery(
+            Comment.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(count=Count("*"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+    posts = Post.objects.all() if post_ids is None else Post.objects.filter(pk__in=post_ids)
+    return posts.alias(actual_count=actual).filter(~Q(comment_count=F("actual_count"))).update(comment_count=actual)
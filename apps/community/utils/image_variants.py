@@ -0,0 +1,5 @@
+from apps.community.models import PostImage
+from core.utils.image_variants import ImageVariantGenerator
+
+# 게시글 목록 썸네일/본문용 WebP 변환본
+post_image_variants = ImageVariantGenerator(PostImage, "image_url")
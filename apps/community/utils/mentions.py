@@ -0,0 +1,40 @@
+import re
+from typing import List, Set
+
+from apps.community.models import Comment, CommentTags
+from apps.users.utils.nickname_cache import get_user_ids_by_nickname
+
+MENTION_PATTERN = re.compile(r"@(\w+)")
+
+
+def extract_mentions(content: str) -> List[str]:
+    """댓글 내용의 @닉네임 목록 (중복 제거, 등장 순서 유지)"""
+    return list(dict.fromkeys(MENTION_PATTERN.findall(content or "")))
+
+
+def resolve_mentions(content: str) -> List[int]:
+    """댓글 내용에서 태그된 사용자 ID 목록. 존재하지 않는 닉네임은 무시"""
+    nicknames = extract_mentions(content)
+    user_ids = get_user_ids_by_nickname(nicknames)
+    return [user_ids[nickname] for nickname in nicknames if nickname in user_ids]
+
+
+def create_comment_tags(comment: Comment, content: str) -> None:
+    """새 댓글의 태그를 한 번의 INSERT 로 생성"""
+    user_ids = resolve_mentions(content)
+    if user_ids:
+        CommentTags.objects.bulk_create([CommentTags(comment=comment, tagged_user_id=user_id) for user_id in user_ids])
+
+
+def sync_comment_tags(comment: Comment, content: str) -> None:
+    """댓글 내용 기준으로 태그를 맞춤. 새로 언급된 사용자는 bulk_create, 언급이 빠진 사용자는 한 번에 삭제"""
+    user_ids = resolve_mentions(content)
+    existing: Set[int] = set(CommentTags.objects.filter(comment=comment).values_list("tagged_user_id", flat=True))
+
+    removed = existing - set(user_ids)
+    if removed:
+        CommentTags.objects.filter(comment=comment, tagged_user_id__in=removed).delete()
+
+    added = [user_id for user_id in user_ids if user_id not in existing]
+    if added:
+        CommentTags.objects.bulk_create([CommentTags(comment=comment, tagged_user_id=user_id) for user_id in added])
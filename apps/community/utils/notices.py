@@ -0,0 +1,64 @@
+from typing import List, Optional
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+from apps.community.models import Post, PostCategory
+
+NOTICE_CATEGORY_NAME = "공지사항"
+# 카테고리 삭제/이름 변경 시에만 삭제
+NOTICE_CATEGORY_ID_KEY = "notice_category_id"
+
+
+def get_notice_category_id() -> int:
+    """공지사항 카테고리 ID. 최초 1회만 조회(없으면 생성)하고 이후에는 캐시 사용"""
+    category_id: Optional[int] = cache.get(NOTICE_CATEGORY_ID_KEY)
+    if category_id is None:
+        category, _ = PostCategory.objects.get_or_create(name=NOTICE_CATEGORY_NAME)
+        category_id = category.id
+        cache.set(NOTICE_CATEGORY_ID_KEY, category_id, timeout=None)
+    return category_id
+
+
+def invalidate_notice_category() -> None:
+    """카테고리가 삭제되거나 이름이 바뀌면 다음 공지 등록 시 다시 조회"""
+    cache.delete(NOTICE_CATEGORY_ID_KEY)
+
+
+class PinnedNoticeList:
+    """공지 목록 뒤에 일반 게시글 쿼리셋을 이어 붙인 페이지네이션용 목록
+
+    ("-is_notice", 정렬) 로 전체 게시글을 정렬하는 대신, 공지(부분 인덱스)와 일반 게시글을 따로 조회해서
+    요청한 페이지 범위만 잘라 붙인다. Django Paginator 는 count() 와 슬라이싱만 사용한다.
+    """
+
+    ordered = True
+
+    def __init__(self, notices: QuerySet[Post], posts: QuerySet[Post]) -> None:
+        self.notices = notices
+        self.posts = posts
+        self._notice_count: Optional[int] = None
+
+    @property
+    def notice_count(self) -> int:
+        # 공지 행은 요청한 페이지에 걸치는 만큼만 가져오고, 전체는 개수만 센다
+        if self._notice_count is None:
+            self._notice_count = self.notices.count()
+        return self._notice_count
+
+    def count(self) -> int:
+        return self.notice_count + self.posts.count()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index: slice) -> List[Post]:
+        start, stop = index.start or 0, index.stop
+        notice_count = self.notice_count
+        notice_stop = notice_count if stop is None else min(stop, notice_count)
+        pinned = list(self.notices[start:notice_stop]) if start < notice_stop else []
+        rest_start = max(start - notice_count, 0)
+        rest_stop = None if stop is None else stop - notice_count
+        if rest_stop is not None and rest_stop <= 0:
+            return pinned
+        return pinned + list(self.posts[rest_start:rest_stop])
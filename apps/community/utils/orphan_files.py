@@ -0,0 +1,13 @@
+from apps.community.models import PostAttachment, PostImage
+from core.utils.s3_gc import S3OrphanCollector
+
+# 게시글 삭제/수정 후 남은 커뮤니티 이미지/첨부파일
+post_file_collector = S3OrphanCollector(
+    prefixes=["oz_externship_be/community/"],
+    sources=[
+        (PostImage, "image_url"),
+        (PostImage, "thumbnail_url"),
+        (PostImage, "webp_url"),
+        (PostAttachment, "file_url"),
+    ],
+)
@@ -0,0 +1,59 @@
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+from django.db.models import Prefetch, QuerySet
+
+from apps.community.models import Comment, CommentTags, Post
+from apps.community.serializers.post_serializers import PostDetailSerializer
+
+POST_DETAIL_CACHE_KEY = "post_detail:{post_id}"
+POST_DETAIL_CACHE_TIMEOUT = 60 * 5
+
+
+def get_post_detail_queryset() -> QuerySet[Post]:
+    """게시글 상세에 필요한 연관 데이터를 한 번에 가져오는 쿼리셋 (게시글 1 + 첨부 1 + 이미지 1 + 댓글 1 + 태그 1)"""
+    tags = CommentTags.objects.select_related("tagged_user").order_by("id")
+    comments = (
+        Comment.objects.select_related("author")
+        .prefetch_related(Prefetch("tags", queryset=tags))
+        .order_by("created_at", "id")
+    )
+    return Post.objects.select_related("category", "author").prefetch_related(
+        "attachments",
+        "images",
+        Prefetch("comments", queryset=comments),
+    )
+
+
+def serialize_post_detail(post: Post) -> Dict[str, Any]:
+    data = dict(PostDetailSerializer(post).data)
+    data.pop("is_visible", None)
+    data.pop("is_notice", None)
+
+    # 댓글별 태그 닉네임은 prefetch 된 태그에서 바로 계산
+    for comment, comment_dict in zip(post.comments.all(), data.get("comments", [])):
+        comment_dict["tagged_user_nicknames"] = [
+            tag.tagged_user.nickname for tag in comment.tags.all() if tag.tagged_user
+        ]
+    return data
+
+
+def get_post_detail_data(post_id: int) -> Optional[Dict[str, Any]]:
+    """직렬화된 게시글 상세 데이터를 캐시에서 조회하고, 없으면 DB에서 만들어 캐싱. 게시글이 없으면 None"""
+    cache_key = POST_DETAIL_CACHE_KEY.format(post_id=post_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    post = get_post_detail_queryset().filter(pk=post_id).first()
+    if post is None:
+        return None
+
+    data = serialize_post_detail(post)
+    cache.set(cache_key, data, timeout=POST_DETAIL_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_post_detail(post_id: int) -> None:
+    """게시글/첨부/이미지/댓글이 변경되면 해당 게시글의 상세 캐시 삭제"""
+    cache.delete(POST_DETAIL_CACHE_KEY.format(post_id=post_id))
@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+
+# 카테고리 별 버전 키: 게시글 생성/수정/삭제/노출 변경 시 올려서 해당 카테고리 + 전체 목록 캐시를 무효화
+POST_FEED_VERSION_KEY = "post_feed_version:{scope}"
+POST_FEED_CACHE_KEY = "post_feed:{scope}:v{version}:{ordering}:{page}:{size}"
+# 좋아요/조회수/댓글 수 같은 카운터 변경은 무효화하지 않고 짧은 TTL 로 갱신
+POST_FEED_CACHE_TIMEOUT = 30
+# 대부분의 방문자가 보는 앞쪽 페이지만 캐싱
+POST_FEED_CACHE_MAX_PAGE = 5
+
+ALL_CATEGORIES = "all"
+
+
+def _scope(category_id: Optional[int]) -> str:
+    return ALL_CATEGORIES if category_id is None else str(category_id)
+
+
+def get_feed_version(category_id: Optional[int] = None) -> int:
+    return cache.get(POST_FEED_VERSION_KEY.format(scope=_scope(category_id)), 0)
+
+
+def post_feed_cache_key(category_id: Optional[int], ordering: str, page: int, size: int) -> str:
+    version = get_feed_version(category_id)
+    return POST_FEED_CACHE_KEY.format(
+        scope=_scope(category_id), version=version, ordering=ordering, page=page, size=size
+    )
+
+
+def get_cached_feed(cache_key: str) -> Optional[Dict[str, Any]]:
+    """캐시된 목록 페이지 ({"count": 전체 게시글 수, "results": 직렬화된 게시글 목록})"""
+    return cache.get(cache_key)
+
+
+def set_cached_feed(cache_key: str, count: int, results: Any) -> None:
+    cache.set(cache_key, {"count": count, "results": results}, timeout=POST_FEED_CACHE_TIMEOUT)
+
+
+def bump_feed_version(*category_ids: Optional[int]) -> None:
+    """게시글 목록에 영향을 주는 변경 후 호출. 전체 목록과 전달된 카테고리 목록의 캐시를 무효화"""
+    scopes = {ALL_CATEGORIES} | {_scope(category_id) for category_id in category_ids if category_id is not None}
+    for scope in scopes:
+        key = POST_FEED_VERSION_KEY.format(scope=scope)
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
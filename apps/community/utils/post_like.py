@@ -0,0 +1,213 @@
+import logging
+import os
+from typing import Any, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django_redis import get_redis_connection  # type: ignore
+
+from apps.community.models import Post, PostLike
+from core.utils.view_counter import FLUSH_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 좋아요 기록이 없으면 생성, 취소 상태였으면 복원. 실제로 상태가 바뀐 경우에만 행을 반환
+_LIKE_UPSERT_SQL = f"""
+    INSERT INTO {PostLike._meta.db_table} (post_id, user_id, is_liked, created_at, updated_at)
+    VALUES (%s, %s, TRUE, %s, %s)
+    ON CONFLICT (post_id, user_id)
+    DO UPDATE SET is_liked = TRUE, updated_at = EXCLUDED.updated_at
+    WHERE {PostLike._meta.db_table}.is_liked = FALSE
+    RETURNING id
+"""
+
+
+def _change_likes_count(post_id: int, delta: int) -> None:
+    # 읽고 더해서 저장하지 않고 DB 에서 증감 (동시 요청에도 누락 없음, likes_count 컬럼만 갱신)
+    posts = Post.objects.filter(pk=post_id)
+    if delta < 0:
+        posts = posts.filter(likes_count__gte=-delta)
+    posts.update(likes_count=F("likes_count") + delta)
+
+
+def like_post(post_id: int, user_id: int) -> bool:
+    """좋아요 추가. 이미 좋아요 상태였으면 아무것도 바꾸지 않고 False"""
+    now = timezone.now()
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(_LIKE_UPSERT_SQL, [post_id, user_id, now, now])
+            changed = cursor.fetchone() is not None
+        if changed:
+            _change_likes_count(post_id, 1)
+    return changed
+
+
+def unlike_post(post_id: int, user_id: int) -> bool:
+    """좋아요 취소. 좋아요 기록이 없거나 이미 취소 상태였으면 False"""
+    with transaction.atomic():
+        changed = bool(
+            PostLike.objects.filter(post_id=post_id, user_id=user_id, is_liked=True).update(
+                is_liked=False, updated_at=timezone.now()
+            )
+        )
+        if changed:
+            _change_likes_count(post_id, -1)
+    return changed
+
+
+# 인기 게시글 좋아요 write-behind 모드 (게시글 행 잠금 대신 Redis 에서 처리 후 주기적으로 DB 반영)
+POST_LIKE_WRITE_BEHIND = os.getenv("POST_LIKE_WRITE_BEHIND", "False") == "True"
+POST_LIKE_CACHE_TTL = 60 * 60 * 24
+
+# 게시글의 좋아요 사용자 Set 과 좋아요 수를 DB 에서 한 번만 적재 (이미 적재되어 있으면 무시)
+_WARM_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+for i = 2, #ARGV do
+    redis.call('SADD', KEYS[1], ARGV[i])
+end
+redis.call('SET', KEYS[2], #ARGV - 1)
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+
+# SADD/SREM 결과로 실제 상태가 바뀐 경우에만 좋아요 수 증감 + DB 반영 대기열에 기록
+_TOGGLE_SCRIPT = """
+local changed
+if ARGV[2] == '1' then
+    changed = redis.call('SADD', KEYS[1], ARGV[1])
+else
+    changed = redis.call('SREM', KEYS[1], ARGV[1])
+end
+if changed == 1 then
+    redis.call('INCRBY', KEYS[2], ARGV[2] == '1' and 1 or -1)
+    redis.call('HSET', KEYS[3], ARGV[3], ARGV[2])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return changed
+"""
+
+
+class PostLikeBuffer:
+    """게시글 좋아요 write-behind 버퍼. 상태는 Redis Set/카운터로 처리하고 flush() 에서 PostLike/likes_count 일괄 반영"""
+
+    pending_key = "post_like:pending"
+    flushing_key = "post_like:flushing"
+    lock_key = "post_like:lock"
+
+    def __init__(self, enabled: bool = POST_LIKE_WRITE_BEHIND) -> None:
+        self.enabled = enabled
+
+    @staticmethod
+    def _users_key(post_id: int) -> str:
+        return f"post_like:{post_id}:users"
+
+    @staticmethod
+    def _count_key(post_id: int) -> str:
+        return f"post_like:{post_id}:count"
+
+    def _warm(self, redis: Any, post_id: int) -> None:
+        if redis.exists(self._count_key(post_id)):
+            return
+        user_ids = PostLike.objects.filter(post_id=post_id, is_liked=True).values_list("user_id", flat=True)
+        redis.eval(_WARM_SCRIPT, 2, self._users_key(post_id), self._count_key(post_id), POST_LIKE_CACHE_TTL, *user_ids)
+
+    def set_liked(self, post_id: int, user_id: int, liked: bool) -> bool:
+        """좋아요 상태 변경. 실제로 바뀐 경우 True (Redis 장애 시에는 DB 에 바로 반영)"""
+        try:
+            redis = get_redis_connection("default")
+            self._warm(redis, post_id)
+            changed = redis.eval(
+                _TOGGLE_SCRIPT,
+                3,
+                self._users_key(post_id),
+                self._count_key(post_id),
+                self.pending_key,
+                user_id,
+                "1" if liked else "0",
+                f"{post_id}:{user_id}",
+                POST_LIKE_CACHE_TTL,
+            )
+            return bool(changed)
+        except Exception as e:
+            logger.warning(f"[PostLike] Redis 좋아요 처리 실패, DB 로 처리: {post_id}/{user_id}/사유: {e}")
+            return like_post(post_id, user_id) if liked else unlike_post(post_id, user_id)
+
+    def get_state(self, post_id: int, user_id: Optional[int]) -> Optional[Tuple[int, bool]]:
+        """(좋아요 수, 사용자의 좋아요 여부). Redis 를 사용할 수 없으면 None"""
+        try:
+            redis = get_redis_connection("default")
+            self._warm(redis, post_id)
+            pipe = redis.pipeline(transaction=False)
+            pipe.get(self._count_key(post_id))
+            pipe.sismember(self._users_key(post_id), user_id or 0)
+            count, is_liked = pipe.execute()
+            return max(int(count or 0), 0), bool(is_liked)
+        except Exception as e:
+            logger.warning(f"[PostLike] Redis 좋아요 조회 실패: {post_id}/사유: {e}")
+            return None
+
+    def flush(self) -> int:
+        """쌓인 좋아요 변경을 PostLike 에 일괄 upsert 하고 해당 게시글의 likes_count 를 다시 집계. 반영된 변경 수 반환"""
+        redis = get_redis_connection("default")
+
+        lock = redis.lock(self.lock_key, timeout=60 * 5)
+        if not lock.acquire(blocking=False):
+            return 0
+
+        try:
+            # 이전 flush 가 실패해 남아있는 변경이 있으면 그것부터 처리
+            if not redis.exists(self.flushing_key):
+                if not redis.exists(self.pending_key):
+                    return 0
+                redis.rename(self.pending_key, self.flushing_key)
+
+            now = timezone.now()
+            likes = []
+            for field, liked in redis.hgetall(self.flushing_key).items():
+                post_id, user_id = (int(value) for value in field.decode().split(":"))
+                likes.append(
+                    PostLike(post_id=post_id, user_id=user_id, is_liked=liked == b"1", created_at=now, updated_at=now)
+                )
+            post_ids = {like.post_id for like in likes}
+
+            with transaction.atomic():
+                # 게시글/사용자가 그 사이 삭제된 경우는 제외
+                existing_posts = set(Post.objects.filter(pk__in=post_ids).values_list("pk", flat=True))
+                existing_users = set(
+                    get_user_model()
+                    .objects.filter(pk__in={like.user_id for like in likes})
+                    .values_list("pk", flat=True)
+                )
+                likes = [like for like in likes if like.post_id in existing_posts and like.user_id in existing_users]
+                PostLike.objects.bulk_create(
+                    likes,
+                    batch_size=FLUSH_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=["post", "user"],
+                    update_fields=["is_liked", "updated_at"],
+                )
+                liked_count = (
+                    PostLike.objects.filter(post=OuterRef("pk"), is_liked=True)
+                    .order_by()
+                    .values("post")
+                    .annotate(count=Count("*"))
+                    .values("count")
+                )
+                Post.objects.filter(pk__in=existing_posts).update(
+                    likes_count=Coalesce(Subquery(liked_count, output_field=IntegerField()), 0)
+                )
+
+            redis.delete(self.flushing_key)
+            return len(likes)
+        finally:
+            lock.release()
+
+
+post_like_buffer = PostLikeBuffer()
@@ -0,0 +1,100 @@
+import logging
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, cast
+
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.community.models import PendingUpload, Post, PostAttachment, PostImage
+from apps.community.tasks import generate_post_image_variants
+from core.utils.image_variants import enqueue_image_variants
+from core.utils.s3_file_upload import S3Uploader
+
+logger = logging.getLogger(__name__)
+
+POST_ATTACHMENT_PREFIX = "oz_externship_be/community/attachments"
+POST_IMAGE_PREFIX = "oz_externship_be/community/images"
+# 요청이 아직 진행 중일 수 있는 outbox 행은 정리하지 않음 (업로드 제한 시간보다 충분히 길게)
+PENDING_UPLOAD_GRACE_PERIOD = timedelta(minutes=10)
+
+
+def _s3_key(prefix: str, file: UploadedFile) -> str:
+    return f"{prefix}/{uuid.uuid4().hex[:6]}_{file.name}"
+
+
+def _discard_uploads(uploader: S3Uploader, keys: List[str], outbox_ids: List[int]) -> None:
+    """업로드한 파일을 바로 삭제. 삭제에 실패하면 outbox 에 남겨 백그라운드 작업이 정리"""
+    if uploader.delete_keys(keys):
+        PendingUpload.objects.filter(id__in=outbox_ids).delete()
+
+
+def publish_post(
+    post_data: Dict[str, Any],
+    attachments: List[UploadedFile],
+    images: List[UploadedFile],
+    uploader: Optional[S3Uploader] = None,
+) -> Post:
+    """첨부파일/이미지를 동시에 업로드한 뒤 게시글과 파일 정보를 한 트랜잭션으로 저장 (게시글/공지 등록 공용)
+
+    1. 업로드할 S3 키를 outbox(PendingUpload) 에 먼저 기록
+    2. 모든 파일을 동시에 업로드 (전체 소요 시간 ~ 가장 느린 파일 하나)
+    3. 게시글 + 첨부파일 + 이미지 저장과 outbox 삭제를 transaction.atomic 으로 묶음
+    실패 시 업로드한 파일을 삭제하고, 그마저 실패하거나 프로세스가 죽으면 outbox 에 남은 키를 Celery 가 정리한다.
+    """
+    uploader = uploader or S3Uploader()
+    files = [(file, _s3_key(POST_ATTACHMENT_PREFIX, file)) for file in attachments]
+    files += [(image, _s3_key(POST_IMAGE_PREFIX, image)) for image in images]
+    keys = [s3_key for _, s3_key in files]
+
+    outbox = PendingUpload.objects.bulk_create([PendingUpload(s3_key=s3_key) for s3_key in keys])
+    outbox_ids = [row.id for row in outbox]
+
+    try:
+        urls = uploader.upload_files(files)
+        failed = [str(file.name) for (file, _), url in zip(files, urls) if not url]
+        if failed:
+            raise ValueError(f"[업로드 실패] {', '.join(failed)}")
+
+        uploaded = cast(List[str], urls)
+        attachment_urls, image_urls = uploaded[: len(attachments)], uploaded[len(attachments) :]
+        with transaction.atomic():
+            post = Post.objects.create(**post_data)
+            PostAttachment.objects.bulk_create(
+                [
+                    PostAttachment(post=post, file_url=url, file_name=str(file.name))
+                    for file, url in zip(attachments, attachment_urls)
+                ]
+            )
+            post_images = PostImage.objects.bulk_create(
+                [
+                    PostImage(post=post, image_url=url, image_name=str(image.name))
+                    for image, url in zip(images, image_urls)
+                ]
+            )
+            PendingUpload.objects.filter(id__in=outbox_ids).delete()
+            enqueue_image_variants(generate_post_image_variants, [image.id for image in post_images])
+
+    except Exception as e:
+        _discard_uploads(uploader, keys, outbox_ids)
+        raise serializers.ValidationError({"non_field_errors": [f"파일 업로드 중 오류가 발생했습니다: {e}"]})
+
+    return post
+
+
+def cleanup_pending_uploads(uploader: Optional[S3Uploader] = None) -> int:
+    """유예 기간이 지난 outbox 행의 S3 파일 삭제. 정리한 파일 수 반환"""
+    cutoff = timezone.now() - PENDING_UPLOAD_GRACE_PERIOD
+    rows = list(PendingUpload.objects.filter(created_at__lt=cutoff).values_list("id", "s3_key"))
+    if not rows:
+        return 0
+
+    uploader = uploader or S3Uploader()
+    if not uploader.delete_keys([s3_key for _, s3_key in rows]):
+        logger.warning("pending upload cleanup failed: %d keys", len(rows))
+        return 0
+
+    PendingUpload.objects.filter(id__in=[row_id for row_id, _ in rows]).delete()
+    return len(rows)
@@ -0,0 +1,5 @@
+from apps.community.models import Post
+from core.utils.view_counter import ViewCountBuffer
+
+# 게시글 상세 조회수 버퍼
+post_view_counter = ViewCountBuffer(Post, "post")
@@ -17,6 +17,8 @@ from apps.community.serializers.category_serializers import (
     CategoryRenameResponseSerializer,
     CategoryStatusUpdateResponseSerializer,
 )
+from apps.community.utils.notices import invalidate_notice_category
+from apps.community.utils.post_feed import bump_feed_version
 from apps.tests.permissions import IsAdminOrStaff
 from apps.users.models.user import User
 
@@ -47,6 +49,8 @@ class AdminCommunityCategoryDetailAPIView(APIView):
     def delete(self, request: Request, category_id: int) -> Response:
         category = get_object_or_404(PostCategory, id=category_id)
         category.delete()
+        invalidate_notice_category()
+        bump_feed_version(category_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -89,6 +93,8 @@ class CategoryStatusOnAPIView(APIView):
 
         category.status = True
         category.save()
+        # 게시글 목록에 카테고리 정보가 포함되므로 해당 카테고리 목록 캐시 무효화
+        bump_feed_version(category.id)
 
         response = CategoryStatusUpdateResponseSerializer(instance=category)
         return Response(response.data, status=status.HTTP_200_OK)
@@ -113,6 +119,7 @@ class CategoryStatusOffAPIView(APIView):
 
         category.status = False
         category.save()
+        bump_feed_version(category.id)
 
         response = CategoryStatusUpdateResponseSerializer(instance=category)
         return Response(response.data, status=status.HTTP_200_OK)
@@ -156,6 +163,8 @@ class AdminCategoryRenameAPIView(APIView):
 
         category.name = serializer.validated_data["name"]
         category.save()
+        invalidate_notice_category()
+        bump_feed_version(category.id)
 
         response = CategoryRenameResponseSerializer(category)
         return Response(response.data, status=200)
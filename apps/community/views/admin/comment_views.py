@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import status
@@ -6,6 +7,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.community.models import Comment
+from apps.community.utils.comment_count import change_comment_count
+from apps.community.utils.post_detail import invalidate_post_detail
 from apps.tests.permissions import IsAdminOrStaff
 
 
@@ -24,5 +27,8 @@ class AdminCommentDeleteAPIView(APIView):
     )
     def delete(self, request: Request, comment_id: int) -> Response:
         comment = get_object_or_404(Comment, id=comment_id)
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
+            change_comment_count(comment.post_id, -1)
+        invalidate_post_detail(comment.post_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
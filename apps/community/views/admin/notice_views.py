@@ -10,6 +10,7 @@ from apps.community.serializers.notice_serializers import (
     NoticeCreateSerializer,
     NoticeResponseSerializer,
 )
+from apps.community.utils.post_feed import bump_feed_version
 from apps.tests.permissions import IsAdminOrStaff
 
 
@@ -31,6 +32,7 @@ class NoticeCreateAPIView(APIView):
 
         if serializer.is_valid():
             post = serializer.save()
+            bump_feed_version(post.category_id)
 
             post = Post.objects.prefetch_related("attachments", "images").get(id=post.id)
             return Response(NoticeResponseSerializer(post).data, status=status.HTTP_201_CREATED)
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
@@ -16,6 +18,9 @@ from apps.community.serializers.post_serializers import (
     PostListSerializer,
     PostUpdateSerializer,
 )
+from apps.community.utils.notices import PinnedNoticeList
+from apps.community.utils.post_detail import invalidate_post_detail
+from apps.community.utils.post_feed import bump_feed_version
 from apps.tests.permissions import IsAdminOrStaff
 from core.utils.s3_file_upload import S3Uploader
 
@@ -96,17 +101,18 @@ class AdminPostListView(APIView):
             "like": "-likes_count",
         }
 
-        # 정렬
-        ordering = ordering_map.get(ordering_param)
-        if ordering:
-            queryset = queryset.order_by("-is_notice", ordering)
-        else:
-            queryset = queryset.order_by("-is_notice", "-created_at")
+        # 정렬: 공지를 먼저 보여주되 전체 게시글을 is_notice 로 정렬하지 않고 공지/일반 게시글을 따로 조회
+        # (정렬 값이 같은 게시글이 페이지마다 뒤섞이지 않도록 "-id" 보조 정렬 유지)
+        ordering = ordering_map.get(ordering_param) or "-created_at"
+        pinned = PinnedNoticeList(
+            notices=queryset.filter(is_notice=True).order_by(ordering, "-id"),
+            posts=queryset.filter(is_notice=False).order_by(ordering, "-id"),
+        )
 
         # 페이지네이션
         paginator = PageNumberPagination()
         paginator.page_size_query_param = "size"
-        result_page = paginator.paginate_queryset(queryset, request)
+        result_page: Optional[List[Post]] = paginator.paginate_queryset(pinned, request)  # type: ignore[arg-type]
 
         return paginator.get_paginated_response(PostListSerializer(result_page, many=True).data)
 
@@ -151,11 +157,14 @@ class AdminPostUpdateView(APIView):
     )
     def patch(self, request: Request, post_id: int) -> Response:
         post = get_object_or_404(Post, id=post_id)
+        old_category_id = post.category_id
 
         serializer = PostUpdateSerializer(post, data=request.data, context={"request": request}, partial=True)
 
         if serializer.is_valid():
             updated_post = serializer.save()
+            invalidate_post_detail(updated_post.id)
+            bump_feed_version(old_category_id, updated_post.category_id)
             updated_post = Post.objects.prefetch_related("attachments", "images").get(id=updated_post.id)
             return Response(PostDetailSerializer(updated_post).data, status=status.HTTP_200_OK)
 
@@ -186,6 +195,8 @@ class AdminPostDeleteView(APIView):
         post.images.all().delete()
 
         post.delete()
+        invalidate_post_detail(post_id)
+        bump_feed_version(post.category_id)
         return Response({"id": post_id, "message": "게시글이 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
 
 
@@ -210,6 +221,7 @@ class AdminPostVisibilityToggleView(APIView):
                 post = Post.objects.select_for_update().get(id=post_id)
                 post.is_visible = not post.is_visible
                 post.save()
+            bump_feed_version(post.category_id)
 
             return Response(
                 {
@@ -1,9 +1,8 @@
-import re
-
-from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Prefetch
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -16,8 +15,15 @@ from apps.community.serializers.comment_serializers import (
     CommentResponseSerializer,
     CommentUpdateSerializer,
 )
+from apps.community.utils.comment_count import change_comment_count
+from apps.community.utils.mentions import create_comment_tags, sync_comment_tags
+from apps.community.utils.post_detail import invalidate_post_detail
+
 
-User = get_user_model()
+class CommentCursorPagination(CursorPagination):
+    # 무한 스크롤: OFFSET/COUNT 없이 (created_at, id) 위치 기준으로 다음 페이지 조회
+    page_size = 10
+    ordering = ("-created_at", "id")
 
 
 # 댓글 조희
@@ -28,7 +34,7 @@ class CommentListAPIView(APIView):
     @extend_schema(
         operation_id="댓글 조회",
         summary="특정 게시글의 댓글 목록 조회 (기능구현 완료)",
-        description="게시글 ID를 기반으로 해당 게시글에 달린 댓글 목록을 조회. 페이지네이션이 적용.",
+        description="게시글 ID를 기반으로 해당 게시글에 달린 댓글 목록을 최신순으로 조회. 커서 페이지네이션(next 링크)이 적용.",
         tags=["[User] Community - Comment ( 댓글 조회/생성/삭제/수정 )"],
         responses={
             200: CommentResponseSerializer(many=True),
@@ -58,27 +64,32 @@ class CommentListAPIView(APIView):
         if not post_id:
             return Response({"detail": "post_id는 필수 항목입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if not Post.objects.filter(id=post_id).exists():
+        # 전체 댓글 수는 COUNT(*) 대신 게시글의 댓글 수 컬럼 사용
+        comment_count = Post.objects.filter(id=post_id).values_list("comment_count", flat=True).first()
+        if comment_count is None:
             return Response({"detail": "존재하지 않는 게시글입니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        comments = Comment.objects.filter(post_id=post_id).order_by("-created_at")
-
-        if not comments.exists():
-            return Response({"detail": "댓글이 없습니다."}, status=status.HTTP_200_OK)
-
-        paginator = PageNumberPagination()
-        paginator.page_size = 10
-        paginated_comments = paginator.paginate_queryset(comments, request)
+        tags = CommentTags.objects.select_related("tagged_user").order_by("id")
+        comments = (
+            Comment.objects.filter(post_id=post_id)
+            .select_related("author")
+            .prefetch_related(Prefetch("tags", queryset=tags))
+        )
 
-        if paginated_comments is None:
-            return paginator.get_paginated_response([])
+        paginator = CommentCursorPagination()
+        paginated_comments = paginator.paginate_queryset(comments, request, view=self)
 
-        results = []
-        for comment in paginated_comments:
-            comment_data = CommentResponseSerializer(comment).data
-            results.append(comment_data)
+        if not paginated_comments and paginator.cursor is None:
+            return Response({"detail": "댓글이 없습니다."}, status=status.HTTP_200_OK)
 
-        return paginator.get_paginated_response(results)
+        return Response(
+            {
+                "count": comment_count,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+                "results": CommentResponseSerializer(paginated_comments, many=True).data,
+            }
+        )
 
 
 class CommentCreateAPIView(APIView):
@@ -107,17 +118,13 @@ class CommentCreateAPIView(APIView):
         except Post.DoesNotExist:
             return Response({"detail": "존재하지 않는 게시글입니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        comment = serializer.save(post=post, author=request.user)
+        with transaction.atomic():
+            comment = serializer.save(post=post, author=request.user)
+            change_comment_count(post.id, 1)
 
-        content = serializer.validated_data.get("content", "")
-        tag_nicknames = re.findall(r"@(\w+)", content)
+            create_comment_tags(comment, serializer.validated_data.get("content", ""))
 
-        for nickname in tag_nicknames:
-            try:
-                tagged_user = User.objects.get(nickname=nickname)
-                CommentTags.objects.create(comment=comment, tagged_user=tagged_user)
-            except User.DoesNotExist:
-                continue
+        invalidate_post_detail(post.id)
 
         response_serializer = CommentResponseSerializer(comment)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -152,7 +159,11 @@ class CommentUpdateAPIView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
+            if "content" in serializer.validated_data:
+                sync_comment_tags(comment, comment.content)
+        invalidate_post_detail(comment.post_id)
 
         response_serializer = CommentResponseSerializer(comment)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -183,5 +194,8 @@ class CommentDeleteAPIView(APIView):
         if comment.author != request.user:
             return Response({"detail": "해당 댓글을 삭제할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
+            change_comment_count(comment.post_id, -1)
+        invalidate_post_detail(comment.post_id)
         return Response({"detail": "댓글이 삭제 되었습니다."}, status=status.HTTP_204_NO_CONTENT)
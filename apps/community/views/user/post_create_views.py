@@ -12,6 +12,7 @@ from rest_framework.views import APIView
 from apps.community.models import Post
 from apps.community.serializers.post_create_serializers import PostCreateSerializer
 from apps.community.serializers.post_serializers import PostDetailSerializer
+from apps.community.utils.post_feed import bump_feed_version
 
 User = get_user_model()
 
@@ -42,6 +43,7 @@ class PostCreateAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer.save()
+        post = serializer.save()
+        bump_feed_version(post.category_id)
 
         return Response({"detail": "게시글이 성공적으로 등록되었습니다."}, status=status.HTTP_201_CREATED)
@@ -7,6 +7,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.community.models import Post
+from apps.community.utils.post_detail import invalidate_post_detail
+from apps.community.utils.post_feed import bump_feed_version
 from core.utils.s3_file_upload import S3Uploader
 
 
@@ -38,4 +40,6 @@ class PostDeleteAPIView(APIView):
         post.images.all().delete()
 
         post.delete()
+        invalidate_post_detail(post_id)
+        bump_feed_version(post.category_id)
         return Response({"id": post_id, "message": "게시물이 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
@@ -8,9 +8,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.community.models import Comment, CommentTags, Post, PostLike
+from apps.community.models import Post, PostLike
 from apps.community.serializers.post_like_serializer import PostLikeResponseSerializer
 from apps.community.serializers.post_serializers import PostDetailSerializer
+from apps.community.utils.post_detail import get_post_detail_data
+from apps.community.utils.post_like import post_like_buffer
+from apps.community.utils.view_count import post_view_counter
+from core.utils.view_counter import get_viewer_key
 
 
 class UserPostDetailAPIView(APIView):
@@ -56,37 +60,33 @@ class UserPostDetailAPIView(APIView):
         ],
     )
     def get(self, request: Request, post_id: int) -> Response:
-        try:
-            post = Post.objects.get(pk=post_id)
-        except Post.DoesNotExist:
+        # 존재/블라인드 여부와 자주 바뀌는 카운터만 매번 DB 에서 조회하고, 나머지 본문은 캐시 사용
+        post = (
+            Post.objects.filter(pk=post_id).values("is_visible", "view_count", "likes_count", "comment_count").first()
+        )
+        if post is None:
             return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        if not post.is_visible:
+        if not post["is_visible"]:
             return Response({"detail": "블라인드 처리된 게시글입니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        is_liked = False
-        if request.user.is_authenticated:
-            is_liked = PostLike.objects.filter(post=post, user=request.user, is_liked=True).exists()
-
-        like_data = PostLikeResponseSerializer({"liked": is_liked}).data
-
-        serializer = PostDetailSerializer(post, context={"request": request})
-        data = dict(serializer.data)
-
-        data.pop("is_visible", None)
-        data.pop("is_notice", None)
-
-        for comment_dict in data.get("comments", []):
-            comment_id = comment_dict["id"]
-
-            tags = CommentTags.objects.select_related("tagged_user").filter(comment_id=comment_id)
-
-            tagged_nicks = [
-                tag.tagged_user.nickname for tag in tags if tag.tagged_user and hasattr(tag.tagged_user, "nickname")
-            ]
-
-            comment_dict["tagged_user_nicknames"] = tagged_nicks
+        data = get_post_detail_data(post_id)
+        if data is None:
+            return Response({"detail": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        data = {**data, "likes_count": post["likes_count"], "comment_count": post["comment_count"]}
 
-        data.update(like_data)
+        is_liked = False
+        # write-behind 모드에서는 아직 DB 에 반영되지 않은 좋아요까지 Redis 에서 조회
+        like_state = post_like_buffer.get_state(post_id, request.user.pk) if post_like_buffer.enabled else None
+        if like_state is not None:
+            data["likes_count"], is_liked = like_state
+        elif request.user.is_authenticated:
+            is_liked = PostLike.objects.filter(post_id=post_id, user=request.user, is_liked=True).exists()
+
+        # 조회수는 Redis 버퍼에만 쌓고, 응답에는 아직 반영되지 않은 증가분을 더해서 내려줌
+        pending_views = post_view_counter.incr(post_id, get_viewer_key(request))
+        data["view_count"] = post["view_count"] + pending_views
+
+        data.update(PostLikeResponseSerializer({"liked": is_liked}).data)
 
         return Response(data, status=status.HTTP_200_OK)
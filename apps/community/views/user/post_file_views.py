@@ -0,0 +1,108 @@
+from typing import cast
+
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.community.models import Post, PostAttachment, PostImage
+from apps.community.serializers.attachment_serializers import (
+    POST_FILE_MAX_COUNTS,
+    POST_FILE_UPLOAD_POLICIES,
+    PostAttachmentResponseSerializer,
+    PostFilePresignedCompleteSerializer,
+    PostFilePresignedUploadSerializer,
+    PostImageResponseSerializer,
+)
+from apps.community.tasks import generate_post_image_variants
+from apps.community.utils.post_detail import invalidate_post_detail
+from apps.community.utils.post_feed import bump_feed_version
+from core.utils.image_variants import enqueue_image_variants
+from core.utils.s3_file_upload import S3Uploader
+
+
+class PostFilePresignedUploadAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=PostFilePresignedUploadSerializer,
+        responses={201: OpenApiResponse(description="S3 직접 업로드 URL 발급")},
+        tags=["[User] Community - Posts ( 게시글 )"],
+        summary="게시글 이미지/첨부파일 S3 직접 업로드 URL 발급",
+        description="presigned POST(크기/형식 제한 포함) 또는 PUT 으로 S3 에 업로드한 뒤 complete API 를 호출합니다.",
+    )
+    def post(self, request: Request) -> Response:
+        serializer = PostFilePresignedUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        presigned = S3Uploader().issue_presigned_upload(
+            POST_FILE_UPLOAD_POLICIES[data["file_type"]],
+            cast(int, request.user.id),
+            file_name=data["file_name"],
+            content_type=data["content_type"],
+            size=data["size"],
+        )
+        return Response(presigned, status=status.HTTP_201_CREATED)
+
+
+class PostFilePresignedCompleteAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=PostFilePresignedCompleteSerializer,
+        responses={201: PostImageResponseSerializer},
+        tags=["[User] Community - Posts ( 게시글 )"],
+        summary="게시글 이미지/첨부파일 S3 직접 업로드 완료",
+        description="업로드된 객체를 HEAD 요청으로 확인한 뒤 게시글 이미지/첨부파일로 등록합니다.",
+    )
+    def post(self, request: Request, post_id: int) -> Response:
+        post = get_object_or_404(Post, id=post_id)
+
+        if post.author_id != request.user.id:
+            return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = PostFilePresignedCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        file_type = serializer.validated_data["file_type"]
+
+        model = PostImage if file_type == "image" else PostAttachment
+        limit_error = Response(
+            {"detail": f"{file_type}는 최대 {POST_FILE_MAX_COUNTS[file_type]}개까지 업로드할 수 있습니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+        if model.objects.filter(post=post).count() >= POST_FILE_MAX_COUNTS[file_type]:
+            return limit_error
+
+        uploader = S3Uploader()
+        user_id = cast(int, request.user.id)
+        upload_token = serializer.validated_data["upload_token"]
+        file_url, file_name = uploader.verify_presigned_upload(
+            POST_FILE_UPLOAD_POLICIES[file_type], user_id, upload_token, consume=False
+        )
+
+        with transaction.atomic():
+            # 같은 게시글에 동시에 등록하는 경우 개수 제한을 넘지 않도록 게시글 행 잠금 후 다시 확인
+            Post.objects.select_for_update().only("id").get(id=post.id)
+            if model.objects.filter(post=post).count() >= POST_FILE_MAX_COUNTS[file_type]:
+                return limit_error
+
+            # 토큰은 등록이 확정된 경우에만 사용 처리 (같은 완료 요청을 다시 보내도 중복 등록되지 않음)
+            uploader.claim_presigned_upload(user_id, upload_token)
+
+            if file_type == "image":
+                image = PostImage.objects.create(post=post, image_url=file_url, image_name=file_name)
+                enqueue_image_variants(generate_post_image_variants, [image.id])
+            else:
+                attachment = PostAttachment.objects.create(post=post, file_url=file_url, file_name=file_name)
+
+        invalidate_post_detail(post.id)
+        if file_type == "image":
+            # 목록 썸네일이 바뀔 수 있음
+            bump_feed_version(post.category_id)
+            return Response(PostImageResponseSerializer(image).data, status=status.HTTP_201_CREATED)
+        return Response(PostAttachmentResponseSerializer(attachment).data, status=status.HTTP_201_CREATED)
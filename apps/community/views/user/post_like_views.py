@@ -4,8 +4,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.community.models import Post, PostLike
+from apps.community.models import Post
 from apps.community.serializers.post_like_serializer import PostLikeResponseSerializer
+from apps.community.utils.post_like import like_post, post_like_buffer, unlike_post
 
 
 class PostLikeTrueAPIView(APIView):
@@ -22,18 +23,14 @@ class PostLikeTrueAPIView(APIView):
         },
     )
     def post(self, request, post_id):
-        try:
-            post = Post.objects.get(id=post_id)
-        except Post.DoesNotExist:
+        if not Post.objects.filter(id=post_id).exists():
             return Response({"detail": "존재하지 않는 게시글입니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        like, _ = PostLike.objects.get_or_create(user=request.user, post=post)
-        if not like.is_liked:
-            like.is_liked = True
-            like.save()
-
-        post.likes_count += 1
-        post.save()
+        # 이미 좋아요 상태면 좋아요 수는 그대로
+        if post_like_buffer.enabled:
+            post_like_buffer.set_liked(post_id, request.user.id, True)
+        else:
+            like_post(post_id, request.user.id)
 
         return Response({"liked": True}, status=status.HTTP_200_OK)
 
@@ -53,20 +50,13 @@ class PostLikeFalseAPIView(APIView):
         },
     )
     def post(self, request, post_id):
-        try:
-            post = Post.objects.get(id=post_id)
-        except Post.DoesNotExist:
+        if not Post.objects.filter(id=post_id).exists():
             return Response({"detail": "존재하지 않는 게시글입니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            like = PostLike.objects.get(user=request.user, post=post)
-            if like.is_liked:
-                like.is_liked = False
-                like.save()
-        except PostLike.DoesNotExist:
-            pass  # 좋아요 기록이 없는 경우, 아무 것도 하지 않음
-
-        post.likes_count -= 1
-        post.save()
+        # 좋아요 기록이 없거나 이미 취소된 경우 좋아요 수는 그대로
+        if post_like_buffer.enabled:
+            post_like_buffer.set_liked(post_id, request.user.id, False)
+        else:
+            unlike_post(post_id, request.user.id)
 
         return Response({"liked": False}, status=status.HTTP_200_OK)
@@ -1,4 +1,6 @@
-from django.db.models import Count, Q
+from typing import Union
+
+from django.db.models import Q, QuerySet
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
@@ -6,10 +8,30 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 
 from apps.community.models import Post
 from apps.community.serializers.post_list_serializers import PostListViewSerializer
+from apps.community.utils.notices import PinnedNoticeList
+from apps.community.utils.post_feed import (
+    POST_FEED_CACHE_MAX_PAGE,
+    get_cached_feed,
+    post_feed_cache_key,
+    set_cached_feed,
+)
+
+
+def _feed_response(request: Request, paginator: PageNumberPagination, page: int, size: int, data: dict) -> Response:
+    """캐시된 페이지로 PageNumberPagination 과 같은 형식의 응답 생성"""
+    url = request.build_absolute_uri()
+    next_url = replace_query_param(url, paginator.page_query_param, page + 1) if page * size < data["count"] else None
+    previous_url = None
+    if page == 2:
+        previous_url = remove_query_param(url, paginator.page_query_param)
+    elif page > 2:
+        previous_url = replace_query_param(url, paginator.page_query_param, page - 1)
+    return Response({"count": data["count"], "next": next_url, "previous": previous_url, "results": data["results"]})
 
 
 class PostListAPIView(APIView):
@@ -18,7 +40,7 @@ class PostListAPIView(APIView):
 
     @extend_schema(
         summary="게시글 목록 조회 (기능구현 완료)",
-        description="게시글 목록을 정렬 조건과 함께 페이징하여 조회합니다.",
+        description="게시글 목록을 정렬 조건과 함께 페이징하여 조회합니다. 검색이 아닌 경우 공지가 정렬 기준과 관계없이 앞쪽에 고정됩니다.",
         tags=["[User] Community - Posts ( 게시글 )"],
         parameters=[
             OpenApiParameter(
@@ -42,7 +64,13 @@ class PostListAPIView(APIView):
     )
     def get(self, request: Request) -> Response:
         sort: str = request.query_params.get("ordering", "recent")
-        valid_sort = {"recent": "-created_at", "old": "created_at", "views": "-view_count", "likes": "-likes_count"}
+        # 정렬 값이 같은 게시글이 캐시된 페이지 사이에서 중복/누락되지 않도록 id 보조 정렬 (피드 인덱스와 같은 순서)
+        valid_sort = {
+            "recent": ("-created_at", "-id"),
+            "old": ("created_at", "id"),
+            "views": ("-view_count", "-id"),
+            "likes": ("-likes_count", "-id"),
+        }
 
         if sort not in valid_sort.keys():
             return Response(
@@ -54,6 +82,11 @@ class PostListAPIView(APIView):
             )
         queryset = Post.objects.filter(is_visible=True)
 
+        category_param = request.query_params.get("category_id")
+        category_id = int(category_param) if category_param and category_param.isdigit() else None
+        if category_id is not None:
+            queryset = queryset.filter(category_id=category_id)
+
         # 검색 필터링
         search_type = request.query_params.get("search_type") or "title"
         keyword = request.query_params.get("keyword")
@@ -78,11 +111,32 @@ class PostListAPIView(APIView):
 
         # posts = Post.objects.filter(is_visible=True).order_by(valid_sort[sort])
 
-        queryset = queryset.annotate(comment_total=Count("comments")).order_by(valid_sort[sort])
-
         paginator = PageNumberPagination()
         paginator.page_size_query_param = "page_size"
-        paginated = paginator.paginate_queryset(queryset, request)
+
+        # 검색이 없는 목록의 앞쪽 페이지는 (카테고리, 정렬, 페이지, 크기) 단위로 캐싱
+        cache_key = None
+        page_param = request.query_params.get(paginator.page_query_param) or "1"
+        if not keyword and page_param.isdigit() and 1 <= int(page_param) <= POST_FEED_CACHE_MAX_PAGE:
+            page, size = int(page_param), paginator.get_page_size(request) or 10
+            cache_key = post_feed_cache_key(category_id, sort, page, size)
+            cached = get_cached_feed(cache_key)
+            if cached is not None:
+                return _feed_response(request, paginator, page, size, cached)
+
+        # 댓글 수는 작성/삭제 시 갱신되는 Post.comment_count 를 그대로 사용 (comments JOIN/GROUP BY 없음)
+        feed: Union[QuerySet[Post], PinnedNoticeList] = queryset.order_by(*valid_sort[sort])
+        if not keyword:
+            # 검색이 아닌 목록에서는 공지(같은 카테고리/정렬 조건)를 앞쪽에 고정하고 이어서 일반 게시글을 페이징
+            # 검색 결과에는 공지도 일반 게시글처럼 포함
+            feed = PinnedNoticeList(
+                notices=queryset.filter(is_notice=True).order_by(*valid_sort[sort]),
+                posts=queryset.filter(is_notice=False).order_by(*valid_sort[sort]),
+            )
+
+        paginated = paginator.paginate_queryset(feed, request)  # type: ignore[arg-type]
 
         serializer = PostListViewSerializer(paginated, many=True)
+        if cache_key is not None and paginator.page is not None:
+            set_cached_feed(cache_key, paginator.page.paginator.count, serializer.data)
         return paginator.get_paginated_response(serializer.data)
@@ -10,6 +10,8 @@ from rest_framework.views import APIView
 from apps.community.models import Post
 from apps.community.serializers.post_serializers import PostDetailSerializer
 from apps.community.serializers.user_post_serializers import UserPostUpdateSerializer
+from apps.community.utils.post_detail import invalidate_post_detail
+from apps.community.utils.post_feed import bump_feed_version
 
 
 class UserPostUpdateView(APIView):
@@ -29,10 +31,13 @@ class UserPostUpdateView(APIView):
         if post.author != request.user:
             return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
+        old_category_id = post.category_id
         serializer = UserPostUpdateSerializer(post, data=request.data, context={"request": request}, partial=True)
 
         if serializer.is_valid():
             updated_post = serializer.save()
+            invalidate_post_detail(updated_post.id)
+            bump_feed_version(old_category_id, updated_post.category_id)
             updated_post = Post.objects.prefetch_related("attachments", "images").get(id=updated_post.id)
             return Response(PostDetailSerializer(updated_post).data, status=status.HTTP_200_OK)
 
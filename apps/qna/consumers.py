@@ -1,29 +1,44 @@
+import asyncio
 import json
-import os
+import logging
 import uuid
 
 import httpx
-from channels.db import database_sync_to_async  # type: ignore
 from channels.generic.websocket import AsyncWebsocketConsumer  # type: ignore
 from django.contrib.auth.models import AnonymousUser
 
-from apps.qna.utils.redis import get_ai_count, increment_ai_count
+from apps.qna.utils.ai_client import AI_REQUEST_TIMEOUT, ai_client_manager
+from apps.qna.utils.answer_cache import get_cached_answer, store_answer
+from apps.qna.utils.conversation import (
+    append_turn,
+    build_payload,
+    load_conversation,
+)
+from apps.qna.utils.gemini import (
+    GEMINI_FALLBACK_MESSAGE,
+    coalesce_chunks,
+    stream_gemini,
+)
+from apps.qna.utils.redis import check_and_increment_ai_count
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-GEMINI_API_URL = os.getenv("GEMINI_API_URL")
+logger = logging.getLogger(__name__)
 
 
 class ChatConsumer(AsyncWebsocketConsumer):
+    ai_task = None
+    session_key = None
+
     async def connect(self):
         await self.accept()
         self.user = self.scope.get("user")
 
+        # 대화 기록/질문 횟수 키는 서버에서 연결 주체 기준으로 만든다 (클라이언트가 보내는 session_key 는 사용하지 않음)
         if not isinstance(self.user, AnonymousUser):
             user_type = "login_user"
-            session_key = self.user.email
+            self.session_key = f"user:{self.user.id}"
         else:
             user_type = "anonymous_user"
-            session_key = uuid.uuid4().hex
+            self.session_key = f"anonymous:{uuid.uuid4().hex}"
         # 인사말 및 기본 메뉴 전송
         await self.send(
             text_data=json.dumps(
@@ -32,7 +47,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
                     "message": "What's Up, Dickie?",
                     "menu": [{"id": "guide", "label": "홈페이지 사용법"}, {"id": "ai", "label": "AI 질문하기"}],
                     "user_type": user_type,
-                    "session_key": session_key,
+                    "session_key": self.session_key,
                 }
             )
         )
@@ -76,15 +91,35 @@ class ChatConsumer(AsyncWebsocketConsumer):
         # AI 질문 실행
         elif action == "ai_question":
             is_limited_user = isinstance(user, AnonymousUser) or getattr(user, "role", "GENERAL") == "GENERAL"
-            session_key = data.get("session_key")
+            session_key = self.session_key
 
-            if not session_key:
-                await self.send(text_data=json.dumps({"type": "error", "message": "ai_question need a session key."}))
+            if self.ai_task and not self.ai_task.done():
+                await self.send(text_data=json.dumps({"type": "error", "message": "이전 질문의 답변을 생성 중입니다."}))
                 return
 
+            # 이전 대화 맥락 (요약 + 최근 대화)
+            summary, history = await load_conversation(session_key)
+
+            # 같은(비슷한) 질문의 캐시된 답변이 있으면 Gemini 호출 없이 바로 응답 (질문 횟수도 차감하지 않음)
+            # 이어지는 질문은 이전 대화에 따라 답변이 달라지므로 대화의 첫 질문만 캐시 사용
+            if not summary and not history and self.is_relevant(user_message):
+                cached_answer = await get_cached_answer(user_message)
+                if cached_answer is not None:
+                    await self.send(text_data=json.dumps({"type": "input_lock", "status": True}))
+                    try:
+                        await self.send(
+                            text_data=json.dumps(
+                                {"type": "ai_stream", "message": cached_answer, "cached": True}, ensure_ascii=False
+                            )
+                        )
+                        await append_turn(session_key, user_message, cached_answer)
+                    finally:
+                        await self.send(text_data=json.dumps({"type": "input_lock", "status": False}))
+                    return
+
             if is_limited_user:
-                count = await self.get_ai_count_async(session_key)
-                if count >= 2:
+                # 횟수 확인과 증가를 Lua 스크립트 하나로 처리 (동시 요청에도 2회를 넘지 않음)
+                if not await check_and_increment_ai_count(session_key, limit=2):
                     await self.send(
                         text_data=json.dumps(
                             {
@@ -94,7 +129,6 @@ class ChatConsumer(AsyncWebsocketConsumer):
                         )
                     )
                     return
-                await self.increment_ai_count_async(session_key)
 
             # 질문을 보낸 직후 입력 잠금 신호 전송
             await self.send(text_data=json.dumps({"type": "input_lock", "status": True}))
@@ -112,54 +146,79 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 )
                 return
 
-            # Gemini 응답 스트리밍
-            async for char in self.ask_gemini_stream(user_message):
-                await self.send(text_data=json.dumps({"type": "ai_stream", "message": char}, ensure_ascii=False))
-
-            # 응답 끝난 뒤 입력창 다시 활성화
-            await self.send(text_data=json.dumps({"type": "input_lock", "status": False}))
+            # Gemini 응답 스트리밍은 별도 태스크로 실행 (소켓이 닫히면 disconnect 에서 취소)
+            self.ai_task = asyncio.create_task(self.relay_ai_answer(user_message, session_key, summary, history))
 
         # 세부 서브 메뉴 안내
         elif action == "select_submenu":
             submenu_id = data.get("submenu_id")
             await self.send(text_data=json.dumps(self.get_submenu_response(submenu_id)))
 
-    # Gemini API 요청
-    async def ask_gemini_stream(self, prompt):
-        system_prompt = "당신은 유능한 개발자입니다. 사용자 질문이 개발과 관련이 있을 때만 답변을 생성하고, 사용자의 질문이 개발 주제와 관련이 없을 경우 '이 서비스는 개발 관련 질문만 응답합니다.' 라고만 답변해야 합니다."
+    async def disconnect(self, code):
+        # 소켓이 닫히면 진행 중인 AI 요청을 취소해 슬롯과 커넥션을 바로 반납
+        if self.ai_task and not self.ai_task.done():
+            self.ai_task.cancel()
 
-        payload = {
-            "contents": [
-                {"role": "user", "parts": [{"text": (system_prompt)}]},
-                {"role": "user", "parts": [{"text": prompt}]},
-            ]
-        }
+    # AI 응답을 소켓으로 전달 (전체 제한 시간 초과, 업스트림 오류 시 에러 메시지 전송)
+    async def relay_ai_answer(self, prompt, session_key, summary, history):
+        try:
+            answer = ""
+            async with asyncio.timeout(AI_REQUEST_TIMEOUT):
+                async for chunk in self.ask_gemini_stream(prompt, summary, history):
+                    answer += chunk
+                    await self.send(text_data=json.dumps({"type": "ai_stream", "message": chunk}, ensure_ascii=False))
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{GEMINI_API_URL}?key={GEMINI_API_KEY}", json=payload, headers={"Content-Type": "application/json"}
+            # 정상적으로 끝까지 받은 답변만 대화 기록에 추가하고, 첫 질문이면 캐싱
+            if answer and answer != GEMINI_FALLBACK_MESSAGE:
+                if not summary and not history:
+                    await store_answer(prompt, answer)
+                await append_turn(session_key, prompt, answer)
+        except (TimeoutError, httpx.HTTPError):
+            await self.send(
+                text_data=json.dumps(
+                    {"type": "error", "message": "AI 응답이 지연되고 있습니다. 잠시 후 다시 시도해주세요."},
+                    ensure_ascii=False,
+                )
             )
-            response.raise_for_status()
-            result = response.json()
-
-            gemini_message = (
-                result.get("candidates", [{}])[0]
-                .get("content", {})
-                .get("parts", [{}])[0]
-                .get("text", "죄송합니다. 답변을 생성하지 못했습니다.")
+        except Exception:
+            # 응답 파싱 오류, Redis 오류 등 (태스크 안에서 조용히 죽지 않도록 기록)
+            logger.exception("AI 응답 전달 중 오류")
+            await self.send(
+                text_data=json.dumps(
+                    {"type": "error", "message": "AI 응답 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."},
+                    ensure_ascii=False,
+                )
+            )
+        finally:
+            # 응답 끝난 뒤(오류 포함) 입력창 다시 활성화. 소켓이 닫혀 취소된 경우는 보낼 곳이 없으므로 제외
+            current_task = asyncio.current_task()
+            if current_task is None or not current_task.cancelling():
+                await self.send(text_data=json.dumps({"type": "input_lock", "status": False}))
+
+    # 대기열에 들어간 경우 대기 순번 안내
+    async def send_queue_position(self, position):
+        await self.send(
+            text_data=json.dumps(
+                {"type": "ai_queue", "position": position, "message": f"답변 대기 중입니다. (대기 순번: {position})"},
+                ensure_ascii=False,
             )
+        )
+
+    # Gemini API 스트리밍 요청 (이전 대화 맥락 포함, 응답 조각을 받는 즉시 적당한 크기로 묶어서 반환)
+    async def ask_gemini_stream(self, prompt, summary="", history=None):
+        system_prompt = "당신은 유능한 개발자입니다. 사용자 질문이 개발과 관련이 있을 때만 답변을 생성하고, 사용자의 질문이 개발 주제와 관련이 없을 경우 '이 서비스는 개발 관련 질문만 응답합니다.' 라고만 답변해야 합니다."
 
-            for char in gemini_message:
-                yield char
+        payload = build_payload(system_prompt, summary, history or [], prompt)
 
-    # Redis 연동
-    @database_sync_to_async
-    def get_ai_count_async(self, session_key):
-        return get_ai_count(session_key)
+        # 공유 커넥션 풀 사용, 동시 요청 수를 넘으면 슬롯이 빌 때까지 대기
+        async with ai_client_manager.slot(on_queued=self.send_queue_position) as client:
+            has_content = False
+            async for chunk in coalesce_chunks(stream_gemini(client, payload)):
+                has_content = True
+                yield chunk
 
-    @database_sync_to_async
-    def increment_ai_count_async(self, session_key):
-        return increment_ai_count(session_key)
+            if not has_content:
+                yield GEMINI_FALLBACK_MESSAGE
 
     # 질문 무관 메시지 필터링
     def is_relevant(self, message):
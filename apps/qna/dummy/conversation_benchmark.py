@@ -0,0 +1,45 @@
+# AI 대화 맥락(요약 + 최근 대화) 포함 시 턴 수에 따른 요청 크기 측정
+# Redis/Gemini 없이 요약은 추출 요약으로 대체해서 계산한다.
+#
+# 사용법:
+#   python -m apps.qna.dummy.conversation_benchmark --turns 30
+import argparse
+import asyncio
+import json
+from typing import List, Tuple
+
+from apps.qna.dummy.fake_gemini_server import DEFAULT_ANSWER
+from apps.qna.utils.conversation import (
+    Turn,
+    build_payload,
+    compact,
+    estimate_tokens,
+    extractive_summary,
+)
+
+SYSTEM_PROMPT = "당신은 유능한 개발자입니다."
+
+
+async def simulate(turn_count: int, answer: str = DEFAULT_ANSWER) -> List[Tuple[int, int, int, int]]:
+    """턴 별 (턴 번호, 요청 바이트, 추정 토큰, 보관 중인 대화 수) 목록. 맥락 없이 보낼 때와 달리 일정 크기에서 멈춰야 한다"""
+    summary: str = ""
+    turns: List[Turn] = []
+    rows = []
+    for turn in range(1, turn_count + 1):
+        prompt = f"{turn}번째 질문입니다. 앞에서 설명한 내용을 이어서 더 자세히 알려주세요."
+        body = json.dumps(build_payload(SYSTEM_PROMPT, summary, turns, prompt), ensure_ascii=False)
+        rows.append((turn, len(body.encode("utf-8")), estimate_tokens(body), len(turns)))
+
+        turns = turns + [{"role": "user", "text": prompt}, {"role": "model", "text": answer}]
+        summary, turns = await compact(summary, turns, extractive_summary)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대화 턴 수에 따른 Gemini 요청 크기")
+    parser.add_argument("--turns", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'turn':>4} {'bytes':>7} {'tokens':>7} {'history':>7}")
+    for turn, size, tokens, history in asyncio.run(simulate(args.turns)):
+        print(f"{turn:>4} {size:>7} {tokens:>7} {history:>7}")
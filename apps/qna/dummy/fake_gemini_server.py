@@ -0,0 +1,74 @@
+# 로컬/테스트용 가짜 Gemini 서버
+# 실제 API 키 없이 streamGenerateContent(SSE) 응답을 흉내낸다.
+#
+# 사용법:
+#   python -m apps.qna.dummy.fake_gemini_server --port 8765
+#   GEMINI_STREAM_API_URL=http://127.0.0.1:8765/v1beta/models/fake:streamGenerateContent
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+DEFAULT_ANSWER = (
+    "N+1 문제는 목록을 조회한 뒤 각 항목의 연관 객체를 다시 한 번씩 조회하면서 발생합니다. "
+    "Django ORM 에서는 select_related 와 prefetch_related 로 연관 데이터를 미리 가져오면 해결할 수 있습니다."
+)
+
+
+def split_chunks(text: str, size: int) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    answer = DEFAULT_ANSWER
+    chunk_size = 4
+    delay = 0.0
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        for chunk in split_chunks(self.answer, self.chunk_size):
+            body = {"candidates": [{"content": {"role": "model", "parts": [{"text": chunk}]}}]}
+            self.wfile.write(f"data: {json.dumps(body, ensure_ascii=False)}\r\n\r\n".encode("utf-8"))
+            self.wfile.flush()
+            if self.delay:
+                time.sleep(self.delay)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_fake_gemini_server(
+    port: int = 0, answer: Optional[str] = None, chunk_size: int = 4, delay: float = 0.0
+) -> ThreadingHTTPServer:
+    """백그라운드 스레드로 가짜 서버 실행. 테스트에서는 port=0 으로 빈 포트를 사용"""
+    handler = type(
+        "ConfiguredFakeGeminiHandler",
+        (FakeGeminiHandler,),
+        {"answer": answer or DEFAULT_ANSWER, "chunk_size": chunk_size, "delay": delay},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 Gemini 스트리밍 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--chunk-size", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), FakeGeminiHandler)
+    FakeGeminiHandler.chunk_size = args.chunk_size
+    FakeGeminiHandler.delay = args.delay
+    print(f"fake gemini server: http://127.0.0.1:{args.port}/v1beta/models/fake:streamGenerateContent")
+    server.serve_forever()
@@ -0,0 +1,177 @@
+# 로컬/테스트용 가짜 S3 서버
+# PUT(업로드), HEAD, GET, DELETE, GET ?list-type=2(list_objects_v2), POST ?delete(delete_objects),
+# POST 폼 업로드(presigned POST) 만 흉내낸다.
+# (path-style 주소 사용, 서명은 확인하지 않음)
+#
+# 사용법:
+#   python -m apps.qna.dummy.fake_s3_server --port 9000 --delay 0.5
+#   AWS_S3_ENDPOINT_URL=http://127.0.0.1:9000
+import argparse
+import base64
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+from xml.sax.saxutils import escape
+
+_DELETE_KEY_PATTERN = re.compile(r"<Key>(.*?)</Key>")
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    # boto3 는 업로드 시 "Expect: 100-continue" 를 보내므로 HTTP/1.1 로 응답해야 대기 없이 진행된다
+    protocol_version = "HTTP/1.1"
+    # {(bucket, key): (content_type, body)}
+    objects: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+    # {(bucket, key): 업로드 시각} (오래된 객체 테스트를 위해 직접 수정 가능)
+    modified: Dict[Tuple[str, str], datetime] = {}
+    delay = 0.0
+    # 키에 이 문자열이 포함되면 업로드 거부 (실패 처리 테스트용)
+    fail_marker: Optional[str] = None
+    delete_requests = 0
+
+    def _target(self) -> Tuple[str, str]:
+        path = unquote(urlparse(self.path).path).lstrip("/")
+        bucket, _, key = path.partition("/")
+        return bucket, key
+
+    def _reply(self, code: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if "Content-Length" not in (headers or {}):
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_PUT(self) -> None:
+        bucket, key = self._target()
+        body = self._read_body()
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_marker and self.fail_marker in key:
+            self._reply(403, b"<Error><Code>AccessDenied</Code><Message>denied</Message></Error>")
+            return
+        self._store(bucket, key, self.headers.get("Content-Type", "binary/octet-stream"), body)
+        self._reply(200, headers={"ETag": '"fake"'})
+
+    def _store(self, bucket: str, key: str, content_type: str, body: bytes) -> None:
+        self.objects[(bucket, key)] = (content_type, body)
+        self.modified[(bucket, key)] = datetime.now(timezone.utc)
+
+    def do_HEAD(self) -> None:
+        obj = self.objects.get(self._target())
+        if obj is None:
+            self._reply(404)
+            return
+        self._reply(200, headers={"Content-Type": obj[0], "Content-Length": str(len(obj[1])), "ETag": '"fake"'})
+
+    def do_GET(self) -> None:
+        bucket, key = self._target()
+        query = parse_qs(urlparse(self.path).query)
+        if not key and query.get("list-type") == ["2"]:
+            self._list_objects(bucket, query)
+            return
+
+        obj = self.objects.get((bucket, key))
+        if obj is None:
+            self._reply(404, b"<Error><Code>NoSuchKey</Code></Error>")
+            return
+        self._reply(200, obj[1], headers={"Content-Type": obj[0]})
+
+    def _list_objects(self, bucket: str, query: Dict[str, list]) -> None:
+        prefix = query.get("prefix", [""])[0]
+        max_keys = int(query.get("max-keys", ["1000"])[0])
+        start_after = query.get("continuation-token", [""])[0]
+
+        keys = sorted(key for b, key in self.objects if b == bucket and key.startswith(prefix) and key > start_after)
+        page, truncated = keys[:max_keys], len(keys) > max_keys
+        contents = "".join(
+            f"<Contents><Key>{escape(key)}</Key>"
+            f"<LastModified>{self.modified[(bucket, key)].strftime('%Y-%m-%dT%H:%M:%S.000Z')}</LastModified>"
+            f"<Size>{len(self.objects[(bucket, key)][1])}</Size></Contents>"
+            for key in page
+        )
+        token = f"<NextContinuationToken>{escape(page[-1])}</NextContinuationToken>" if truncated else ""
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?><ListBucketResult>'
+            f"<Name>{bucket}</Name><Prefix>{escape(prefix)}</Prefix><KeyCount>{len(page)}</KeyCount>"
+            f"<MaxKeys>{max_keys}</MaxKeys><IsTruncated>{str(truncated).lower()}</IsTruncated>{token}{contents}"
+            "</ListBucketResult>"
+        )
+        self._reply(200, body.encode("utf-8"), headers={"Content-Type": "application/xml"})
+
+    def do_DELETE(self) -> None:
+        self.objects.pop(self._target(), None)
+        self._reply(204)
+
+    def do_POST(self) -> None:
+        bucket, _ = self._target()
+        body = self._read_body()
+        if "delete" in urlparse(self.path).query:
+            type(self).delete_requests += 1
+            for key in _DELETE_KEY_PATTERN.findall(body.decode("utf-8")):
+                self.objects.pop((bucket, key), None)
+            self._reply(200, b'<?xml version="1.0" encoding="UTF-8"?><DeleteResult></DeleteResult>')
+            return
+        self._form_upload(bucket, body)
+
+    def _form_upload(self, bucket: str, body: bytes) -> None:
+        # presigned POST: multipart 폼의 key/Content-Type/file 필드와 정책의 content-length-range 만 확인
+        header = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode()
+        message = BytesParser(policy=HTTP).parsebytes(header + body)
+        fields: Dict[str, bytes] = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            payload = part.get_payload(decode=True)
+            fields[str(name)] = payload if isinstance(payload, bytes) else b""
+
+        file_body = fields.get("file", b"")
+        policy = json.loads(base64.b64decode(fields.get("policy", b"e30=")))
+        for condition in policy.get("conditions", []):
+            if isinstance(condition, list) and condition[0] == "content-length-range":
+                if not condition[1] <= len(file_body) <= condition[2]:
+                    self._reply(400, b"<Error><Code>EntityTooLarge</Code></Error>")
+                    return
+
+        key = fields["key"].decode()
+        self._store(bucket, key, fields.get("Content-Type", b"binary/octet-stream").decode(), file_body)
+        self._reply(204)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_fake_s3_server(
+    port: int = 0, delay: float = 0.0, fail_marker: Optional[str] = None
+) -> Tuple[ThreadingHTTPServer, type]:
+    """백그라운드 스레드로 가짜 S3 서버 실행. (서버, 저장소/요청 수를 확인할 수 있는 핸들러 클래스) 반환"""
+    handler = type(
+        "ConfiguredFakeS3Handler",
+        (FakeS3Handler,),
+        {"objects": {}, "modified": {}, "delay": delay, "fail_marker": fail_marker, "delete_requests": 0},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 S3 서버")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), FakeS3Handler)
+    FakeS3Handler.delay = args.delay
+    print(f"fake s3 server: http://127.0.0.1:{args.port}")
+    server.serve_forever()
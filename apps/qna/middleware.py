@@ -1,20 +1,12 @@
 from urllib.parse import parse_qs
 
 import jwt
-from asgiref.sync import sync_to_async
 from channels.middleware import BaseMiddleware  # type: ignore
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
-
-@sync_to_async
-def get_user(user_id):
-    try:
-        return get_user_model().objects.get(id=user_id)
-    except get_user_model().DoesNotExist:
-        return None
+from apps.users.utils.user_principal import get_user_principal
 
 
 class JWTAuthMiddleware(BaseMiddleware):
@@ -34,7 +26,8 @@ class JWTAuthMiddleware(BaseMiddleware):
                 return
 
             user_id = payload.get("user_id")
-            user = await get_user(user_id)
+            # 캐시된 사용자 정보 사용 (재접속이 몰려도 DB 조회 없이 처리)
+            user = await get_user_principal(user_id)
             if user is None:
                 await self.close_connection(send, 4003, "사용자를 찾을 수 없음")
                 return
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("qna", "0003_questioncategory_category_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="questionimage",
+            name="thumbnail_url",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name="questionimage",
+            name="webp_url",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
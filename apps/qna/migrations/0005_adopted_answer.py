@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:43
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def backfill_adopted_answers(apps, schema_editor):
+    Answer = apps.get_model("qna", "Answer")
+    Question = apps.get_model("qna", "Question")
+
+    # 제약 조건 추가 전에 질문 당 가장 먼저 채택된 답변 하나만 남긴다
+    adopted = Answer.objects.filter(is_adopted=True)
+    first_ids = adopted.values("question_id").annotate(first_id=Min("id")).values("first_id")
+    adopted.exclude(id__in=first_ids).update(is_adopted=False)
+
+    Question.objects.filter(answers__is_adopted=True).update(has_adopted_answer=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("qna", "0004_image_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="question",
+            name="has_adopted_answer",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_adopted_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="answer",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_adopted", True)),
+                fields=("question",),
+                name="unique_adopted_answer_per_question",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("qna", "0005_adopted_answer"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="question",
+            name="has_adopted_answer",
+        ),
+    ]
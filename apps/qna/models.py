@@ -50,6 +50,9 @@ class QuestionAIAnswer(models.Model):
 class QuestionImage(models.Model):
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name="images")
     img_url = models.CharField(max_length=255)
+    # Celery 에서 생성하는 변환본 (목록용 썸네일, 본문용 WebP)
+    thumbnail_url = models.CharField(max_length=255, null=True, blank=True)
+    webp_url = models.CharField(max_length=255, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -73,6 +76,12 @@ class Answer(models.Model):
 
     class Meta:
         db_table = "answers"
+        constraints = [
+            # 질문 당 채택된 답변은 하나만 (동시 채택 요청도 DB 에서 차단)
+            models.UniqueConstraint(
+                fields=["question"], condition=models.Q(is_adopted=True), name="unique_adopted_answer_per_question"
+            ),
+        ]
 
 
 class AnswerImage(models.Model):
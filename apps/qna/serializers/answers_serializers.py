@@ -3,7 +3,7 @@ from typing import Any, Dict
 from django.db import transaction
 from rest_framework import serializers
 
-from apps.qna.models import Answer, AnswerComment, AnswerImage
+from apps.qna.models import Answer, AnswerComment
 from apps.qna.serializers.images_serializers import AnswerImageMixin, ImageURLSerializer
 from apps.users.models import User
 
@@ -94,11 +94,8 @@ class AnswerUpdateSerializer(AnswerImageMixin, serializers.ModelSerializer[Answe
             # Answer 업데이트
             answer = super().update(instance, validated_data)
 
-            # 기존 AnswerImage들 삭제
-            AnswerImage.objects.filter(answer=instance).delete()
-
-            # 새로운 AnswerImage 생성
-            self._save_answer_images(answer, image_urls)
+            # 바뀐 이미지만 추가/삭제
+            self._sync_answer_images(answer, image_urls)
 
         return answer
 
@@ -1,10 +1,21 @@
 import re
-from typing import List
+from typing import Any, Callable, List, Tuple
 
 from django.conf import settings
+from django.db.models import QuerySet
 from rest_framework import serializers
 
 from apps.qna.models import Answer, AnswerImage, QuestionImage
+from apps.qna.tasks import generate_question_image_variants
+from core.utils.image_variants import enqueue_image_variants
+from core.utils.s3_file_upload import UploadPolicy
+from core.utils.validators import ALLOWED_IMAGE_EXTENSIONS
+
+QNA_IMAGE_UPLOAD_POLICY = UploadPolicy(
+    prefix="qna/images", max_size_mb=5, allowed_extensions=ALLOWED_IMAGE_EXTENSIONS, content_type_prefix="image/"
+)
+# 질문 하나에 넣을 수 있는 최대 이미지 수
+QUESTION_IMAGE_MAX_COUNT = 5
 
 
 class ImageURLSerializer(serializers.ModelSerializer[AnswerImage]):
@@ -21,6 +32,21 @@ class ImageFileUploadSerializer(serializers.Serializer):
     image_files = serializers.ListField(child=serializers.ImageField(), required=False)
 
 
+class ImagePresignedUploadSerializer(serializers.Serializer):
+    """S3 직접 업로드(presigned) 발급 요청 시리얼라이저"""
+
+    file_name = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(min_value=1)
+
+
+class ImagePresignedCompleteSerializer(serializers.Serializer):
+    """S3 직접 업로드 완료 요청 시리얼라이저 (question_id 가 있으면 질문 이미지로 등록)"""
+
+    upload_token = serializers.CharField()
+    question_id = serializers.IntegerField(required=False)
+
+
 class ImageFileDeleteSerializer(serializers.Serializer):
     """이미지 url(s3 업로드 된 url)을 요청으로 받아서 삭제할 떄 사용하는 시리얼라이저"""
 
@@ -40,29 +66,39 @@ class ImageFileDeleteSerializer(serializers.Serializer):
         return value
 
 
+# 마크다운/HTML 이미지 패턴 (모듈 로드 시 한 번만 컴파일)
+IMAGE_URL_PATTERNS = [
+    re.compile(r"!\[.*?\]\((https://[^)]+)\)"),  # ![alt](url)
+    re.compile(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'),  # <img src="url">
+]
+
+
 class ImageURLExtractFromMarkdown:
     """이미지 URL 추출을 위한 믹스인 클래스"""
 
     @staticmethod
     def _extract_image_urls_from_content(content: str) -> List[str]:
-        """마크다운 content에서 이미지 URL 추출"""
-
-        # 마크다운 이미지 패턴
-        image_patterns = [
-            r"!\[.*?\]\((https://[^)]+)\)",  # ![alt](url)
-            r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>',  # <img src="url">
-        ]
-
+        """마크다운 content에서 이미지 URL 추출 (중복 제거, 순서 보존)"""
         image_urls: List[str] = []
-        for pattern in image_patterns:
-            matches = re.findall(pattern, content)
-            image_urls.extend(matches)
+        for pattern in IMAGE_URL_PATTERNS:
+            image_urls.extend(pattern.findall(content))
 
         # S3 URL만 필터링
         s3_bucket_domain = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com"
-        valid_urls = [url for url in image_urls if url.startswith(s3_bucket_domain)]
+        return list(dict.fromkeys(url for url in image_urls if url.startswith(s3_bucket_domain)))
 
-        return valid_urls
+    @staticmethod
+    def _sync_image_urls(
+        images: QuerySet[Any], image_urls: List[str], build: Callable[[str], Any]
+    ) -> Tuple[List[Any], int]:
+        """기존 이미지와 비교해서 빠진 URL 은 한 번에 삭제, 새 URL 은 한 번에 생성. (생성된 객체, 삭제 수) 반환"""
+        existing = set(images.values_list("img_url", flat=True))
+        removed = existing.difference(image_urls)
+
+        deleted = images.filter(img_url__in=removed).delete()[0] if removed else 0
+        new_images = [build(img_url) for img_url in image_urls if img_url not in existing]
+        created = images.model.objects.bulk_create(new_images) if new_images else []
+        return created, deleted
 
 
 class AnswerImageMixin(ImageURLExtractFromMarkdown):
@@ -70,9 +106,18 @@ class AnswerImageMixin(ImageURLExtractFromMarkdown):
 
     @staticmethod
     def _save_answer_images(answer: Answer, image_urls: List[str]) -> None:
-        """AnswerImage 객체들을 생성하여 DB에 저장"""
-        for img_url in image_urls:
-            AnswerImage.objects.create(answer=answer, img_url=img_url)
+        """새 답변의 AnswerImage 객체들을 한 번에 생성"""
+        if image_urls:
+            AnswerImage.objects.bulk_create([AnswerImage(answer=answer, img_url=img_url) for img_url in image_urls])
+
+    @classmethod
+    def _sync_answer_images(cls, answer: Answer, image_urls: List[str]) -> None:
+        """수정된 답변 내용에 맞춰 AnswerImage 추가/삭제"""
+        cls._sync_image_urls(
+            AnswerImage.objects.filter(answer=answer),
+            image_urls,
+            lambda img_url: AnswerImage(answer=answer, img_url=img_url),
+        )
 
 
 class QuestionImageMixin(ImageURLExtractFromMarkdown):
@@ -80,6 +125,19 @@ class QuestionImageMixin(ImageURLExtractFromMarkdown):
 
     @staticmethod
     def _save_question_images(question, image_urls: List[str]) -> None:
-        """QuestionImage 객체들을 생성하여 DB에 저장"""
-        for img_url in image_urls:
-            QuestionImage.objects.create(question=question, img_url=img_url)
+        """새 질문의 QuestionImage 객체들을 한 번에 생성"""
+        if image_urls:
+            images = QuestionImage.objects.bulk_create(
+                [QuestionImage(question=question, img_url=img_url) for img_url in image_urls]
+            )
+            enqueue_image_variants(generate_question_image_variants, [image.id for image in images])
+
+    @classmethod
+    def _sync_question_images(cls, question, image_urls: List[str]) -> None:
+        """수정된 질문 내용에 맞춰 QuestionImage 추가/삭제 (남아있는 이미지의 변환본은 그대로 유지)"""
+        created, _ = cls._sync_image_urls(
+            QuestionImage.objects.filter(question=question),
+            image_urls,
+            lambda img_url: QuestionImage(question=question, img_url=img_url),
+        )
+        enqueue_image_variants(generate_question_image_variants, [image.id for image in created])
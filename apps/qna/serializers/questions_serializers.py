@@ -5,7 +5,10 @@ from rest_framework import serializers
 
 from apps.qna.models import Question, QuestionCategory, QuestionImage
 from apps.qna.serializers.answers_serializers import AnswerListSerializer
-from apps.qna.serializers.images_serializers import QuestionImageMixin
+from apps.qna.serializers.images_serializers import (
+    QUESTION_IMAGE_MAX_COUNT,
+    QuestionImageMixin,
+)
 from apps.users.models import User
 
 
@@ -13,7 +16,7 @@ from apps.users.models import User
 class QuestionImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = QuestionImage
-        fields = ["id", "img_url", "created_at", "updated_at"]
+        fields = ["id", "img_url", "thumbnail_url", "webp_url", "created_at", "updated_at"]
         read_only_fields = fields
 
 
@@ -37,9 +40,9 @@ class QuestionCreateSerializer(serializers.ModelSerializer, QuestionImageMixin):
 
     def create(self, validated_data):
         content = validated_data["content"]
-        image_urls = list(dict.fromkeys(self._extract_image_urls_from_content(content)))
-        if len(image_urls) > 5:
-            raise serializers.ValidationError("이미지는 최대 5개까지만 업로드할 수 있습니다.")
+        image_urls = self._extract_image_urls_from_content(content)
+        if len(image_urls) > QUESTION_IMAGE_MAX_COUNT:
+            raise serializers.ValidationError(f"이미지는 최대 {QUESTION_IMAGE_MAX_COUNT}개까지만 업로드할 수 있습니다.")
         category = validated_data.pop("category_id")
         author = validated_data.pop("author", None)
 
@@ -81,15 +84,18 @@ class QuestionUpdateSerializer(serializers.ModelSerializer, QuestionImageMixin):
         if "category_id" in validated_data:
             instance.category = validated_data["category_id"]  # 이미 객체!
 
+        image_urls = None
         if "content" in validated_data:
-            content = validated_data["content"]
-            image_urls = list(dict.fromkeys(self._extract_image_urls_from_content(content)))  # 순서 보존
-            if len(image_urls) > 5:
-                raise serializers.ValidationError("이미지는 최대 5개까지만 업로드할 수 있습니다.")
-            instance.images.all().delete()
-            self._save_question_images(instance, image_urls)
-
-        instance.save()
+            image_urls = self._extract_image_urls_from_content(validated_data["content"])
+            if len(image_urls) > QUESTION_IMAGE_MAX_COUNT:
+                raise serializers.ValidationError(
+                    f"이미지는 최대 {QUESTION_IMAGE_MAX_COUNT}개까지만 업로드할 수 있습니다."
+                )
+
+        with transaction.atomic():
+            if image_urls is not None:
+                self._sync_question_images(instance, image_urls)
+            instance.save()
         return instance
 
 
@@ -128,6 +134,7 @@ class QuestionListSerializer(serializers.ModelSerializer):
     category = CategoryNameSerializer(read_only=True)
     author = AuthorInfoSerializer(read_only=True)
     answer_count = serializers.SerializerMethodField()
+    has_adopted_answer = serializers.SerializerMethodField()
     thumbnail = serializers.SerializerMethodField()
 
     class Meta:
@@ -140,6 +147,7 @@ class QuestionListSerializer(serializers.ModelSerializer):
             "category",
             "answer_count",
             "view_count",
+            "has_adopted_answer",
             "created_at",
             "thumbnail",
         ]
@@ -147,10 +155,17 @@ class QuestionListSerializer(serializers.ModelSerializer):
     def get_answer_count(self, obj):
         return obj.answers.count()
 
+    def get_has_adopted_answer(self, obj):
+        # 목록 쿼리셋에서 EXISTS 로 함께 조회한 값 (없으면 직접 조회)
+        if hasattr(obj, "adopted_answer_exists"):
+            return obj.adopted_answer_exists
+        return obj.answers.filter(is_adopted=True).exists()
+
     def get_thumbnail(self, obj):
         img = obj.images.first()
         if img:
-            return img.img_url
+            # 변환본이 아직 없으면(처리 중/실패) 원본 사용
+            return img.thumbnail_url or img.img_url
         return None
 
 
@@ -160,10 +175,26 @@ class QuestionDetailSerializer(serializers.ModelSerializer):
     author = AuthorInfoSerializer(read_only=True)
     category = CategoryNameSerializer(read_only=True)
     answers = AnswerListSerializer(many=True, read_only=True)
+    has_adopted_answer = serializers.SerializerMethodField()
 
     class Meta:
         model = Question
-        fields = ["id", "title", "content", "images", "author", "category", "view_count", "created_at", "answers"]
+        fields = [
+            "id",
+            "title",
+            "content",
+            "images",
+            "author",
+            "category",
+            "view_count",
+            "has_adopted_answer",
+            "created_at",
+            "answers",
+        ]
+
+    def get_has_adopted_answer(self, obj):
+        # 미리 가져온(prefetch) 답변 목록에서 확인
+        return any(answer.is_adopted for answer in obj.answers.all())
 
 
 # 질문 카테고리 목록 조회
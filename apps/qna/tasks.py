@@ -0,0 +1,43 @@
+import logging
+
+from celery import shared_task  # type: ignore
+
+from apps.qna.utils.image_variants import question_image_variants
+from apps.qna.utils.orphan_files import qna_image_collector
+from apps.qna.utils.view_count import question_view_counter
+from core.utils.s3_file_upload import S3Uploader
+
+logger = logging.getLogger(__name__)
+
+
+# Redis 에 쌓인 질문 조회수를 1분마다 DB에 반영
+@shared_task
+def flush_question_view_counts():
+    flushed = question_view_counter.flush()
+    logger.info(f"[Celery] 질문 조회수 반영 완료: {flushed}건")
+
+
+# 어디에서도 참조하지 않는 QnA 이미지를 매일 S3 에서 삭제
+@shared_task
+def delete_orphaned_qna_images():
+    deleted = qna_image_collector.sweep()
+    logger.info(f"[Celery] 참조되지 않는 QnA 이미지 삭제 완료: {deleted}건")
+
+
+# 새로 등록된 질문 이미지의 썸네일/WebP 변환본 생성 (EXIF 제거)
+@shared_task
+def generate_question_image_variants(image_ids):
+    # question_detail -> serializers -> tasks 순환 import 방지
+    from apps.qna.utils.question_detail import invalidate_question_detail
+
+    updated = question_image_variants.generate(image_ids)
+    for question_id in {image.question_id for image in updated}:
+        invalidate_question_detail(question_id)
+    logger.info(f"[Celery] 질문 이미지 변환 완료: {len(updated)}건")
+
+
+# 삭제된 질문/답변의 이미지를 S3 에서 삭제 (남은 파일은 매일 orphan 정리에서 다시 삭제됨)
+@shared_task
+def delete_qna_image_files(image_urls):
+    S3Uploader().delete_files(image_urls)
+    logger.info(f"[Celery] 삭제된 질문/답변 이미지 파일 정리 완료: {len(image_urls)}건")
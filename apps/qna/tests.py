@@ -1,3 +1,851 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+import httpx
+from django.contrib.auth.models import AnonymousUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+from redis.exceptions import RedisError
+from rest_framework.test import APIClient
+
+from apps.qna.consumers import ChatConsumer
+from apps.qna.dummy.conversation_benchmark import simulate
+from apps.qna.dummy.fake_gemini_server import DEFAULT_ANSWER, start_fake_gemini_server
+from apps.qna.dummy.fake_s3_server import start_fake_s3_server
+from apps.qna.error_messages import AnswerErrorMessages
+from apps.qna.models import (
+    Answer,
+    AnswerComment,
+    AnswerImage,
+    Question,
+    QuestionAIAnswer,
+    QuestionCategory,
+    QuestionImage,
+)
+from apps.qna.serializers.answers_serializers import (
+    AnswerCreateSerializer,
+    AnswerUpdateSerializer,
+)
+from apps.qna.serializers.images_serializers import QUESTION_IMAGE_MAX_COUNT
+from apps.qna.serializers.questions_serializers import QuestionUpdateSerializer
+from apps.qna.utils.adopt import adopt_answer
+from apps.qna.utils.ai_client import AIClientManager
+from apps.qna.utils.answer_cache import (
+    get_answer_cache_stats,
+    get_cached_answer,
+    minhash_signature,
+    normalize_prompt,
+    store_answer,
+)
+from apps.qna.utils.conversation import (
+    CONVERSATION_TOKEN_BUDGET,
+    append_turn,
+    build_payload,
+    count_tokens,
+    extractive_summary,
+    load_conversation,
+)
+from apps.qna.utils.deletion import (
+    _image_urls,
+    delete_answer_tree,
+    delete_question_tree,
+)
+from apps.qna.utils.gemini import coalesce_chunks, extract_text, stream_gemini
+from apps.qna.utils.question_detail import invalidate_question_detail
+from apps.qna.utils.redis import check_and_increment_ai_count
+from apps.users.models import User
+from apps.users.utils.user_principal import UserPrincipal
+from core.utils.redis_async import get_async_redis
+from core.utils.s3_file_upload import S3_UPLOAD_MAX_WORKERS, S3Uploader
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class GeminiStreamTestCase(SimpleTestCase):
+    def setUp(self):
+        self.server = start_fake_gemini_server(chunk_size=4)
+        host, port = self.server.server_address[:2]
+        self.url = f"http://{host}:{port}/v1beta/models/fake:streamGenerateContent"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_extract_text(self):
+        chunk = json.loads('{"candidates": [{"content": {"parts": [{"text": "안녕"}, {"text": "하세요"}]}}]}')
+        self.assertEqual(extract_text(chunk), "안녕하세요")
+        self.assertEqual(extract_text({}), "")
+
+    async def test_stream_gemini_relays_sse_chunks(self):
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            chunks = [chunk async for chunk in stream_gemini(client, {"contents": []}, url=self.url)]
+
+        self.assertEqual("".join(chunks), DEFAULT_ANSWER)
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+
+    async def test_coalesce_reduces_frame_count(self):
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            frames = [
+                frame
+                async for frame in coalesce_chunks(
+                    stream_gemini(client, {"contents": []}, url=self.url), max_chars=64, max_interval=10
+                )
+            ]
+
+        self.assertEqual("".join(frames), DEFAULT_ANSWER)
+        self.assertLess(len(frames), len(DEFAULT_ANSWER) // 4)
+
+    async def test_coalesce_sends_first_chunk_immediately(self):
+        frames = [frame async for frame in coalesce_chunks(_aiter(["a", "b", "c"]), max_chars=64, max_interval=10)]
+        self.assertEqual(frames, ["a", "bc"])
+
+
+class ChatConsumerRelayTestCase(SimpleTestCase):
+    def setUp(self):
+        self.consumer = ChatConsumer()
+        self.sent = []
+
+        async def send(text_data=None, **kwargs):
+            self.sent.append(json.loads(text_data))
+
+        self.consumer.send = send
+
+    async def test_unexpected_error_unlocks_input(self):
+        async def broken_stream(*args, **kwargs):
+            yield "부분 응답"
+            raise json.JSONDecodeError("Expecting value", "data: {", 6)
+
+        self.consumer.ask_gemini_stream = broken_stream
+        with self.assertLogs("apps.qna.consumers", level="ERROR"):
+            await self.consumer.relay_ai_answer("장고 질문입니다", "session", "", [])
+
+        self.assertEqual([message["type"] for message in self.sent], ["ai_stream", "error", "input_lock"])
+        self.assertFalse(self.sent[-1]["status"])
+
+    async def test_storage_error_unlocks_input(self):
+        async def stream(*args, **kwargs):
+            yield DEFAULT_ANSWER
+
+        self.consumer.ask_gemini_stream = stream
+        with (
+            mock.patch("apps.qna.consumers.append_turn", side_effect=RedisError("connection lost")),
+            self.assertLogs("apps.qna.consumers", level="ERROR"),
+        ):
+            await self.consumer.relay_ai_answer("장고 질문입니다", "session", "요약", [])
+
+        self.assertEqual(self.sent[-1], {"type": "input_lock", "status": False})
+
+    async def test_cancelled_relay_sends_nothing(self):
+        started = asyncio.Event()
+
+        async def slow_stream(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(10)
+            yield DEFAULT_ANSWER
+
+        self.consumer.ask_gemini_stream = slow_stream
+        task = asyncio.create_task(self.consumer.relay_ai_answer("장고 질문입니다", "session", "", []))
+        await started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(self.sent, [])
+
+
+class ChatConsumerSessionTestCase(SimpleTestCase):
+    async def _connect(self, user):
+        consumer = ChatConsumer()
+        consumer.scope = {"user": user}
+        consumer.accept = mock.AsyncMock()
+        consumer.send = mock.AsyncMock()
+        consumer.relay_ai_answer = mock.AsyncMock()
+        await consumer.connect()
+        return consumer
+
+    async def _ask(self, consumer, session_key):
+        message = {"action": "ai_question", "message": "장고 ORM 질문입니다", "session_key": session_key}
+        await consumer.receive(json.dumps(message))
+        await consumer.ai_task
+
+    async def test_client_session_key_is_ignored(self):
+        owner = UserPrincipal(id=1, email="owner@test.com", nickname="owner", role="STUDENT")
+        other = UserPrincipal(id=2, email="other@test.com", nickname="other", role="GENERAL")
+        owner_consumer = await self._connect(owner)
+        await append_turn(owner_consumer.session_key, "이전 질문", "이전 답변")
+
+        consumer = await self._connect(other)
+        await self._ask(consumer, "owner@test.com")
+        await self._ask(consumer, owner_consumer.session_key)
+
+        # 다른 사용자의 대화 기록을 읽거나 이어 쓰지 않음
+        _, session_key, summary, history = consumer.relay_ai_answer.await_args.args
+        self.assertEqual(session_key, "user:2")
+        self.assertEqual((summary, history), ("", []))
+        self.assertEqual(len((await load_conversation(owner_consumer.session_key))[1]), 2)
+
+        # 질문 횟수도 연결한 사용자 기준으로 차감
+        self.assertEqual(await get_async_redis().get("ai_count:user:2"), "2")
+        self.assertIsNone(await get_async_redis().get("ai_count:user:1"))
+        self.assertIsNone(await get_async_redis().get("ai_count:owner@test.com"))
+
+    async def test_anonymous_connections_get_separate_keys(self):
+        first = await self._connect(AnonymousUser())
+        second = await self._connect(AnonymousUser())
+        self.assertNotEqual(first.session_key, second.session_key)
+
+
+class AIClientManagerTestCase(SimpleTestCase):
+    async def test_slot_limits_concurrency_and_reports_queue_position(self):
+        manager = AIClientManager(max_concurrency=1)
+        positions = []
+        release = asyncio.Event()
+
+        async def on_queued(position):
+            positions.append(position)
+
+        async def hold_slot():
+            async with manager.slot():
+                await release.wait()
+
+        async def wait_slot():
+            async with manager.slot(on_queued=on_queued) as client:
+                return client
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait_slot())
+        await asyncio.sleep(0)
+
+        self.assertEqual(positions, [1])
+        self.assertFalse(waiter.done())
+
+        release.set()
+        await holder
+        self.assertIsInstance(await waiter, httpx.AsyncClient)
+        self.assertEqual(manager.waiting, 0)
+        await manager.aclose()
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        manager = AIClientManager(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with manager.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        self.assertEqual(manager.waiting, 1)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(manager.waiting, 0)
+
+        release.set()
+        await holder
+        await manager.aclose()
+
+    def test_client_uses_http2_and_old_loop_client_is_closed(self):
+        manager = AIClientManager()
+
+        async def grab():
+            async with manager.slot() as client:
+                return client
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertFalse(second.is_closed)
+        self.assertTrue(second._transport._pool._http2)
+        asyncio.run(manager.aclose())
+
+
+class AnswerCacheTestCase(SimpleTestCase):
+    def test_normalize_prompt(self):
+        self.assertEqual(normalize_prompt("  Django  ORM N+1 문제가 뭔가요??  "), "django orm n+1 문제가 뭔가요")
+
+    async def test_exact_match_after_normalization(self):
+        await store_answer("Django ORM 에서 N+1 문제가 뭔가요?", DEFAULT_ANSWER)
+
+        self.assertEqual(await get_cached_answer("django orm 에서   N+1 문제가 뭔가요"), DEFAULT_ANSWER)
+        self.assertEqual((await get_answer_cache_stats())["hits"], 1)
+
+    async def test_near_duplicate_match_is_off_by_default(self):
+        await store_answer("Django ORM 에서 N+1 문제를 해결하는 방법을 알려주세요", DEFAULT_ANSWER)
+
+        self.assertIsNone(await get_cached_answer("Django ORM 에서 N+1 문제를 해결하는 방법 알려주세요"))
+        self.assertEqual((await get_answer_cache_stats())["near_hits"], 0)
+
+    @mock.patch("apps.qna.utils.answer_cache.AI_ANSWER_CACHE_NEAR_DUPLICATE", True)
+    async def test_near_duplicate_match(self):
+        await store_answer("Django ORM 에서 N+1 문제를 해결하는 방법을 알려주세요", DEFAULT_ANSWER)
+
+        self.assertEqual(await get_cached_answer("Django ORM 에서 N+1 문제를 해결하는 방법 알려주세요"), DEFAULT_ANSWER)
+        self.assertIsNone(await get_cached_answer("파이썬 데코레이터는 어떻게 동작하나요?"))
+
+        stats = await get_answer_cache_stats()
+        self.assertEqual(stats["near_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_signature_is_deterministic(self):
+        self.assertEqual(minhash_signature("django orm"), minhash_signature("django orm"))
+
+
+class AIQuotaTestCase(SimpleTestCase):
+    async def test_concurrent_requests_do_not_exceed_limit(self):
+        results = await asyncio.gather(*(check_and_increment_ai_count("quota-test", limit=2) for _ in range(10)))
+
+        self.assertEqual(results.count(True), 2)
+        self.assertEqual(int(await get_async_redis().get("ai_count:quota-test")), 2)
+        self.assertGreater(await get_async_redis().ttl("ai_count:quota-test"), 0)
+
+
+class ConversationTestCase(SimpleTestCase):
+    def assertAlternatingRoles(self, contents):
+        roles = [content["role"] for content in contents]
+        self.assertEqual(roles[0], "user")
+        self.assertEqual(roles[-1], "user")
+        self.assertTrue(all(a != b for a, b in zip(roles, roles[1:])), roles)
+
+    def test_build_payload_includes_summary_and_history(self):
+        history = [{"role": "user", "text": "질문1"}, {"role": "model", "text": "답변1"}]
+        payload = build_payload("시스템", "요약", history, "질문2")
+
+        self.assertEqual(payload["systemInstruction"], {"parts": [{"text": "시스템"}]})
+        contents = payload["contents"]
+        self.assertEqual([content["role"] for content in contents], ["user", "model", "user"])
+        # 요약은 첫 질문과 같은 user 턴에 합쳐짐
+        self.assertEqual([part["text"] for part in contents[0]["parts"]], ["이전 대화 요약: 요약", "질문1"])
+        self.assertEqual(contents[-1]["parts"], [{"text": "질문2"}])
+
+    def test_build_payload_roles_alternate(self):
+        cases = [
+            ("", []),
+            ("요약", []),
+            ("", [{"role": "user", "text": "답변 없이 끝난 질문"}]),
+            (
+                "",
+                [
+                    {"role": "model", "text": "답변"},
+                    {"role": "user", "text": "질문1"},
+                    {"role": "model", "text": "답변1"},
+                ],
+            ),
+            ("요약", [{"role": "model", "text": "답변"}]),
+        ]
+        for summary, history in cases:
+            with self.subTest(summary=summary, history=history):
+                contents = build_payload("시스템", summary, history, "질문")["contents"]
+                self.assertAlternatingRoles(contents)
+                self.assertNotIn("시스템", json.dumps(contents, ensure_ascii=False))
+
+    async def test_append_turn_folds_old_turns_into_summary(self):
+        for turn in range(30):
+            summary, history = await append_turn(
+                "conversation-test", f"{turn}번째 질문입니다", DEFAULT_ANSWER, summarize=extractive_summary
+            )
+            self.assertLessEqual(count_tokens(history), CONVERSATION_TOKEN_BUDGET)
+
+        self.assertIn("Q: 0번째 질문입니다", summary)
+        self.assertEqual(await load_conversation("conversation-test"), (summary, history))
+        self.assertEqual(history[-1], {"role": "model", "text": DEFAULT_ANSWER})
+
+    async def test_payload_size_stays_bounded(self):
+        rows = await simulate(99)
+        sizes = [size for _, size, _, _ in rows]
+
+        # 오래된 대화가 요약으로 합쳐지면서 60턴 이후에도 요청 크기가 더 커지지 않아야 한다
+        self.assertLessEqual(max(sizes[60:]), max(sizes[:60]))
+        self.assertLess(max(history for _, _, _, history in rows), 60)
+
+
+def _image_file(name):
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10), "white").save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class ImageUploadTestCase(TestCase):
+    url = "/api/v1/qna/images/upload/"
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="student@test.com",
+            password="password123!",
+            name="수강생",
+            nickname="student",
+            phone_number="01033334444",
+            role=User.Role.STUDENT,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _start_s3(self, **kwargs):
+        server, storage = start_fake_s3_server(**kwargs)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        endpoint = override_settings(AWS_S3_ENDPOINT_URL=f"http://127.0.0.1:{server.server_address[1]}")
+        endpoint.enable()
+        self.addCleanup(endpoint.disable)
+        return storage
+
+    def test_images_are_uploaded_concurrently(self):
+        storage = self._start_s3(delay=0.3)
+        files = [_image_file(f"image{i}.png") for i in range(5)]
+
+        started = time.monotonic()
+        response = self.client.post(self.url, {"image_files": files}, format="multipart")
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["upload_success"]), 5)
+        self.assertEqual(len(storage.objects), 5)
+        # 순차 업로드였다면 5 * 0.3초 이상 걸린다
+        self.assertLess(elapsed, 1.2)
+
+    def test_failed_upload_rolls_back_with_single_batch_delete(self):
+        storage = self._start_s3(fail_marker=".jpg")
+        files = [_image_file("ok1.png"), _image_file("ok2.png"), _image_file("fail.jpg")]
+
+        response = self.client.post(self.url, {"image_files": files}, format="multipart")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["upload_fail"], ["fail.jpg"])
+        self.assertEqual(storage.objects, {})
+        self.assertEqual(storage.delete_requests, 1)
+
+    def test_batch_timeout_cancels_queued_uploads(self):
+        storage = self._start_s3(delay=0.3)
+        uploader = S3Uploader()
+        files = [(_image_file(f"image{i}.png"), f"qna/images/{i}.png") for i in range(S3_UPLOAD_MAX_WORKERS * 2)]
+
+        with mock.patch.object(S3Uploader, "upload_file", autospec=True, side_effect=S3Uploader.upload_file) as upload:
+            urls = uploader.upload_files(files, timeout=0.05)
+            time.sleep(1)
+
+        self.assertEqual(urls, [None] * len(files))
+        # 스레드풀에서 대기 중이던 업로드는 시작되지 않고, 이미 올라간 파일은 끝난 뒤 삭제됨
+        self.assertEqual(upload.call_count, S3_UPLOAD_MAX_WORKERS)
+        self.assertEqual(storage.objects, {})
+
+    def test_presigned_upload_registers_question_image(self):
+        storage = self._start_s3()
+        category = QuestionCategory.objects.create(name="Django")
+        question = Question.objects.create(category=category, author=self.user, title="질문", content="내용")
+
+        issued = self.client.post(
+            "/api/v1/qna/images/presigned/",
+            {"file_name": "shot.png", "content_type": "image/png", "size": 4},
+            format="json",
+        ).data
+        httpx.put(issued["put_url"], content=b"\x89PNG", headers={"Content-Type": "image/png"})
+
+        response = self.client.post(
+            "/api/v1/qna/images/presigned/complete/",
+            {"upload_token": issued["upload_token"], "question_id": question.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(list(question.images.values_list("img_url", flat=True)), [issued["file_url"]])
+        self.assertEqual(len(storage.objects), 1)
+
+        # 같은 토큰으로 다시 완료 요청하면 중복 등록되지 않음
+        replay = self.client.post(
+            "/api/v1/qna/images/presigned/complete/",
+            {"upload_token": issued["upload_token"], "question_id": question.id},
+            format="json",
+        )
+        self.assertEqual(replay.status_code, 400)
+        self.assertEqual(question.images.count(), 1)
+
+        # 본문에도 추가되었으므로 본문을 수정해도 이미지가 삭제되지 않음
+        question.refresh_from_db()
+        self.assertIn(issued["file_url"], question.content)
+        QuestionUpdateSerializer().update(question, {"content": question.content + "\n추가 내용"})
+        self.assertEqual(list(question.images.values_list("img_url", flat=True)), [issued["file_url"]])
+
+    def _presigned_image(self, url):
+        issued = self.client.post(
+            url,
+            {"file_name": "shot.png", "content_type": "image/png", "size": 4},
+            format="json",
+        ).data
+        httpx.put(issued["put_url"], content=b"\x89PNG", headers={"Content-Type": "image/png"})
+        return issued
+
+    def test_presigned_complete_enforces_question_image_limit(self):
+        self._start_s3()
+        category = QuestionCategory.objects.create(name="Django")
+        question = Question.objects.create(category=category, author=self.user, title="질문", content="내용")
+        QuestionImage.objects.bulk_create(
+            [
+                QuestionImage(question=question, img_url=f"https://x.com/{i}.png")
+                for i in range(QUESTION_IMAGE_MAX_COUNT)
+            ]
+        )
+        issued = self._presigned_image("/api/v1/qna/images/presigned/")
+
+        response = self.client.post(
+            "/api/v1/qna/images/presigned/complete/",
+            {"upload_token": issued["upload_token"], "question_id": question.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(question.images.count(), QUESTION_IMAGE_MAX_COUNT)
+
+    def test_presigned_token_is_not_consumed_when_limit_reached_under_lock(self):
+        self._start_s3()
+        category = QuestionCategory.objects.create(name="Django")
+        question = Question.objects.create(category=category, author=self.user, title="질문", content="내용")
+        issued = self._presigned_image("/api/v1/qna/images/presigned/")
+        payload = {"upload_token": issued["upload_token"], "question_id": question.id}
+
+        # 사전 확인과 잠금 후 재확인 사이에 다른 요청이 이미지를 모두 채운 경우
+        def fill_then_verify(uploader, *args, **kwargs):
+            QuestionImage.objects.bulk_create(
+                [
+                    QuestionImage(question=question, img_url=f"https://x.com/{i}.png")
+                    for i in range(QUESTION_IMAGE_MAX_COUNT)
+                ]
+            )
+            return verify(uploader, *args, **kwargs)
+
+        verify = S3Uploader.verify_presigned_upload
+        with mock.patch.object(S3Uploader, "verify_presigned_upload", autospec=True, side_effect=fill_then_verify):
+            response = self.client.post("/api/v1/qna/images/presigned/complete/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        # 자리가 나면 같은 토큰으로 다시 등록할 수 있음
+        question.images.all().delete()
+        response = self.client.post("/api/v1/qna/images/presigned/complete/", payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(list(question.images.values_list("img_url", flat=True)), [issued["file_url"]])
+
+    def test_presigned_profile_image_replaces_old_image(self):
+        storage = self._start_s3()
+        first = self._presigned_image("/api/v1/auth/profile/image/presigned/")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/auth/profile/image/presigned/complete/", {"upload_token": first["upload_token"]}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_url, first["file_url"])
+
+        second = self._presigned_image("/api/v1/auth/profile/image/presigned/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/api/v1/auth/profile/image/presigned/complete/",
+                {"upload_token": second["upload_token"]},
+                format="json",
+            )
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_url, second["file_url"])
+        # 기존 프로필 이미지는 새 이미지 저장 후 삭제됨
+        self.assertEqual([key for _, key in storage.objects], [S3Uploader().get_key(second["file_url"])])
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="bucket", AWS_REGION="ap-northeast-2")
+class AnswerImageSyncTestCase(TestCase):
+    base = "https://bucket.s3.ap-northeast-2.amazonaws.com/qna/images"
+
+    def setUp(self):
+        user = User.objects.create_user(
+            email="student@test.com",
+            password="password123!",
+            name="수강생",
+            nickname="student",
+            phone_number="01033334444",
+        )
+        category = QuestionCategory.objects.create(name="Django", category_type="minor")
+        question = Question.objects.create(category=category, author=user, title="질문", content="내용")
+        self.answer = AnswerCreateSerializer().create(
+            {"question": question, "author": user, "content": self._content(range(10))}
+        )
+
+    def _content(self, indexes):
+        return "\n".join(f"![img]({self.base}/{i}.png)" for i in indexes)
+
+    def test_extract_dedupes_and_filters_foreign_urls(self):
+        content = (
+            f"![a]({self.base}/1.png) <img src='{self.base}/2.png'> ![b]({self.base}/1.png) ![c](https://x.com/3.png)"
+        )
+        self.assertEqual(
+            AnswerUpdateSerializer._extract_image_urls_from_content(content),
+            [f"{self.base}/1.png", f"{self.base}/2.png"],
+        )
+
+    def test_update_applies_only_the_diff(self):
+        self.assertEqual(self.answer.images.count(), 10)
+        kept_ids = set(self.answer.images.filter(img_url__endswith="/5.png").values_list("id", flat=True))
+
+        with CaptureQueriesContext(connection) as queries:
+            AnswerUpdateSerializer().update(self.answer, {"content": self._content([*range(2, 10), 10, 11])})
+
+        image_statements = [q["sql"] for q in queries.captured_queries if '"answer_images"' in q["sql"]]
+        # 기존 URL 조회 1 + 삭제 1 + 생성 1
+        self.assertEqual(len(image_statements), 3)
+        self.assertEqual(
+            sorted(self.answer.images.values_list("img_url", flat=True)),
+            sorted(f"{self.base}/{i}.png" for i in range(2, 12)),
+        )
+        self.assertTrue(kept_ids <= set(self.answer.images.values_list("id", flat=True)))
+
+
+class QuestionDetailTestCase(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                email=f"detail{i}@test.com",
+                password="password123!",
+                name="사용자",
+                nickname=f"detail{i}",
+                phone_number=f"0104444000{i}",
+            )
+            for i in range(3)
+        ]
+        major = QuestionCategory.objects.create(name="백엔드", category_type="major")
+        middle = QuestionCategory.objects.create(name="프레임워크", parent=major, category_type="middle")
+        minor = QuestionCategory.objects.create(name="Django", parent=middle, category_type="minor")
+        self.question = Question.objects.create(category=minor, author=self.users[0], title="질문", content="내용")
+        QuestionImage.objects.create(question=self.question, img_url="https://b/q.png")
+        self.url = f"/api/v1/qna/questions/{self.question.id}/"
+
+    def _add_answers(self, count):
+        for i in range(count):
+            answer = Answer.objects.create(question=self.question, author=self.users[i % 3], content=f"답변 {i}")
+            AnswerComment.objects.bulk_create(
+                [AnswerComment(answer=answer, author=self.users[j % 3], content="댓글") for j in range(3)]
+            )
+
+    def test_detail_runs_constant_queries(self):
+        self._add_answers(2)
+        # 조회수 1 + 질문(작성자, 카테고리 JOIN) 1 + 이미지 1 + 답변 1 + 댓글 1
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["category"], {"major": "백엔드", "middle": "프레임워크", "minor": "Django"})
+        self.assertEqual(len(response.data["answers"]), 2)
+
+        # 답변/댓글 수가 늘어도 쿼리 수는 그대로
+        self._add_answers(8)
+        invalidate_question_detail(self.question.id)
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data["answers"]), 10)
+        self.assertTrue(all(len(answer["comments"]) == 3 for answer in response.data["answers"]))
+
+    def test_cache_hit_reads_only_view_count(self):
+        self._add_answers(3)
+        first = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.url, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(cached.data["answers"], first.data["answers"])
+        self.assertEqual(cached.data["view_count"], 2)
+
+    def test_new_answer_invalidates_cache(self):
+        self.client.get(self.url)
+        student = self.users[1]
+        User.objects.filter(pk=student.pk).update(role=User.Role.STUDENT)
+        client = APIClient()
+        client.force_authenticate(user=User.objects.get(pk=student.pk))
+
+        response = client.post(f"{self.url}answers/", {"content": "새 답변"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(self.client.get(self.url).data["answers"]), 1)
+
+
+class QnADeletionTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="student@test.com",
+            password="password123!",
+            name="수강생",
+            nickname="student",
+            phone_number="01033334444",
+        )
+        category = QuestionCategory.objects.create(name="Django", category_type="minor")
+        self.question = Question.objects.create(category=category, author=self.user, title="질문", content="내용")
+        QuestionImage.objects.create(
+            question=self.question, img_url="https://b/q.png", thumbnail_url="https://b/q_thumb.webp"
+        )
+        QuestionAIAnswer.objects.create(question=self.question, content="AI 답변")
+        for i in range(30):
+            answer = Answer.objects.create(question=self.question, author=self.user, content=f"답변 {i}")
+            AnswerComment.objects.bulk_create(
+                [AnswerComment(answer=answer, author=self.user, content="댓글") for _ in range(3)]
+            )
+            AnswerImage.objects.create(answer=answer, img_url=f"https://b/a{i}.png")
+
+    def test_image_urls_include_variants(self):
+        urls = _image_urls(QuestionImage.objects.all(), AnswerImage.objects.all())
+        self.assertEqual(len(urls), 32)
+        self.assertIn("https://b/q_thumb.webp", urls)
+
+    def test_question_delete_runs_constant_statements(self):
+        with self.captureOnCommitCallbacks() as callbacks, CaptureQueriesContext(connection) as queries:
+            counts = delete_question_tree(self.question.id)
+
+        self.assertEqual(
+            counts,
+            {
+                "answers_count": 30,
+                "answer_comments_count": 90,
+                "answer_images_count": 30,
+                "question_images_count": 1,
+                "question_ai_answers_count": 1,
+            },
+        )
+        # 집계 1 + 이미지 URL 1 + DELETE 6 (답변 수와 무관)
+        statements = [q for q in queries.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(statements), 8)
+        self.assertFalse(Question.objects.filter(pk=self.question.id).exists())
+        self.assertFalse(Answer.objects.exists() or AnswerComment.objects.exists() or AnswerImage.objects.exists())
+        self.assertEqual(len(callbacks), 1)
+
+    def test_answer_delete(self):
+        answer = self.question.answers.first()
+        with self.captureOnCommitCallbacks() as callbacks:
+            counts = delete_answer_tree(answer.id)
+
+        self.assertEqual(counts, {"comments_count": 3, "images_count": 1})
+        self.assertEqual(self.question.answers.count(), 29)
+        self.assertEqual(len(callbacks), 1)
+
+
+class AdoptAnswerTestCase(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            email="student@test.com",
+            password="password123!",
+            name="수강생",
+            nickname="student",
+            phone_number="01033334444",
+            role=User.Role.STUDENT,
+        )
+        category = QuestionCategory.objects.create(name="Django", category_type="minor")
+        self.question = Question.objects.create(category=category, author=self.author, title="질문", content="내용")
+        self.answers = [
+            Answer.objects.create(question=self.question, author=self.author, content=f"답변 {i}") for i in range(2)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+
+    def _adopt(self, answer):
+        return self.client.post(f"/api/v1/qna/questions/{self.question.id}/answers/{answer.id}/adopt/")
+
+    def test_adopt_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._adopt(self.answers[0])
+        self.assertEqual(response.status_code, 200)
+        # 질문 행 잠금 1 + 조건부 UPDATE 1
+        statements = [q["sql"] for q in queries.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[0].endswith("FOR UPDATE"))
+        self.assertTrue(statements[1].startswith("UPDATE"))
+
+        detail = self.client.get(f"/api/v1/qna/questions/{self.question.id}/")
+        self.assertTrue(detail.data["has_adopted_answer"])
+        self.assertEqual(self._adopt(self.answers[0]).data, AnswerErrorMessages.ANSWER_ALREADY_ADOPTED)
+        self.assertEqual(self._adopt(self.answers[1]).data, AnswerErrorMessages.ADOPTED_ANSWER_ALREADY_EXISTS)
+        self.assertEqual(Answer.objects.filter(is_adopted=True).count(), 1)
+
+    def test_only_question_author_can_adopt(self):
+        other = User.objects.create_user(
+            email="other@test.com",
+            password="password123!",
+            name="다른학생",
+            nickname="other",
+            phone_number="01055556666",
+            role=User.Role.STUDENT,
+        )
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self._adopt(self.answers[0]).status_code, 403)
+        self.assertFalse(Answer.objects.filter(is_adopted=True).exists())
+
+    def test_partial_unique_index_blocks_second_adoption(self):
+        Answer.objects.filter(pk=self.answers[0].pk).update(is_adopted=True)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Answer.objects.filter(pk=self.answers[1].pk).update(is_adopted=True)
+
+    def test_deleting_adopted_answer_allows_new_adoption(self):
+        self._adopt(self.answers[0])
+        delete_answer_tree(self.answers[0].id)
+        self.assertEqual(self._adopt(self.answers[1]).status_code, 200)
+
+    def test_cascade_deleted_adopted_answer_allows_new_adoption(self):
+        answerer = User.objects.create_user(
+            email="answerer@test.com",
+            password="password123!",
+            name="답변자",
+            nickname="answerer",
+            phone_number="01077778888",
+        )
+        adopted = Answer.objects.create(question=self.question, author=answerer, content="채택될 답변")
+        self.assertEqual(self._adopt(adopted).status_code, 200)
+
+        # 답변 작성자 탈퇴 등으로 답변이 함께 삭제되어도 다시 채택 가능
+        answerer.delete()
+        self.assertEqual(self._adopt(self.answers[1]).status_code, 200)
+
+
+class AdoptAnswerConcurrencyTestCase(TransactionTestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            email="student@test.com",
+            password="password123!",
+            name="수강생",
+            nickname="student",
+            phone_number="01033334444",
+            role=User.Role.STUDENT,
+        )
+        category = QuestionCategory.objects.create(name="Django", category_type="minor")
+        self.question = Question.objects.create(category=category, author=self.author, title="질문", content="내용")
+        self.answers = [
+            Answer.objects.create(question=self.question, author=self.author, content=f"답변 {i}") for i in range(2)
+        ]
+
+    def _adopt_in_thread(self, answer, results):
+        try:
+            results.append(adopt_answer(self.question.id, answer.id, self.author.id))
+        except Exception as e:
+            results.append(e)
+        finally:
+            connection.close()
+
+    def test_concurrent_adoption_rechecks_after_row_lock(self):
+        results = []
+        with transaction.atomic():
+            self.assertTrue(adopt_answer(self.question.id, self.answers[0].id, self.author.id))
+
+            worker = threading.Thread(target=self._adopt_in_thread, args=(self.answers[1], results))
+            worker.start()
+            worker.join(0.5)
+            # 다른 요청은 질문 행 잠금을 기다리는 중
+            self.assertTrue(worker.is_alive())
+        worker.join()
+
+        # 잠금이 풀린 뒤 미채택 조건을 다시 평가해서 실패 (예외 없이 False)
+        self.assertEqual(results, [False])
+        self.assertEqual(
+            list(Answer.objects.filter(is_adopted=True).values_list("id", flat=True)), [self.answers[0].id]
+        )
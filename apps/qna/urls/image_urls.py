@@ -1,9 +1,16 @@
 from django.urls import path
 
-from apps.qna.views.image_views import ImageDeleteAPIView, ImageUploadAPIView
+from apps.qna.views.image_views import (
+    ImageDeleteAPIView,
+    ImagePresignedCompleteAPIView,
+    ImagePresignedUploadAPIView,
+    ImageUploadAPIView,
+)
 
 urlpatterns = [
     # image
     path("images/upload/", ImageUploadAPIView.as_view()),
+    path("images/presigned/", ImagePresignedUploadAPIView.as_view()),
+    path("images/presigned/complete/", ImagePresignedCompleteAPIView.as_view()),
     path("images/delete/", ImageDeleteAPIView.as_view()),
 ]
@@ -0,0 +1,27 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Exists
+from django.utils import timezone
+
+from apps.qna.models import Answer, Question
+
+
+def adopt_answer(question_id: int, answer_id: int, author_id: int) -> bool:
+    """질문 작성자의 답변 채택을 조건부 UPDATE 로 처리. 조건(작성자/미채택/답변 소속)이 맞지 않으면 False"""
+    try:
+        with transaction.atomic():
+            # 질문 행을 잠가서 같은 질문에 대한 동시 채택을 줄 세움 (작성자가 아니면 잠그지 않고 종료)
+            if not Question.objects.select_for_update().filter(pk=question_id, author_id=author_id).exists():
+                return False
+
+            # 잠금 이후 실행되는 새 문장이므로 먼저 커밋된 채택도 보고 판단
+            # (채택 여부는 답변 행에서만 관리하므로 답변이 어떤 경로로 삭제되어도 따로 맞출 값이 없음)
+            already_adopted = Answer.objects.filter(question_id=question_id, is_adopted=True)
+            adopted = (
+                Answer.objects.filter(pk=answer_id, question_id=question_id)
+                .filter(~Exists(already_adopted))
+                .update(is_adopted=True, updated_at=timezone.now())
+            )
+            return bool(adopted)
+    except IntegrityError:
+        # 질문 당 채택 답변 1개는 unique_adopted_answer_per_question 부분 인덱스로도 보장 → 이미 채택된 경우로 처리
+        return False
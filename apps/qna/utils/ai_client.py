@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 프로세스(워커) 당 동시에 진행할 수 있는 AI 요청 수
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", 20))
+# 질문 1건 처리에 허용하는 전체 시간 (대기열 + 응답 스트리밍, 초)
+AI_REQUEST_TIMEOUT = float(os.getenv("AI_REQUEST_TIMEOUT", 90))
+
+AI_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+AI_HTTP_LIMITS = httpx.Limits(max_connections=AI_MAX_CONCURRENCY, max_keepalive_connections=AI_MAX_CONCURRENCY)
+
+QueueCallback = Callable[[int], Awaitable[None]]
+
+
+class AIClientManager:
+    """프로세스 전역 AI 클라이언트 관리자 (공유 커넥션 풀 + 세마포어 기반 동시 요청 제한)"""
+
+    def __init__(self, max_concurrency: int = AI_MAX_CONCURRENCY) -> None:
+        self.max_concurrency = max_concurrency
+        self.waiting = 0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _ensure_loop(self) -> None:
+        # 클라이언트/세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        old_client, old_loop = self._client, self._loop
+
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # HTTP/2 (httpx[http2]) 로 하나의 연결에서 여러 요청을 동시에 처리
+        self._client = httpx.AsyncClient(http2=True, timeout=AI_HTTP_TIMEOUT, limits=AI_HTTP_LIMITS)
+        self.waiting = 0
+
+        # 이전 루프의 클라이언트는 커넥션이 남지 않도록 닫는다 (그 루프가 아직 돌고 있으면 그 루프에서)
+        if old_client is not None:
+            if old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+            else:
+                try:
+                    await old_client.aclose()
+                except Exception as e:
+                    logger.warning(f"[AIClient] 이전 이벤트 루프의 클라이언트 종료 실패: {e}")
+
+    @asynccontextmanager
+    async def slot(self, on_queued: Optional[QueueCallback] = None) -> AsyncIterator[httpx.AsyncClient]:
+        """요청 슬롯을 얻을 때까지 대기 후 공유 클라이언트를 반환. 대기하게 되면 on_queued(대기 순번) 호출"""
+        await self._ensure_loop()
+        assert self._semaphore is not None and self._client is not None
+
+        if self._semaphore.locked():
+            self.waiting += 1
+            try:
+                if on_queued:
+                    await on_queued(self.waiting)
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        try:
+            yield self._client
+        finally:
+            self._semaphore.release()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+
+ai_client_manager = AIClientManager()
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, cast
+
+from core.utils.redis_async import get_async_redis
+
+# AI 답변 캐시 유효 시간 (기본 1일)
+AI_ANSWER_CACHE_TTL = int(os.getenv("AI_ANSWER_CACHE_TTL", 60 * 60 * 24))
+# 정확히 일치하지 않아도 비슷한 질문(MinHash 유사도)이면 캐시된 답변 사용
+# 다른 질문의 답변이 나갈 수 있으므로 기본은 꺼 두고 필요한 배포 환경에서만 켠다
+AI_ANSWER_CACHE_NEAR_DUPLICATE = os.getenv("AI_ANSWER_CACHE_NEAR_DUPLICATE", "False") == "True"
+AI_ANSWER_CACHE_SIMILARITY = float(os.getenv("AI_ANSWER_CACHE_SIMILARITY", 0.8))
+
+# MinHash 서명 길이 = LSH 밴드 수 * 밴드 당 행 수
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+MINHASH_NUM_PERM = MINHASH_BANDS * MINHASH_ROWS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.sha1(f"a{i}".encode()).digest()[:8], "big") % (_MERSENNE_PRIME - 1) + 1,
+        int.from_bytes(hashlib.sha1(f"b{i}".encode()).digest()[:8], "big") % _MERSENNE_PRIME,
+    )
+    for i in range(MINHASH_NUM_PERM)
+]
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_PUNCTUATION_PATTERN = re.compile(r"[\s?!.~]+$")
+
+ANSWER_KEY = "ai_answer_cache:answer:{prompt_hash}"
+LSH_BUCKET_KEY = "ai_answer_cache:lsh:{band}:{bucket}"
+HIT_KEY = "ai_answer_cache:hits"
+NEAR_HIT_KEY = "ai_answer_cache:near_hits"
+MISS_KEY = "ai_answer_cache:misses"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """대소문자, 전각/반각, 공백, 끝의 물음표 등 표현 차이를 제거한 질문 문자열"""
+    text = unicodedata.normalize("NFKC", prompt).lower()
+    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION_PATTERN.sub("", text)
+
+
+def prompt_hash(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def minhash_signature(normalized: str) -> List[int]:
+    """글자 단위 shingle 의 MinHash 서명 (한글 질문도 띄어쓰기와 무관하게 비교할 수 있도록 공백 제거)"""
+    text = normalized.replace(" ", "")
+    shingles = {text[i : i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))}
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles]
+
+    return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def _lsh_bucket_keys(signature: List[int]) -> List[str]:
+    keys = []
+    for band in range(MINHASH_BANDS):
+        rows = signature[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS]
+        bucket = hashlib.blake2b(",".join(map(str, rows)).encode(), digest_size=8).hexdigest()
+        keys.append(LSH_BUCKET_KEY.format(band=band, bucket=bucket))
+    return keys
+
+
+def _similarity(a: List[int], b: List[int]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / MINHASH_NUM_PERM
+
+
+def _decode_signature(raw: str) -> List[int]:
+    return [int(value) for value in raw.split(",")]
+
+
+async def get_cached_answer(prompt: str) -> Optional[str]:
+    """같거나 충분히 비슷한 질문의 캐시된 답변을 반환. 없으면 None"""
+    redis = get_async_redis()
+    normalized = normalize_prompt(prompt)
+
+    answer = await redis.hget(ANSWER_KEY.format(prompt_hash=prompt_hash(normalized)), "answer")
+    if answer is not None:
+        await redis.incr(HIT_KEY)
+        return cast(str, answer)
+
+    if AI_ANSWER_CACHE_NEAR_DUPLICATE:
+        signature = minhash_signature(normalized)
+        candidates = await redis.sunion(_lsh_bucket_keys(signature))
+        if candidates:
+            pipe = redis.pipeline(transaction=False)
+            for candidate in candidates:
+                pipe.hmget(ANSWER_KEY.format(prompt_hash=candidate), "answer", "signature")
+            best_score, best_answer = 0.0, None
+            for cached_answer, cached_signature in await pipe.execute():
+                if cached_answer is None or cached_signature is None:
+                    continue
+                score = _similarity(signature, _decode_signature(cached_signature))
+                if score > best_score:
+                    best_score, best_answer = score, cached_answer
+            if best_answer is not None and best_score >= AI_ANSWER_CACHE_SIMILARITY:
+                await redis.incr(NEAR_HIT_KEY)
+                return best_answer
+
+    await redis.incr(MISS_KEY)
+    return None
+
+
+async def store_answer(prompt: str, answer: str) -> None:
+    """질문-답변 쌍을 TTL 과 함께 저장하고, 유사 질문 검색용 LSH 버킷에 등록"""
+    redis = get_async_redis()
+    normalized = normalize_prompt(prompt)
+    key = prompt_hash(normalized)
+    signature = minhash_signature(normalized)
+
+    pipe = redis.pipeline(transaction=False)
+    answer_key = ANSWER_KEY.format(prompt_hash=key)
+    pipe.hset(answer_key, mapping={"answer": answer, "signature": ",".join(map(str, signature))})
+    pipe.expire(answer_key, AI_ANSWER_CACHE_TTL)
+    if AI_ANSWER_CACHE_NEAR_DUPLICATE:
+        for bucket_key in _lsh_bucket_keys(signature):
+            pipe.sadd(bucket_key, key)
+            pipe.expire(bucket_key, AI_ANSWER_CACHE_TTL)
+    await pipe.execute()
+
+
+async def get_answer_cache_stats() -> Dict[str, int]:
+    """캐시 적중/미적중 횟수"""
+    redis = get_async_redis()
+    hits, near_hits, misses = await redis.mget(HIT_KEY, NEAR_HIT_KEY, MISS_KEY)
+    return {"hits": int(hits or 0), "near_hits": int(near_hits or 0), "misses": int(misses or 0)}
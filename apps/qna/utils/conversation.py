@@ -0,0 +1,152 @@
+import asyncio
+import json
+import math
+import os
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+
+from apps.qna.utils.ai_client import ai_client_manager
+from apps.qna.utils.gemini import stream_gemini
+from core.utils.redis_async import get_async_redis
+
+Turn = Dict[str, str]
+Summarizer = Callable[[str, List[Turn]], Awaitable[str]]
+
+# 요청에 포함할 이전 대화(요약 제외)의 최대 토큰 수. 넘으면 오래된 대화부터 요약으로 합친다
+CONVERSATION_TOKEN_BUDGET = int(os.getenv("AI_CONVERSATION_TOKEN_BUDGET", 1500))
+CONVERSATION_SUMMARY_MAX_CHARS = 600
+CONVERSATION_SUMMARY_TIMEOUT = 10.0
+CONVERSATION_TTL = 60 * 60 * 24
+
+TURNS_KEY = "ai_conversation:{session_key}:turns"
+SUMMARY_KEY = "ai_conversation:{session_key}:summary"
+
+SUMMARY_PROMPT = (
+    "다음은 개발 질문 챗봇과 사용자의 이전 대화입니다. 이후 질문에 답할 때 필요한 핵심 내용만 "
+    f"{CONVERSATION_SUMMARY_MAX_CHARS}자 이내의 한국어로 요약하세요."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 대략적인 토큰 수 (UTF-8 4바이트 ≈ 1토큰, 한글은 글자당 약 0.75토큰)"""
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def count_tokens(turns: List[Turn]) -> int:
+    return sum(estimate_tokens(turn["text"]) for turn in turns)
+
+
+def build_contents(summary: str, turns: List[Turn], prompt: str) -> List[Dict]:
+    """Gemini 요청 contents 구성: 이전 대화 요약 -> 최근 대화 -> 이번 질문
+
+    Gemini 는 user/model 이 번갈아 와야 하므로 같은 역할이 이어지면 (요약 + 첫 질문, 답변 없이 끝난 질문 + 이번 질문)
+    하나의 턴에 parts 로 합치고, 요약 없이 model 로 시작하는 대화는 앞의 model 턴을 버린다
+    """
+    messages: List[Turn] = []
+    if summary:
+        messages.append({"role": "user", "text": f"이전 대화 요약: {summary}"})
+    messages.extend(turns)
+    messages.append({"role": "user", "text": prompt})
+
+    contents: List[Dict] = []
+    for message in messages:
+        if contents and contents[-1]["role"] == message["role"]:
+            contents[-1]["parts"].append({"text": message["text"]})
+        elif contents or message["role"] == "user":
+            contents.append({"role": message["role"], "parts": [{"text": message["text"]}]})
+    return contents
+
+
+def build_payload(system_prompt: str, summary: str, turns: List[Turn], prompt: str) -> Dict:
+    """Gemini 요청 본문. 시스템 프롬프트는 대화 턴이 아닌 systemInstruction 으로 전달"""
+    return {
+        "systemInstruction": {"parts": [{"text": system_prompt}]},
+        "contents": build_contents(summary, turns, prompt),
+    }
+
+
+def split_overflow(turns: List[Turn], budget: int = CONVERSATION_TOKEN_BUDGET) -> Tuple[List[Turn], List[Turn]]:
+    """예산을 넘으면 (요약할 오래된 대화, 남길 최근 대화) 로 분리. 최근 대화는 예산의 절반까지 질문/답변 쌍 단위로 남긴다"""
+    if count_tokens(turns) <= budget:
+        return [], turns
+
+    keep_from = len(turns)
+    used = 0
+    for index in range(len(turns) - 2, -1, -2):
+        pair_tokens = count_tokens(turns[index : index + 2])
+        if used + pair_tokens > budget // 2:
+            break
+        used += pair_tokens
+        keep_from = index
+    return turns[:keep_from], turns[keep_from:]
+
+
+async def extractive_summary(summary: str, turns: List[Turn]) -> str:
+    """모델 호출 없이 만드는 요약 (이전 요약 + 질문 앞부분). 모델 요약 실패 시 대체용"""
+    questions = [f"Q: {turn['text'][:80]}" for turn in turns if turn["role"] == "user"]
+    merged = "\n".join(filter(None, [summary, *questions]))
+    return merged[-CONVERSATION_SUMMARY_MAX_CHARS:]
+
+
+async def gemini_summary(summary: str, turns: List[Turn]) -> str:
+    """Gemini 로 이전 요약과 오래된 대화를 다시 요약. 실패하면 추출 요약으로 대체"""
+    dialogue = "\n".join(f"{'사용자' if turn['role'] == 'user' else 'AI'}: {turn['text']}" for turn in turns)
+    text = f"{SUMMARY_PROMPT}\n\n기존 요약: {summary or '(없음)'}\n\n대화:\n{dialogue}"
+    payload = {"contents": [{"role": "user", "parts": [{"text": text}]}]}
+
+    try:
+        async with asyncio.timeout(CONVERSATION_SUMMARY_TIMEOUT):
+            async with ai_client_manager.slot() as client:
+                result = "".join([chunk async for chunk in stream_gemini(client, payload)])
+    except (TimeoutError, httpx.HTTPError):
+        result = ""
+
+    return result[:CONVERSATION_SUMMARY_MAX_CHARS] if result else await extractive_summary(summary, turns)
+
+
+async def compact(summary: str, turns: List[Turn], summarize: Summarizer) -> Tuple[str, List[Turn]]:
+    """예산을 넘은 오래된 대화를 요약에 합치고 (새 요약, 남은 대화) 반환"""
+    overflow, keep = split_overflow(turns)
+    if not overflow:
+        return summary, turns
+    return await summarize(summary, overflow), keep
+
+
+async def load_conversation(session_key: str) -> Tuple[str, List[Turn]]:
+    """세션의 (이전 대화 요약, 최근 대화 목록) 조회"""
+    pipe = get_async_redis().pipeline(transaction=False)
+    pipe.get(SUMMARY_KEY.format(session_key=session_key))
+    pipe.lrange(TURNS_KEY.format(session_key=session_key), 0, -1)
+    summary, turns = await pipe.execute()
+    return summary or "", [json.loads(turn) for turn in turns]
+
+
+async def append_turn(
+    session_key: str, prompt: str, answer: str, summarize: Summarizer = gemini_summary
+) -> Tuple[str, List[Turn]]:
+    """질문/답변을 대화 목록에 추가하고, 예산을 넘으면 오래된 대화를 요약으로 합친다"""
+    redis = get_async_redis()
+    turns_key = TURNS_KEY.format(session_key=session_key)
+    summary_key = SUMMARY_KEY.format(session_key=session_key)
+    new_turns = [{"role": "user", "text": prompt}, {"role": "model", "text": answer}]
+
+    pipe = redis.pipeline(transaction=False)
+    pipe.rpush(turns_key, *[json.dumps(turn, ensure_ascii=False) for turn in new_turns])
+    pipe.expire(turns_key, CONVERSATION_TTL)
+    pipe.get(summary_key)
+    pipe.lrange(turns_key, 0, -1)
+    _, _, summary, raw_turns = await pipe.execute()
+    summary = summary or ""
+    turns = [json.loads(turn) for turn in raw_turns]
+
+    new_summary, keep = await compact(summary, turns, summarize)
+    if len(keep) == len(turns):
+        return summary, turns
+
+    # 요약에 합친 만큼 앞에서부터 제거 (요약 중 추가된 대화는 유지)
+    pipe = redis.pipeline(transaction=False)
+    pipe.ltrim(turns_key, len(turns) - len(keep), -1)
+    pipe.set(summary_key, new_summary, ex=CONVERSATION_TTL)
+    await pipe.execute()
+    return new_summary, keep
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List
+
+from django.db import transaction
+from django.db.models import CharField, Count, IntegerField, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.qna.models import (
+    Answer,
+    AnswerComment,
+    AnswerImage,
+    Question,
+    QuestionAIAnswer,
+    QuestionImage,
+)
+from apps.qna.tasks import delete_qna_image_files
+
+
+def _count(queryset: QuerySet[Any]) -> Coalesce:
+    """queryset 의 행 수를 스칼라 서브쿼리로 (다른 집계와 한 쿼리에서 계산)"""
+    counts = queryset.order_by().values(group=Value(1)).annotate(count=Count("*")).values("count")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _counts(queryset: QuerySet[Any], **subqueries: Coalesce) -> Dict[str, int]:
+    """여러 테이블의 삭제 대상 수를 SELECT 한 번으로 조회"""
+    return queryset.values(**subqueries).first() or dict.fromkeys(subqueries, 0)
+
+
+def _raw_delete(queryset: QuerySet[Any]) -> int:
+    # Collector 를 거치지 않고 DELETE 문 한 번으로 삭제 (객체 로딩/시그널 없음, 하위 테이블부터 호출해야 함)
+    return queryset._raw_delete(queryset.db)  # type: ignore[attr-defined]
+
+
+def _image_urls(question_images: QuerySet[QuestionImage], answer_images: QuerySet[AnswerImage]) -> List[str]:
+    """질문 이미지(원본/변환본)와 답변 이미지 URL 을 UNION ALL 한 번으로 조회"""
+    # AnswerImage 에는 변환본이 없으므로 NULL 로 열 수를 맞춘다
+    empty = Value(None, output_field=CharField())
+    rows = (
+        question_images.order_by()
+        .values_list("img_url", "thumbnail_url", "webp_url")
+        .union(answer_images.order_by().values_list("img_url", empty, empty), all=True)
+    )
+    return [url for row in rows for url in row if url]
+
+
+def _enqueue_file_cleanup(image_urls: List[str]) -> None:
+    if image_urls:
+        transaction.on_commit(lambda: delete_qna_image_files.delay(image_urls), robust=True)
+
+
+def delete_question_tree(question_id: int) -> Dict[str, int]:
+    """질문과 답변/댓글/이미지/AI 답변을 하위 테이블부터 일괄 삭제하고 삭제된 수 반환. S3 이미지는 커밋 후 Celery 에서 삭제"""
+    answers = Answer.objects.filter(question_id=question_id)
+    answer_comments = AnswerComment.objects.filter(answer__question_id=question_id)
+    answer_images = AnswerImage.objects.filter(answer__question_id=question_id)
+    question_images = QuestionImage.objects.filter(question_id=question_id)
+    question_ai_answers = QuestionAIAnswer.objects.filter(question_id=question_id)
+
+    deleted_counts = _counts(
+        Question.objects.filter(pk=question_id),
+        answers_count=_count(answers),
+        answer_comments_count=_count(answer_comments),
+        answer_images_count=_count(answer_images),
+        question_images_count=_count(question_images),
+        question_ai_answers_count=_count(question_ai_answers),
+    )
+
+    image_urls = _image_urls(question_images, answer_images)
+
+    with transaction.atomic():
+        _raw_delete(answer_comments)
+        _raw_delete(answer_images)
+        _raw_delete(answers)
+        _raw_delete(question_images)
+        _raw_delete(question_ai_answers)
+        _raw_delete(Question.objects.filter(pk=question_id))
+        _enqueue_file_cleanup(image_urls)
+
+    return deleted_counts
+
+
+def delete_answer_tree(answer_id: int) -> Dict[str, int]:
+    """답변과 댓글/이미지를 일괄 삭제하고 삭제된 수 반환. S3 이미지는 커밋 후 Celery 에서 삭제"""
+    comments = AnswerComment.objects.filter(answer_id=answer_id)
+    images = AnswerImage.objects.filter(answer_id=answer_id)
+
+    deleted_counts = _counts(
+        Answer.objects.filter(pk=answer_id), comments_count=_count(comments), images_count=_count(images)
+    )
+    image_urls = list(images.values_list("img_url", flat=True))
+
+    with transaction.atomic():
+        _raw_delete(comments)
+        _raw_delete(images)
+        _raw_delete(Answer.objects.filter(pk=answer_id))
+        _enqueue_file_cleanup(image_urls)
+
+    return deleted_counts
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_API_URL = os.getenv("GEMINI_API_URL", "")
+# 스트리밍 엔드포인트 (별도 설정이 없으면 generateContent -> streamGenerateContent 로 변환해서 사용)
+GEMINI_STREAM_API_URL = os.getenv("GEMINI_STREAM_API_URL") or GEMINI_API_URL.replace(
+    ":generateContent", ":streamGenerateContent"
+)
+
+# 웹소켓 프레임 하나에 모아 보낼 최대 글자 수 / 최대 대기 시간(초)
+STREAM_FRAME_MAX_CHARS = 64
+STREAM_FRAME_MAX_INTERVAL = 0.05
+
+GEMINI_FALLBACK_MESSAGE = "죄송합니다. 답변을 생성하지 못했습니다."
+
+
+def extract_text(chunk: Dict[str, Any]) -> str:
+    """Gemini 응답(JSON) 에서 텍스트 부분만 추출"""
+    candidates = chunk.get("candidates") or [{}]
+    parts = candidates[0].get("content", {}).get("parts") or [{}]
+    return "".join(part.get("text", "") for part in parts)
+
+
+async def stream_gemini(
+    client: httpx.AsyncClient, payload: Dict[str, Any], url: Optional[str] = None
+) -> AsyncIterator[str]:
+    """streamGenerateContent(SSE) 응답을 받는 즉시 텍스트 조각 단위로 반환"""
+    async with client.stream(
+        "POST",
+        url or GEMINI_STREAM_API_URL,
+        params={"alt": "sse", "key": GEMINI_API_KEY},
+        json=payload,
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        response.raise_for_status()
+
+        async for line in response.aiter_lines():
+            # SSE 형식: "data: {...}" 라인만 사용 (빈 줄, 주석 등은 무시)
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if not data or data == "[DONE]":
+                continue
+
+            text = extract_text(json.loads(data))
+            if text:
+                yield text
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[str],
+    max_chars: int = STREAM_FRAME_MAX_CHARS,
+    max_interval: float = STREAM_FRAME_MAX_INTERVAL,
+) -> AsyncIterator[str]:
+    """작은 텍스트 조각들을 글자 수/시간 기준으로 묶어서 반환 (첫 조각은 바로 전송)"""
+    buffer = ""
+    last_sent: Optional[float] = None
+
+    async for chunk in chunks:
+        buffer += chunk
+        now = time.monotonic()
+        if last_sent is None or len(buffer) >= max_chars or now - last_sent >= max_interval:
+            yield buffer
+            buffer = ""
+            last_sent = now
+
+    if buffer:
+        yield buffer
@@ -0,0 +1,5 @@
+from apps.qna.models import QuestionImage
+from core.utils.image_variants import ImageVariantGenerator
+
+# 질문 목록 썸네일/본문용 WebP 변환본
+question_image_variants = ImageVariantGenerator(QuestionImage, "img_url")
@@ -0,0 +1,13 @@
+from apps.qna.models import AnswerImage, QuestionImage
+from core.utils.s3_gc import S3OrphanCollector
+
+# 질문/답변 본문에서 더 이상 참조하지 않는 QnA 이미지
+qna_image_collector = S3OrphanCollector(
+    prefixes=["qna/images/"],
+    sources=[
+        (QuestionImage, "img_url"),
+        (QuestionImage, "thumbnail_url"),
+        (QuestionImage, "webp_url"),
+        (AnswerImage, "img_url"),
+    ],
+)
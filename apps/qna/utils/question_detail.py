@@ -0,0 +1,45 @@
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+from django.db.models import Prefetch, QuerySet
+
+from apps.qna.models import Answer, AnswerComment, Question
+from apps.qna.serializers.questions_serializers import QuestionDetailSerializer
+
+QUESTION_DETAIL_CACHE_KEY = "question_detail:{question_id}"
+QUESTION_DETAIL_CACHE_TIMEOUT = 60 * 5
+
+
+def get_question_detail_queryset() -> QuerySet[Question]:
+    """질문 상세 조회에 필요한 연관 데이터를 한 번에 가져오는 쿼리셋 (질문 1 + 이미지 1 + 답변 1 + 댓글 1)"""
+    comments = AnswerComment.objects.select_related("author").order_by("created_at", "id")
+    answers = (
+        Answer.objects.select_related("author")
+        .prefetch_related(Prefetch("comments", queryset=comments))
+        .order_by("created_at", "id")
+    )
+    return Question.objects.select_related("author", "category__parent__parent").prefetch_related(
+        "images",
+        Prefetch("answers", queryset=answers),
+    )
+
+
+def get_question_detail_data(question_id: int) -> Optional[Dict[str, Any]]:
+    """직렬화된 질문 상세 데이터를 캐시에서 조회하고, 없으면 DB에서 만들어 캐싱. 질문이 없으면 None"""
+    cache_key = QUESTION_DETAIL_CACHE_KEY.format(question_id=question_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    question = get_question_detail_queryset().filter(pk=question_id).first()
+    if question is None:
+        return None
+
+    data = dict(QuestionDetailSerializer(question).data)
+    cache.set(cache_key, data, timeout=QUESTION_DETAIL_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_question_detail(question_id: int) -> None:
+    """질문/답변/댓글/이미지가 변경되면 해당 질문의 상세 캐시 삭제"""
+    cache.delete(QUESTION_DETAIL_CACHE_KEY.format(question_id=question_id))
@@ -1,16 +1,24 @@
-from django_redis import get_redis_connection  # type: ignore
+from core.utils.redis_async import get_async_redis
 
-redis = get_redis_connection("default")
+AI_COUNT_KEY = "ai_count:{session_key}"
+AI_COUNT_TTL = 60 * 60 * 24
 
+# 현재 횟수가 limit 미만일 때만 1 증가 (새로 만든 키에만 만료 시간 설정). 한도 초과 시 -1 반환
+CHECK_AND_INCREMENT_SCRIPT = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+if count >= tonumber(ARGV[1]) then
+    return -1
+end
+count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return count
+"""
 
-def get_ai_count(session_key: str) -> int:
-    return int(redis.get(f"ai_count:{session_key}") or 0)
 
-
-def increment_ai_count(session_key) -> None:
-    key = f"ai_count:{session_key}"
-    count = redis.incr(key)
-
-    # 새로 만든 키 만료 시간 설정 (기존 키 x)
-    if count == 1:
-        redis.expire(key, 60 * 60 * 24)
+async def check_and_increment_ai_count(session_key: str, limit: int) -> bool:
+    """질문 횟수가 limit 미만이면 1 증가시키고 True, 이미 한도에 도달했으면 False (GET/INCR 를 원자적으로 처리)"""
+    script = get_async_redis().register_script(CHECK_AND_INCREMENT_SCRIPT)
+    count = await script(keys=[AI_COUNT_KEY.format(session_key=session_key)], args=[limit, AI_COUNT_TTL])
+    return int(count) != -1
@@ -0,0 +1,5 @@
+from apps.qna.models import Question
+from core.utils.view_counter import ViewCountBuffer
+
+# 질문 상세 조회수 버퍼
+question_view_counter = ViewCountBuffer(Question, "question")
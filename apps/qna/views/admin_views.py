@@ -11,15 +11,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.qna.dummy import dummy
-from apps.qna.models import (
-    Answer,
-    AnswerComment,
-    AnswerImage,
-    Question,
-    QuestionAIAnswer,
-    QuestionCategory,
-    QuestionImage,
-)
+from apps.qna.models import Answer, Question, QuestionCategory
 from apps.qna.permissions import IsAdminPermission, IsStaffPermission
 from apps.qna.serializers.admin_serializers import (
     AdminCategoryCreateSerializer,
@@ -27,6 +19,8 @@ from apps.qna.serializers.admin_serializers import (
     AdminQuestionListPaginationSerializer,
     AdminQuestionListSerializer,
 )
+from apps.qna.utils.deletion import delete_answer_tree, delete_question_tree
+from apps.qna.utils.question_detail import invalidate_question_detail
 
 dummy.load_dummy_data()
 
@@ -310,30 +304,9 @@ class AdminQuestionDeleteView(APIView):
                 "created_at": question.created_at,
             }
 
-            answers = Answer.objects.filter(question=question)
-            answer_ids = list(answers.values_list("id", flat=True))
-
-            # 사전 삭제 수 카운트 (한 번의 filter 호출로 처리)
-            answer_comments_qs = AnswerComment.objects.filter(answer_id__in=answer_ids)
-            answer_images_qs = AnswerImage.objects.filter(answer_id__in=answer_ids)
-            question_images_qs = QuestionImage.objects.filter(question=question)
-            question_ai_answers_qs = QuestionAIAnswer.objects.filter(question=question)
-
-            deleted_counts = {
-                "answers_count": answers.count(),
-                "answer_comments_count": answer_comments_qs.count(),
-                "answer_images_count": answer_images_qs.count(),
-                "question_images_count": question_images_qs.count(),
-                "question_ai_answers_count": question_ai_answers_qs.count(),
-            }
+            deleted_counts = delete_question_tree(question.id)
 
-            with transaction.atomic():
-                answer_comments_qs.delete()
-                answer_images_qs.delete()
-                answers.delete()
-                question_images_qs.delete()
-                question_ai_answers_qs.delete()
-                question.delete()
+            invalidate_question_detail(question_id)
 
             return Response(
                 {
@@ -381,26 +354,16 @@ class AdminAnswerDeleteView(APIView):
                 "created_at": answer.created_at,
             }
 
-            answer_comments_qs = AnswerComment.objects.filter(answer=answer)
-            answer_images_qs = AnswerImage.objects.filter(answer=answer)
+            deleted_counts = delete_answer_tree(answer.id)
 
-            deleted_comments_count = answer_comments_qs.count()
-            deleted_images_count = answer_images_qs.count()
-
-            with transaction.atomic():
-                answer_comments_qs.delete()
-                answer_images_qs.delete()
-                answer.delete()
+            invalidate_question_detail(answer.question_id)
 
             return Response(
                 {
                     "success": True,
                     "message": "답변이 성공적으로 삭제되었습니다.",
                     "deleted_answer": answer_info,
-                    "deleted_related_data": {
-                        "comments_count": deleted_comments_count,
-                        "images_count": deleted_images_count,
-                    },
+                    "deleted_related_data": deleted_counts,
                 },
                 status=status.HTTP_200_OK,
             )
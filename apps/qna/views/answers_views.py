@@ -17,6 +17,8 @@ from apps.qna.serializers.answers_serializers import (
     AnswerListSerializer,
     AnswerUpdateSerializer,
 )
+from apps.qna.utils.adopt import adopt_answer
+from apps.qna.utils.question_detail import invalidate_question_detail
 from apps.users.models import User
 
 
@@ -44,6 +46,7 @@ class AnswerCreateView(APIView):
 
         # Serializer에서 답변 생성 및 이미지 처리
         answer = serializer.save(question=question, author=user)
+        invalidate_question_detail(question.id)
 
         # 응답 데이터 구성
         response_data = AnswerListSerializer(answer).data
@@ -81,6 +84,7 @@ class AnswerUpdateView(APIView):
 
         # Serializer에서 답변 수정 및 이미지 처리
         updated_answer = serializer.save()
+        invalidate_question_detail(question.id)
 
         # 응답 데이터 구성
         response_data = AnswerListSerializer(updated_answer).data
@@ -102,32 +106,29 @@ class AdoptAnswerView(APIView):
     def post(self, request: Request, question_id: int, answer_id: int) -> Response:
         user = cast(User, request.user)
 
-        # 채택할 답변 가져오기
-        question = Question.objects.filter(pk=question_id).first()
+        # 답변 채택 (성공하면 UPDATE 만으로 끝남)
+        if adopt_answer(question_id, answer_id, user.id):
+            invalidate_question_detail(question_id)
+            return Response(AnswerSuccessMessages.ANSWER_ADOPTED, status=status.HTTP_200_OK)
+
+        # 채택되지 않은 경우에만 원인 확인
+        question = Question.objects.filter(pk=question_id).values("author_id").first()
         if not question:
             return Response(AnswerErrorMessages.QUESTION_NOT_FOUND, status=status.HTTP_404_NOT_FOUND)
-        answer = Answer.objects.filter(pk=answer_id, question=question).first()
+        answer = Answer.objects.filter(pk=answer_id, question_id=question_id).values("is_adopted").first()
         if not answer:
             return Response(AnswerErrorMessages.ANSWER_NOT_FOUND, status=status.HTTP_404_NOT_FOUND)
 
         # 권한 확인 : 질문 작성자가 아닌 경우
-        if question.author != user:
+        if question["author_id"] != user.id:
             return Response(AnswerErrorMessages.QUESTION_AUTHOR_ADOPT_ONLY, status=status.HTTP_403_FORBIDDEN)
 
-        # 이미 채택된 답변이 존재하는 경우
-        if question.answers.filter(is_adopted=True).exists():
-            return Response(AnswerErrorMessages.ADOPTED_ANSWER_ALREADY_EXISTS, status=status.HTTP_400_BAD_REQUEST)
-
         # 이 답변이 이미 채택된 답변인경우
-        if answer.is_adopted:
+        if answer["is_adopted"]:
             return Response(AnswerErrorMessages.ANSWER_ALREADY_ADOPTED, status=status.HTTP_400_BAD_REQUEST)
 
-        # 답변 채택
-        answer.is_adopted = True
-        answer.save()
-
-        # 응답 데이터 구성
-        return Response(AnswerSuccessMessages.ANSWER_ADOPTED, status=status.HTTP_200_OK)
+        # 이미 채택된 다른 답변이 존재하는 경우
+        return Response(AnswerErrorMessages.ADOPTED_ANSWER_ALREADY_EXISTS, status=status.HTTP_400_BAD_REQUEST)
 
 
 class AnswerCommentCreateView(APIView):
@@ -156,6 +157,7 @@ class AnswerCommentCreateView(APIView):
             author=user,
             content=serializer.validated_data["content"],
         )
+        invalidate_question_detail(answer.question_id)
 
         # 응답 데이터 구성
         return Response(AnswerSuccessMessages.COMMENT_CREATED, status=status.HTTP_201_CREATED)
@@ -1,23 +1,35 @@
 import time
 import uuid
 
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.qna.models import Question, QuestionImage
 from apps.qna.permissions import (
     IsStudentOrStaffOrAdminPermission,
     IsStudentOrStaffPermission,
     IsStudentPermission,
 )
 from apps.qna.serializers.images_serializers import (
+    QNA_IMAGE_UPLOAD_POLICY,
+    QUESTION_IMAGE_MAX_COUNT,
     ImageFileDeleteSerializer,
     ImageFileUploadSerializer,
+    ImagePresignedCompleteSerializer,
+    ImagePresignedUploadSerializer,
 )
+from apps.qna.tasks import generate_question_image_variants
+from apps.qna.utils.question_detail import invalidate_question_detail
+from core.utils.image_variants import enqueue_image_variants
 from core.utils.s3_file_upload import S3Uploader
 
+QUESTION_IMAGE_LIMIT_ERROR = {"detail": f"이미지는 최대 {QUESTION_IMAGE_MAX_COUNT}개까지만 업로드할 수 있습니다."}
+
 
 class ImageUploadAPIView(APIView):
     serializer_class = ImageFileUploadSerializer
@@ -45,34 +57,26 @@ class ImageUploadAPIView(APIView):
         serializer = self.serializer_class(data=data)
         serializer.is_valid(raise_exception=True)
 
-        s3_img_urls = []
-        failed_images = []
+        images = serializer.validated_data.get("image_files", [])
+        uploads = []
         # Unique 한 이름으로 저장
-        for img in serializer.validated_data.get("image_files", []):
+        for img in images:
             file_extension = img.name.split(".")[-1] if "." in img.name else "jpg"
             timestamp = int(time.time() * 1000)
             unique_id = str(uuid.uuid4())[:8]  # UUID의 앞 8자리만 사용
             filename = f"qna_image_{timestamp}_{unique_id}.{file_extension}"
             # TODO: 다른 기능 팀이랑 s3 파일 경로 컨벤션 상의 필요
             s3_key = f"qna/images/{filename}"
-            # 저장 시도
-            try:
-                img_url = self.s3uploader.upload_file(img, s3_key)
-                if img_url:  # 성공해서 url이 생기면
-                    s3_img_urls.append(img_url)
-                else:
-                    failed_images.append(img.name)
-            except:
-                failed_images.append(img.name)
-
-        # 실패한 파일이 있으면 업로드된 모든 파일 삭제
-        if failed_images:
-            # 업로드된 파일들 삭제
-            for img_url in s3_img_urls:
-                try:
-                    self.s3uploader.delete_file(img_url)
-                except Exception as e:
-                    print(f"Error deleting {img_url}: {e}")
+            uploads.append((img, s3_key))
+
+        # 모든 이미지를 동시에 업로드 (전체 소요 시간 ≈ 가장 오래 걸리는 파일 하나)
+        img_urls = self.s3uploader.upload_files(uploads)
+        s3_img_urls = [img_url for img_url in img_urls if img_url]
+        failed_images = [img.name for img, img_url in zip(images, img_urls) if not img_url]
+
+        # 실패한 파일이 있으면 업로드된 모든 파일을 한 번의 요청으로 삭제
+        if failed_images and s3_img_urls:
+            self.s3uploader.delete_files(s3_img_urls)
 
         response_data = {"upload_success": s3_img_urls, "upload_fail": failed_images}
         status = 400 if failed_images else 201
@@ -80,6 +84,78 @@ class ImageUploadAPIView(APIView):
         return Response(response_data, status=status)
 
 
+class ImagePresignedUploadAPIView(APIView):
+    serializer_class = ImagePresignedUploadSerializer
+    permission_classes = [IsAuthenticated, IsStudentPermission, IsStudentOrStaffOrAdminPermission]
+
+    @extend_schema(
+        request=ImagePresignedUploadSerializer,
+        description="QnA 이미지 S3 직접 업로드 URL 발급 (presigned POST/PUT). 업로드 후 complete API 호출 필요",
+        tags=["QNA-Image"],
+    )
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = S3Uploader().issue_presigned_upload(
+            QNA_IMAGE_UPLOAD_POLICY, request.user.id, **serializer.validated_data
+        )
+        return Response(data, status=201)
+
+
+class ImagePresignedCompleteAPIView(APIView):
+    serializer_class = ImagePresignedCompleteSerializer
+    permission_classes = [IsAuthenticated, IsStudentPermission, IsStudentOrStaffOrAdminPermission]
+
+    @extend_schema(
+        request=ImagePresignedCompleteSerializer,
+        description=(
+            "QnA 이미지 S3 직접 업로드 완료 확인 (토큰은 한 번만 사용 가능). "
+            "question_id 를 함께 보내면 질문 본문 끝에 이미지를 추가하고 질문 이미지로 등록"
+        ),
+        tags=["QNA-Image"],
+    )
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        question_id = serializer.validated_data.get("question_id")
+
+        question = None
+        if question_id is not None:
+            question = get_object_or_404(Question, pk=question_id)
+            if question.author_id != request.user.id:
+                return Response({"detail": "본인이 작성한 질문에만 이미지를 등록할 수 있습니다."}, status=403)
+            if question.images.count() >= QUESTION_IMAGE_MAX_COUNT:
+                return Response(QUESTION_IMAGE_LIMIT_ERROR, status=400)
+
+        uploader = S3Uploader()
+        upload_token = serializer.validated_data["upload_token"]
+        img_url, _ = uploader.verify_presigned_upload(
+            QNA_IMAGE_UPLOAD_POLICY, request.user.id, upload_token, consume=question is None
+        )
+
+        if question is None:
+            return Response({"img_url": img_url}, status=200)
+
+        with transaction.atomic():
+            # 같은 질문에 동시에 등록하는 경우 개수 제한을 넘지 않도록 질문 행 잠금 후 다시 확인
+            question = Question.objects.select_for_update().get(pk=question.pk)
+            if question.images.count() >= QUESTION_IMAGE_MAX_COUNT:
+                return Response(QUESTION_IMAGE_LIMIT_ERROR, status=400)
+
+            # 토큰은 등록이 확정된 경우에만 사용 처리 (개수 제한에 걸리면 다시 사용할 수 있음)
+            uploader.claim_presigned_upload(request.user.id, upload_token)
+
+            # 질문 이미지는 본문 마크다운 기준으로 관리되므로 (수정 시 본문에 없는 이미지는 삭제) 본문에도 추가
+            question.content = f"{question.content}\n\n![image]({img_url})"
+            question.save(update_fields=["content", "updated_at"])
+            image = QuestionImage.objects.create(question=question, img_url=img_url)
+            enqueue_image_variants(generate_question_image_variants, [image.id])
+
+        invalidate_question_detail(question.id)
+        return Response({"id": image.id, "img_url": img_url}, status=201)
+
+
 class ImageDeleteAPIView(APIView):
     serializer_class = ImageFileDeleteSerializer
     permission_classes = [IsAuthenticated, IsStudentPermission, IsStudentOrStaffOrAdminPermission]
@@ -1,7 +1,8 @@
 from typing import Any
 
 from django.core.cache import cache
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import filters, permissions, status
@@ -12,7 +13,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..models import Question, QuestionCategory
+from core.utils.view_counter import get_viewer_key
+
+from ..models import Answer, Question, QuestionCategory
 from ..permissions import IsStudentPermission
 from ..serializers.questions_serializers import (
     MajorQnACategorySerializer,
@@ -21,6 +24,11 @@ from ..serializers.questions_serializers import (
     QuestionListSerializer,
     QuestionUpdateSerializer,
 )
+from ..utils.question_detail import (
+    get_question_detail_data,
+    invalidate_question_detail,
+)
+from ..utils.view_count import question_view_counter
 
 
 class QuestionPagination(PageNumberPagination):
@@ -31,7 +39,11 @@ class QuestionPagination(PageNumberPagination):
 
 # 1. 질문 목록 조회 (GET)
 class QuestionListView(ListAPIView):
-    queryset = Question.objects.all().select_related("author", "category")
+    queryset = (
+        Question.objects.all()
+        .select_related("author", "category")
+        .annotate(adopted_answer_exists=Exists(Answer.objects.filter(question=OuterRef("pk"), is_adopted=True)))
+    )
     serializer_class = QuestionListSerializer
     permission_classes = [permissions.AllowAny]
     pagination_class = QuestionPagination
@@ -107,9 +119,17 @@ class QuestionDetailView(APIView):
         tags=["questions"],
     )
     def get(self, request: Request, question_id: int, *args: Any, **kwargs: Any) -> Response:
-        question = get_object_or_404(Question, pk=question_id)
-        serializer = QuestionDetailSerializer(question)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 조회수는 매번 DB 값을 사용하고, 나머지 상세 데이터는 캐시(연관 데이터 prefetch)에서 가져옴
+        question = get_object_or_404(Question.objects.only("id", "view_count"), pk=question_id)
+        data = get_question_detail_data(question.id)
+        if data is None:
+            raise Http404
+
+        # 조회수는 Redis 버퍼에만 쌓고, 응답에는 아직 반영되지 않은 증가분을 더해서 내려줌
+        pending_views = question_view_counter.incr(question.id, get_viewer_key(request))
+        data["view_count"] = question.view_count + pending_views
+
+        return Response(data, status=status.HTTP_200_OK)
 
 
 # 3. 새 질문 생성 (POST)
@@ -163,6 +183,7 @@ class QuestionUpdateView(APIView):
         serializer = QuestionUpdateSerializer(question, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_question_detail(question.id)
 
         response_data = QuestionDetailSerializer(question).data
         return Response(response_data, status=status.HTTP_200_OK)
@@ -8,6 +8,11 @@ from rest_framework.exceptions import APIException
 
 from apps.courses.models import Course, Generation
 from apps.users.models import PermissionsStudent, User
+from apps.users.utils.nickname_cache import invalidate_nickname
+from apps.users.utils.user_principal import (
+    PRINCIPAL_FIELDS,
+    invalidate_user_principal_on_commit,
+)
 from core.utils.s3_file_upload import S3Uploader
 
 
@@ -103,6 +108,7 @@ class AdminUserUpdateSerializer(serializers.ModelSerializer[User]):
         profile_img_file: Optional[UploadedFile] = validated_data.pop("profile_image_file", None)
         new_s3_url: Optional[str] = None
         old_s3_url: Optional[str] = instance.profile_image_url
+        old_nickname = instance.nickname
 
         if profile_img_file is not None:
             uploader = S3Uploader()
@@ -123,6 +129,11 @@ class AdminUserUpdateSerializer(serializers.ModelSerializer[User]):
                 for attr, value in validated_data.items():
                     setattr(instance, attr, value)
                 instance.save()
+                # 닉네임뿐 아니라 활성 상태 등 웹소켓 사용자 정보에 들어가는 필드가 바뀌면 캐시 삭제
+                if PRINCIPAL_FIELDS & validated_data.keys():
+                    invalidate_user_principal_on_commit(instance.id)
+                if "nickname" in validated_data:
+                    transaction.on_commit(lambda: invalidate_nickname(old_nickname))
 
                 # DB 저장 성공 후 → 이전 이미지 삭제
                 if profile_img_file and old_s3_url:
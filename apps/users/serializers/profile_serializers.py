@@ -4,7 +4,18 @@ from rest_framework import serializers
 
 from apps.courses.models import EnrollmentRequest
 from apps.users.models import User
+from apps.users.utils.nickname_cache import invalidate_nickname
 from apps.users.utils.redis_utils import is_phone_verified
+from apps.users.utils.user_principal import (
+    PRINCIPAL_FIELDS,
+    invalidate_user_principal_on_commit,
+)
+from core.utils.s3_file_upload import UploadPolicy
+from core.utils.validators import ALLOWED_IMAGE_EXTENSIONS
+
+PROFILE_IMAGE_UPLOAD_POLICY = UploadPolicy(
+    prefix="users/profile", max_size_mb=5, allowed_extensions=ALLOWED_IMAGE_EXTENSIONS, content_type_prefix="image/"
+)
 
 
 # 닉네임 중복체크
@@ -107,6 +118,7 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
 
     def update(self, instance: User, validated_data: dict[str, Any]) -> User:
         password = validated_data.pop("password", None)
+        old_nickname = instance.nickname
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -115,6 +127,10 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
             instance.set_password(password)
 
         instance.save()
+        if PRINCIPAL_FIELDS & validated_data.keys():
+            invalidate_user_principal_on_commit(instance.id)
+        if "nickname" in validated_data:
+            invalidate_nickname(old_nickname)
         return instance
 
 
@@ -122,3 +138,15 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
 class UserProfileUpdateResponseSerializer(serializers.Serializer):
     message = serializers.CharField()
     updated_fields = serializers.DictField(child=serializers.CharField(allow_null=True, allow_blank=True))
+
+
+# 프로필 이미지 S3 직접 업로드(presigned) 발급 요청
+class ProfileImagePresignedUploadSerializer(serializers.Serializer[dict[str, Any]]):
+    file_name = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(min_value=1)
+
+
+# 프로필 이미지 S3 직접 업로드 완료 요청
+class ProfileImagePresignedCompleteSerializer(serializers.Serializer[dict[str, Any]]):
+    upload_token = serializers.CharField()
@@ -1,11 +1,16 @@
 import logging
 from datetime import date
+from functools import partial
 
 from celery import shared_task  # type: ignore
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db import transaction
 
 from apps.users.models.withdrawals import Withdrawal
+from apps.users.utils.nickname_cache import invalidate_nickname
+from apps.users.utils.orphan_files import profile_image_collector
+from apps.users.utils.user_principal import invalidate_user_principal_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +34,28 @@ def send_verification_email_task(self, email: str, code: str) -> None:
 @shared_task
 def delete_expired_withdrawn_users():
     today = date.today()
-    expired_withdrawals = Withdrawal.objects.filter(due_date__lte=today)
+    # 이미 삭제된 사용자의 탈퇴 기록(user=NULL)은 제외
+    expired_withdrawals = Withdrawal.objects.filter(due_date__lte=today, user__isnull=False)
 
     count = 0
     for withdrawal in expired_withdrawals:
         user = withdrawal.user
         logger.info(f"[Celery] 탈퇴 유예 기간이 만료된 사용자 삭제: {user.email} (ID: {user.id})")
 
-        user.delete()
+        # delete() 후에는 user.id 가 None 이 되므로 미리 보관
+        user_id, nickname = user.id, user.nickname
+        with transaction.atomic():
+            user.delete()
+            # 삭제된 계정이 캐시된 principal 로 계속 인증되지 않도록 커밋 후 무효화
+            invalidate_user_principal_on_commit(user_id)
+            transaction.on_commit(partial(invalidate_nickname, nickname))
         count += 1
 
     logger.info(f"[Celery] 탈퇴 유예 기간이 지난 사용자 {count}명 삭제")
+
+
+# 어디에서도 참조하지 않는 프로필 이미지를 매일 S3 에서 삭제
+@shared_task
+def delete_orphaned_profile_images():
+    deleted = profile_image_collector.sweep()
+    logger.info(f"[Celery] 참조되지 않는 프로필 이미지 삭제 완료: {deleted}건")
@@ -1,3 +1,127 @@
+import time
+from datetime import date
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import transaction
 from django.test import TestCase
+from django_redis import get_redis_connection  # type: ignore
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.users.models.withdrawals import Withdrawal
+from apps.users.tasks import delete_expired_withdrawn_users
+from apps.users.utils.user_principal import (
+    LOCAL_PRINCIPAL_TTL,
+    USER_PRINCIPAL_KEY,
+    get_user_principal,
+    invalidate_user_principal,
+    invalidate_user_principal_on_commit,
+)
+
+
+class UserPrincipalCacheTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="principal@test.com",
+            password="password123!",
+            name="사용자",
+            nickname="principal",
+            phone_number="01011112222",
+        )
+
+    async def test_principal_is_served_from_cache_until_invalidated(self):
+        principal = await get_user_principal(self.user.id)
+        self.assertEqual(
+            (principal.email, principal.nickname, principal.role), ("principal@test.com", "principal", "GENERAL")
+        )
+
+        await User.objects.filter(id=self.user.id).aupdate(role=User.Role.STUDENT)
+        self.assertEqual((await get_user_principal(self.user.id)).role, "GENERAL")
+
+        await sync_to_async(invalidate_user_principal)(self.user.id)
+        self.assertEqual((await get_user_principal(self.user.id)).role, "STUDENT")
+
+    async def test_withdrawn_user_is_rejected_after_invalidation(self):
+        await get_user_principal(self.user.id)
+
+        await User.objects.filter(id=self.user.id).aupdate(is_active=False)
+        await sync_to_async(invalidate_user_principal)(self.user.id)
+
+        self.assertIsNone(await get_user_principal(self.user.id))
+
+    def test_invalidation_waits_for_commit(self):
+        async_to_sync(get_user_principal)(self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                User.objects.filter(id=self.user.id).update(is_active=False)
+                invalidate_user_principal_on_commit(self.user.id)
+                # 커밋 전 핸드셰이크는 아직 이전 정보를 보고 다시 캐싱할 수 있음
+                self.assertIsNotNone(async_to_sync(get_user_principal)(self.user.id))
+
+        self.assertIsNone(async_to_sync(get_user_principal)(self.user.id))
+
+    def test_other_worker_lru_expires_within_ttl(self):
+        async_to_sync(get_user_principal)(self.user.id)
+
+        # 다른 워커에서 삭제한 경우: Redis 키만 지워지고 이 프로세스의 LRU 는 남아 있음
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        get_redis_connection("default").delete(USER_PRINCIPAL_KEY.format(user_id=self.user.id))
+        self.assertIsNotNone(async_to_sync(get_user_principal)(self.user.id))
+
+        later = time.monotonic() + LOCAL_PRINCIPAL_TTL + 1
+        with mock.patch("apps.users.utils.user_principal.time.monotonic", return_value=later):
+            self.assertIsNone(async_to_sync(get_user_principal)(self.user.id))
+
+    def test_admin_deactivation_invalidates_principal(self):
+        admin = User.objects.create_user(
+            email="admin@test.com",
+            password="password123!",
+            name="관리자",
+            nickname="admin",
+            phone_number="01099998888",
+            role=User.Role.ADMIN,
+        )
+        async_to_sync(get_user_principal)(self.user.id)
+
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.patch(f"/api/v1/auth/admin/users/{self.user.id}/update/", {"is_active": False})
+        self.assertEqual(response.status_code, 200)
+
+        self.assertIsNone(async_to_sync(get_user_principal)(self.user.id))
+
+    def test_admin_deleted_user_is_no_longer_resolved(self):
+        admin = User.objects.create_user(
+            email="admin@test.com",
+            password="password123!",
+            name="관리자",
+            nickname="admin",
+            phone_number="01099998888",
+            role=User.Role.ADMIN,
+        )
+        user_id = self.user.id
+        async_to_sync(get_user_principal)(user_id)
+
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.delete(f"/api/v1/auth/admin/users/{user_id}/delete/")
+        self.assertEqual(response.status_code, 204)
+
+        self.assertIsNone(async_to_sync(get_user_principal)(user_id))
+
+    def test_expired_withdrawn_user_is_no_longer_resolved(self):
+        user_id = self.user.id
+        Withdrawal.objects.create(
+            user=self.user, reason=Withdrawal.Reason.ETC, reason_detail="기타", due_date=date.today()
+        )
+        async_to_sync(get_user_principal)(user_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_expired_withdrawn_users()
 
-# Create your tests here.
+        self.assertFalse(User.objects.filter(id=user_id).exists())
+        self.assertIsNone(async_to_sync(get_user_principal)(user_id))
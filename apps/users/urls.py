@@ -52,6 +52,8 @@ from apps.users.views.find_account_views import (
 )
 from apps.users.views.profile_views import (
     NicknameCheckView,
+    ProfileImagePresignedCompleteView,
+    ProfileImagePresignedUploadView,
     UserProfileUpdateView,
     UserProfileView,
 )
@@ -73,6 +75,12 @@ urlpatterns = [
     path("users/restore/", UserRestoreView.as_view(), name="user-restore"),
     path("profile/", UserProfileView.as_view(), name="user-profile"),
     path("profile/update/", UserProfileUpdateView.as_view(), name="user-profile-update"),
+    path("profile/image/presigned/", ProfileImagePresignedUploadView.as_view(), name="profile-image-presigned"),
+    path(
+        "profile/image/presigned/complete/",
+        ProfileImagePresignedCompleteView.as_view(),
+        name="profile-image-presigned-complete",
+    ),
     path("profile/nickname-check/", SignupNicknameCheckAPIView.as_view(), name="nickname-check"),
     # admin 유저 관리
     path("admin/users/", AdminUserListView.as_view(), name="admin-user-list"),
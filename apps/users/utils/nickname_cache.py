@@ -0,0 +1,35 @@
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+
+from apps.users.models import User
+
+NICKNAME_USER_ID_KEY = "nickname_user_id:{nickname}"
+# 닉네임 변경/회원 삭제 시에는 즉시 삭제
+NICKNAME_USER_ID_TTL = 60 * 10
+
+
+def get_user_ids_by_nickname(nicknames: Iterable[str]) -> Dict[str, int]:
+    """닉네임 -> 사용자 ID. 캐시에 없는 닉네임만 한 번의 쿼리로 조회 (존재하지 않는 닉네임은 결과에서 제외)"""
+    keys = {NICKNAME_USER_ID_KEY.format(nickname=nickname): nickname for nickname in nicknames}
+    if not keys:
+        return {}
+
+    cached = cache.get_many(list(keys))
+    user_ids = {keys[key]: user_id for key, user_id in cached.items()}
+
+    misses = [nickname for key, nickname in keys.items() if key not in cached]
+    if misses:
+        found = dict(User.objects.filter(nickname__in=misses).values_list("nickname", "id"))
+        cache.set_many(
+            {NICKNAME_USER_ID_KEY.format(nickname=nickname): user_id for nickname, user_id in found.items()},
+            timeout=NICKNAME_USER_ID_TTL,
+        )
+        user_ids.update(found)
+
+    return user_ids
+
+
+def invalidate_nickname(nickname: str) -> None:
+    """닉네임 변경, 회원 삭제 시 캐시된 닉네임 -> 사용자 ID 삭제"""
+    cache.delete(NICKNAME_USER_ID_KEY.format(nickname=nickname))
@@ -0,0 +1,8 @@
+from apps.users.models import User
+from core.utils.s3_gc import S3OrphanCollector
+
+# 프로필 변경/회원 삭제 후 남은 프로필 이미지
+profile_image_collector = S3OrphanCollector(
+    prefixes=["users/profile_images/", "users/profile/"],
+    sources=[(User, "profile_image_url")],
+)
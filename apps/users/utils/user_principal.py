@@ -0,0 +1,99 @@
+import json
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django_redis import get_redis_connection  # type: ignore
+
+from apps.users.models import User
+from core.utils.redis_async import get_async_redis
+
+USER_PRINCIPAL_KEY = "user_principal:{user_id}"
+# Redis 캐시 유효 시간 (권한 변경/탈퇴 시에는 즉시 삭제)
+USER_PRINCIPAL_TTL = 60 * 5
+# 프로세스 내 LRU 는 다른 프로세스(워커)의 삭제를 알 수 없다.
+# 권한 변경/탈퇴가 커밋된 뒤에도 다른 워커가 이전 정보로 핸드셰이크를 통과시킬 수 있는 최대 시간이므로,
+# 재접속 폭주(같은 사용자가 수 초 안에 여러 번 연결)를 흡수할 만큼만 짧게 유지
+LOCAL_PRINCIPAL_TTL = 5
+LOCAL_PRINCIPAL_MAX_SIZE = 1024
+# 캐시된 사용자 정보에 들어가는 필드 (이 필드가 바뀌면 캐시 삭제)
+PRINCIPAL_FIELDS = frozenset({"email", "nickname", "role", "is_active"})
+
+
+class UserPrincipal:
+    """웹소켓 컨슈머에서 사용하는 최소한의 사용자 정보 (DB 모델 대신 scope["user"] 에 저장)"""
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, id: int, email: str, nickname: str, role: str) -> None:
+        self.id = self.pk = id
+        self.email = email
+        self.nickname = nickname
+        self.role = role
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "email": self.email, "nickname": self.nickname, "role": self.role}
+
+
+_local_cache: "OrderedDict[int, Tuple[float, UserPrincipal]]" = OrderedDict()
+
+
+def _get_local(user_id: int) -> Optional[UserPrincipal]:
+    entry = _local_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, principal = entry
+    if expires_at < time.monotonic():
+        _local_cache.pop(user_id, None)
+        return None
+    _local_cache.move_to_end(user_id)
+    return principal
+
+
+def _set_local(principal: UserPrincipal) -> None:
+    _local_cache[principal.id] = (time.monotonic() + LOCAL_PRINCIPAL_TTL, principal)
+    _local_cache.move_to_end(principal.id)
+    while len(_local_cache) > LOCAL_PRINCIPAL_MAX_SIZE:
+        _local_cache.popitem(last=False)
+
+
+@sync_to_async
+def _load_from_db(user_id: int) -> Optional[UserPrincipal]:
+    row = User.objects.filter(id=user_id, is_active=True).values("id", "email", "nickname", "role").first()
+    return UserPrincipal(**row) if row else None
+
+
+async def get_user_principal(user_id: int) -> Optional[UserPrincipal]:
+    """프로세스 LRU -> Redis -> DB 순서로 사용자 정보 조회. 없거나 탈퇴(비활성)한 사용자면 None"""
+    principal = _get_local(user_id)
+    if principal is not None:
+        return principal
+
+    redis = get_async_redis()
+    key = USER_PRINCIPAL_KEY.format(user_id=user_id)
+    cached = await redis.get(key)
+    if cached is not None:
+        principal = UserPrincipal(**json.loads(cached))
+    else:
+        principal = await _load_from_db(user_id)
+        if principal is None:
+            return None
+        await redis.set(key, json.dumps(principal.to_dict()), ex=USER_PRINCIPAL_TTL)
+
+    _set_local(principal)
+    return principal
+
+
+def invalidate_user_principal(user_id: int) -> None:
+    """권한 변경, 탈퇴/복구 시 캐시된 사용자 정보 삭제 (다른 워커의 LRU 는 LOCAL_PRINCIPAL_TTL 안에 만료)"""
+    _local_cache.pop(user_id, None)
+    get_redis_connection("default").delete(USER_PRINCIPAL_KEY.format(user_id=user_id))
+
+
+def invalidate_user_principal_on_commit(user_id: int) -> None:
+    """트랜잭션 커밋 후 캐시 삭제. 커밋 전에 들어온 핸드셰이크가 이전 값을 다시 캐싱해도 커밋 직후 지워짐"""
+    transaction.on_commit(partial(invalidate_user_principal, user_id))
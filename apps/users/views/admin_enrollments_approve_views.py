@@ -14,6 +14,7 @@ from apps.users.serializers.admin_enrollments_approve_serializers import (
     ApprovalResponseSerializer,
     EnrollmentRequestIdsSerializer,
 )
+from apps.users.utils.user_principal import invalidate_user_principal_on_commit
 
 
 class AdminApproveEnrollmentsView(APIView):
@@ -68,6 +69,7 @@ class AdminApproveEnrollmentsView(APIView):
                 if user.role == User.Role.GENERAL:
                     user.role = User.Role.STUDENT
                     user.save(update_fields=["role"])
+                    invalidate_user_principal_on_commit(user.id)
 
                 PermissionsStudent.objects.get_or_create(user=user, generation=enrollment.generation)
 
@@ -12,6 +12,7 @@ from apps.users.serializers.admin_enrollments_rejection_serializers import (
     RejectEnrollmentRequestSerializer,
     RejectionResponseSerializer,
 )
+from apps.users.utils.user_principal import invalidate_user_principal_on_commit
 
 # pending, approved 상태만 반려
 # rejected 상태이면 스킵
@@ -58,6 +59,7 @@ class RejectEnrollmentRequestView(APIView):
                     if enrollment.user.role != User.Role.GENERAL:
                         enrollment.user.role = User.Role.GENERAL
                         enrollment.user.save(update_fields=["role"])
+                        invalidate_user_principal_on_commit(enrollment.user.id)
                         downgraded_user_ids.append(enrollment.user.id)
 
                 enrollment.status = status_enum.REJECTED
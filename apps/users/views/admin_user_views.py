@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 
 from django.db import transaction
@@ -26,6 +27,8 @@ from apps.users.serializers.admin_user_serializers import (
     AdminUserUpdateSerializer,
     PaginatedAdminUserListSerializer,
 )
+from apps.users.utils.nickname_cache import invalidate_nickname
+from apps.users.utils.user_principal import invalidate_user_principal_on_commit
 
 
 class AdminUserListPaginator(PageNumberPagination):
@@ -192,7 +195,13 @@ class AdminUserDeleteView(APIView):
         if request.user.id == user.id:
             return Response({"detail": "자기 자신은 삭제할 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        user.delete()
+        # delete() 후에는 user.id 가 None 이 되므로 미리 보관
+        user_id, nickname = user.id, user.nickname
+        with transaction.atomic():
+            user.delete()
+            # 삭제된 계정이 캐시된 principal 로 계속 인증되지 않도록 커밋 후 무효화
+            invalidate_user_principal_on_commit(user_id)
+            transaction.on_commit(partial(invalidate_nickname, nickname))
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -239,6 +248,7 @@ class AdminUserRoleUpdateView(APIView):
 
                 user.role = new_role
                 user.save(update_fields=["role", "updated_at"])
+                invalidate_user_principal_on_commit(user.id)
 
         except Exception:
             return Response({"detail": "권한 변경에 실패했습니다."}, status=status.HTTP_400_BAD_REQUEST)
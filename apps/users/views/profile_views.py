@@ -1,5 +1,7 @@
 import uuid
+from functools import partial
 
+from django.db import transaction
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
@@ -11,7 +13,10 @@ from rest_framework.views import APIView
 
 from apps.users.models import User
 from apps.users.serializers.profile_serializers import (
+    PROFILE_IMAGE_UPLOAD_POLICY,
     NicknameCheckSerializer,
+    ProfileImagePresignedCompleteSerializer,
+    ProfileImagePresignedUploadSerializer,
     UserProfileSerializer,
     UserProfileUpdateResponseSerializer,
     UserProfileUpdateSerializer,
@@ -101,6 +106,69 @@ class UserProfileUpdateView(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+# 프로필 이미지 S3 직접 업로드 URL 발급
+class ProfileImagePresignedUploadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=ProfileImagePresignedUploadSerializer,
+        description="프로필 이미지 S3 직접 업로드 URL 발급 API (presigned POST/PUT). 업로드 후 complete API 호출 필요",
+        tags=["user-profile"],
+        responses={201: OpenApiTypes.OBJECT},
+    )
+    def post(self, request: Request) -> Response:
+        user = request.user
+        assert isinstance(user, User)
+
+        serializer = ProfileImagePresignedUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = S3Uploader().issue_presigned_upload(PROFILE_IMAGE_UPLOAD_POLICY, user.id, **serializer.validated_data)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+# 프로필 이미지 S3 직접 업로드 완료
+class ProfileImagePresignedCompleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=ProfileImagePresignedCompleteSerializer,
+        description="프로필 이미지 S3 직접 업로드 완료 API (토큰은 한 번만 사용 가능). 기존 이미지는 저장 후 삭제",
+        tags=["user-profile"],
+        responses={200: UserProfileUpdateResponseSerializer},
+    )
+    def post(self, request: Request) -> Response:
+        user = request.user
+        assert isinstance(user, User)
+
+        serializer = ProfileImagePresignedCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        uploader = S3Uploader()
+        uploaded_url, _ = uploader.verify_presigned_upload(
+            PROFILE_IMAGE_UPLOAD_POLICY, user.id, serializer.validated_data["upload_token"]
+        )
+
+        old_image_url = user.profile_image_url
+        with transaction.atomic():
+            user.profile_image_url = uploaded_url
+            user.save(update_fields=["profile_image_url"])
+            # 새 이미지가 저장된 뒤에만 기존 이미지 삭제 (실패해도 고아 파일 정리 작업에서 회수)
+            if old_image_url:
+                transaction.on_commit(partial(uploader.delete_file, old_image_url))
+
+        response_data = {
+            "message": "프로필 이미지 수정 완료",
+            "updated_fields": {
+                "nickname": user.nickname,
+                "phone_number": user.phone_number,
+                "profile_image_url": uploaded_url,
+            },
+        }
+        response_serializer = UserProfileUpdateResponseSerializer(response_data)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
 # 닉네임 중복 확인
 class NicknameCheckView(APIView):
     permission_classes = [IsAuthenticated]
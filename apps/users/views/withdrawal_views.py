@@ -17,6 +17,7 @@ from apps.users.serializers.withdrawal_serializers import (
     UserRestoreSerializer,
 )
 from apps.users.utils.redis_utils import is_restore_email_verified
+from apps.users.utils.user_principal import invalidate_user_principal_on_commit
 
 
 # 회원탈퇴
@@ -54,6 +55,7 @@ class UserDeleteView(APIView):
             # 유저 비활성화 및 탈퇴 처리
             user.is_active = False
             user.save(update_fields=["is_active"])
+            invalidate_user_principal_on_commit(user.id)
             assert isinstance(user, User)
 
             return Response(
@@ -117,6 +119,7 @@ class UserRestoreView(APIView):
 
             user.is_active = True
             user.save(update_fields=["is_active"])
+            invalidate_user_principal_on_commit(user.id)
             withdrawal.user = None
             withdrawal.save(update_fields=["user"])
 
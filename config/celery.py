@@ -15,4 +15,40 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=0),  # 매일 12시 정각에 실행
         "options": {"expires": 3600},
     },
+    "flush-question-view-counts-every-minute": {
+        "task": "apps.qna.tasks.flush_question_view_counts",
+        "schedule": 60.0,  # 1분마다 Redis 조회수 버퍼를 DB에 반영
+        "options": {"expires": 50},
+    },
+    "flush-post-view-counts-every-minute": {
+        "task": "apps.community.tasks.flush_post_view_counts",
+        "schedule": 60.0,
+        "options": {"expires": 50},
+    },
+    "flush-post-likes-every-minute": {
+        "task": "apps.community.tasks.flush_post_likes",
+        "schedule": 60.0,  # POST_LIKE_WRITE_BEHIND 가 꺼져 있으면 반영할 변경이 없어 바로 종료
+        "options": {"expires": 50},
+    },
+    "cleanup-pending-post-uploads-every-10-minutes": {
+        "task": "apps.community.tasks.cleanup_pending_post_uploads",
+        "schedule": 600.0,  # 게시글 저장에 실패한 업로드 파일(outbox) 정리
+        "options": {"expires": 540},
+    },
+    # 참조되지 않는 S3 파일 정리 (트래픽이 적은 새벽 시간대)
+    "delete-orphaned-qna-images-every-day-4am": {
+        "task": "apps.qna.tasks.delete_orphaned_qna_images",
+        "schedule": crontab(hour=4, minute=0),
+        "options": {"expires": 3600},
+    },
+    "delete-orphaned-post-files-every-day-4am": {
+        "task": "apps.community.tasks.delete_orphaned_post_files",
+        "schedule": crontab(hour=4, minute=10),
+        "options": {"expires": 3600},
+    },
+    "delete-orphaned-profile-images-every-day-4am": {
+        "task": "apps.users.tasks.delete_orphaned_profile_images",
+        "schedule": crontab(hour=4, minute=20),
+        "options": {"expires": 3600},
+    },
 }
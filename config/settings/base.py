@@ -1,4 +1,5 @@
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 from typing import Optional
@@ -54,6 +55,8 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "config.urls"
 
+TEST_RUNNER = "core.test_runner.CacheIsolatedTestRunner"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -95,16 +98,23 @@ REDIS_PORT = os.getenv("REDIS_PORT")
 
 if not REDIS_HOST or not REDIS_PORT:
     raise ValueError("REDIS_HOST and REDIS_PORT must be set")
+# 테스트는 별도 Redis DB 를 사용하고 테스트마다 비운다 (core.test_runner)
+TESTING = sys.argv[1:2] == ["test"]
+REDIS_DB = 15 if TESTING else 1
+REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
-        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/1",  # Redis 서버 주소
+        "LOCATION": REDIS_URL,  # Redis 서버 주소
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
         },
     }
 }
 
+# 앞단 리버스 프록시 수. X-Forwarded-For 는 오른쪽에서 이 개수만큼의 hop 만 신뢰한다 (0 이면 REMOTE_ADDR 사용)
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", 0))
+
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
@@ -234,6 +244,8 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
 AWS_REGION = os.getenv("AWS_REGION", "")
 AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME", "")
+# 로컬 S3 호환 서버(테스트 등) 사용 시에만 지정
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
 
 # < Twilio 설정 >
 TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID")
@@ -0,0 +1,23 @@
+import unittest
+from typing import Optional, Type
+
+from django.core.cache import cache
+from django.test.runner import DiscoverRunner
+
+
+class CacheClearingTestResult(unittest.TextTestResult):
+    def startTest(self, test: unittest.TestCase) -> None:
+        # DB 는 테스트마다 롤백되지만 Redis 는 그대로 남으므로 매 테스트 시작 전에 비움 (테스트 전용 Redis DB)
+        cache.clear()
+        super().startTest(test)
+
+
+class CacheIsolatedTestRunner(DiscoverRunner):
+    """이전 테스트(실행)에서 남은 캐시, Redis 카운터 등이 다음 테스트에 섞이지 않도록 하는 테스트 러너"""
+
+    def get_resultclass(self) -> Optional[Type[unittest.TextTestResult]]:
+        resultclass = super().get_resultclass()
+        if resultclass is None:
+            return CacheClearingTestResult
+        # --debug-sql, --pdb 옵션의 결과 클래스와 함께 사용
+        return type(resultclass.__name__, (CacheClearingTestResult, resultclass), {})
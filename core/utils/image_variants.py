@@ -0,0 +1,88 @@
+import io
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from django.db import models, transaction
+from PIL import Image, ImageOps
+
+from core.utils.s3_file_upload import S3Uploader
+
+logger = logging.getLogger(__name__)
+
+# 목록 미리보기용 썸네일 크기 (고해상도 화면 고려해서 표시 크기의 약 3배)
+THUMBNAIL_SIZE = (240, 240)
+# 본문 표시용 WebP 최대 가로/세로
+WEBP_MAX_SIZE = (1600, 1600)
+WEBP_QUALITY = 80
+
+
+def _to_webp(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    # exif/icc 등 메타데이터는 넘기지 않으므로 다시 인코딩하면서 모두 제거된다
+    image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def build_variants(data: bytes) -> Dict[str, bytes]:
+    """원본 이미지로 썸네일(고정 크기, 가운데 잘라내기)과 WebP 변환본 생성"""
+    with Image.open(io.BytesIO(data)) as source:
+        # 휴대폰 사진의 회전 정보(EXIF)는 제거 전에 실제 픽셀에 반영
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        thumbnail = ImageOps.fit(image, THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+        webp = image.copy()
+        webp.thumbnail(WEBP_MAX_SIZE, Image.Resampling.LANCZOS)
+
+    return {"thumbnail": _to_webp(thumbnail), "webp": _to_webp(webp)}
+
+
+def create_image_variants(uploader: S3Uploader, image_url: str) -> Dict[str, str]:
+    """S3 원본 이미지의 변환본을 같은 경로에 업로드하고 {"thumbnail": URL, "webp": URL} 반환
+
+    원본이 .webp 인 경우에도 덮어쓰지 않도록 변환본은 항상 접미사(_thumb/_display)를 붙인 키에 저장
+    """
+    s3_key = uploader.get_key(image_url)
+    base_key = os.path.splitext(s3_key)[0]
+    variants = build_variants(uploader.download_bytes(s3_key))
+
+    return {
+        "thumbnail": uploader.upload_bytes(variants["thumbnail"], f"{base_key}_thumb.webp", "image/webp"),
+        "webp": uploader.upload_bytes(variants["webp"], f"{base_key}_display.webp", "image/webp"),
+    }
+
+
+class ImageVariantGenerator:
+    """이미지 모델(원본 URL 필드 + thumbnail_url/webp_url 필드)의 변환본 생성기"""
+
+    def __init__(self, model: Type[models.Model], url_field: str) -> None:
+        self.model = model
+        self.url_field = url_field
+
+    def generate(self, image_ids: Sequence[int], uploader: Optional[S3Uploader] = None) -> List[Any]:
+        """변환본이 아직 없는 이미지들을 처리하고 갱신된 객체 목록 반환 (실패한 이미지는 원본을 그대로 사용)"""
+        uploader = uploader or S3Uploader()
+        images = list(self.model._default_manager.filter(pk__in=image_ids, thumbnail_url__isnull=True))
+
+        updated = []
+        for image in images:
+            try:
+                variants = create_image_variants(uploader, getattr(image, self.url_field))
+            except Exception as e:
+                logger.warning(f"[ImageVariant] {self.model.__name__}({image.pk}) 변환 실패: {e}")
+                continue
+            image.thumbnail_url = variants["thumbnail"]  # type: ignore[attr-defined]
+            image.webp_url = variants["webp"]  # type: ignore[attr-defined]
+            updated.append(image)
+
+        if updated:
+            self.model._default_manager.bulk_update(updated, ["thumbnail_url", "webp_url"])
+        return updated
+
+
+def enqueue_image_variants(task: Any, image_ids: Sequence[int]) -> None:
+    """트랜잭션 커밋 후 변환 작업을 Celery 에 등록 (브로커 오류가 요청 실패로 이어지지 않도록 robust)"""
+    image_ids = [image_id for image_id in image_ids if image_id is not None]
+    if image_ids:
+        transaction.on_commit(lambda: task.delay(image_ids), robust=True)
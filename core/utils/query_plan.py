@@ -0,0 +1,36 @@
+import json
+from typing import Any, Dict, Iterator, List, Set
+
+from django.db import connections
+
+PlanNode = Dict[str, Any]
+
+SORT_NODE_TYPES = {"Sort", "Incremental Sort"}
+
+
+def explain(sql: str, using: str = "default") -> PlanNode:
+    """PostgreSQL EXPLAIN (FORMAT JSON) 의 최상위 실행 계획 노드 (실제로 실행하지 않음)"""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        result = cursor.fetchone()[0]
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def iter_nodes(plan: PlanNode) -> Iterator[PlanNode]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+def used_indexes(plan: PlanNode) -> Set[str]:
+    return {node["Index Name"] for node in iter_nodes(plan) if "Index Name" in node}
+
+
+def has_sort(plan: PlanNode) -> bool:
+    return any(node["Node Type"] in SORT_NODE_TYPES for node in iter_nodes(plan))
+
+
+def seq_scanned_tables(plan: PlanNode) -> List[str]:
+    return [node["Relation Name"] for node in iter_nodes(plan) if node["Node Type"] == "Seq Scan"]
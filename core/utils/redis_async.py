@@ -0,0 +1,42 @@
+import asyncio
+import os
+from typing import Optional
+
+from django.conf import settings
+from redis.asyncio import Redis
+
+# 이벤트 루프(프로세스) 당 비동기 Redis 커넥션 풀 크기
+ASYNC_REDIS_MAX_CONNECTIONS = int(os.getenv("ASYNC_REDIS_MAX_CONNECTIONS", 50))
+
+
+class AsyncRedisManager:
+    """웹소켓 컨슈머 등 비동기 코드에서 스레드풀을 거치지 않고 사용하는 공유 Redis 클라이언트"""
+
+    def __init__(self, url: Optional[str] = None, max_connections: int = ASYNC_REDIS_MAX_CONNECTIONS) -> None:
+        self.url = url
+        self.max_connections = max_connections
+        self._client: Optional[Redis] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_client(self) -> Redis:
+        # 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._loop = loop
+            self._client = Redis.from_url(
+                self.url or settings.REDIS_URL, max_connections=self.max_connections, decode_responses=True
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+async_redis_manager = AsyncRedisManager()
+
+
+def get_async_redis() -> Redis:
+    return async_redis_manager.get_client()
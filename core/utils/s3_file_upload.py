@@ -1,11 +1,69 @@
 # core/utils/s3_file_upload.py
 
-from typing import IO, Optional, cast
+import logging
+import os
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, cast
 
 import boto3
-from botocore.exceptions import NoCredentialsError
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError
 from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
+from rest_framework.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# 여러 파일 동시 업로드 시 프로세스 전체에서 사용하는 스레드 수 / 업로드 한 묶음(upload_files 호출) 전체의 제한 시간(초)
+S3_UPLOAD_MAX_WORKERS = int(os.getenv("S3_UPLOAD_MAX_WORKERS", 8))
+S3_UPLOAD_TIMEOUT = float(os.getenv("S3_UPLOAD_TIMEOUT", 30))
+# delete_objects 한 번에 지울 수 있는 최대 키 수
+S3_DELETE_BATCH_SIZE = 1000
+
+_upload_executor = ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS, thread_name_prefix="s3-upload")
+
+# 클라이언트 -> S3 직접 업로드(presigned) URL 유효 시간(초). 완료 요청은 그 두 배까지 허용
+S3_PRESIGNED_EXPIRES = int(os.getenv("S3_PRESIGNED_EXPIRES", 60 * 10))
+PRESIGNED_UPLOAD_SALT = "core.s3.presigned-upload"
+# 완료 처리된 업로드 토큰 (토큰 유효 시간 동안 유지, 같은 토큰으로 두 번 등록하지 않도록)
+PRESIGNED_UPLOAD_USED_KEY = "presigned_upload_used:{s3_key}"
+
+
+class UploadPolicy:
+    """presigned 업로드 허용 조건 (저장 경로, 확장자/Content-Type, 최대 크기)"""
+
+    def __init__(
+        self,
+        prefix: str,
+        max_size_mb: int,
+        allowed_extensions: Optional[Set[str]] = None,
+        blocked_extensions: Optional[Set[str]] = None,
+        content_type_prefix: Optional[str] = None,
+    ) -> None:
+        self.prefix = prefix
+        self.max_size = max_size_mb * 1024 * 1024
+        self.max_size_mb = max_size_mb
+        self.allowed_extensions = allowed_extensions
+        self.blocked_extensions = blocked_extensions
+        self.content_type_prefix = content_type_prefix
+
+    def validate(self, file_name: str, content_type: str, size: int) -> str:
+        """업로드 가능한 파일인지 확인하고 확장자 반환"""
+        ext = os.path.splitext(file_name)[1].lower()
+        if not ext:
+            raise ValidationError({"file_name": [f"'{file_name}'에는 확장자가 없습니다."]})
+        if self.allowed_extensions and ext not in self.allowed_extensions:
+            raise ValidationError({"file_name": [f"'{file_name}'은(는) 허용되지 않는 파일 형식입니다."]})
+        if self.blocked_extensions and ext in self.blocked_extensions:
+            raise ValidationError({"file_name": [f"'{file_name}'은(는) 업로드할 수 없는 파일 형식입니다."]})
+        if self.content_type_prefix and not content_type.startswith(self.content_type_prefix):
+            raise ValidationError({"content_type": [f"'{content_type}'은(는) 허용되지 않는 Content-Type 입니다."]})
+        if size > self.max_size:
+            raise ValidationError({"size": [f"'{file_name}'의 크기는 {self.max_size_mb}MB를 초과할 수 없습니다."]})
+        return ext
 
 
 # 파일업로드 공통 유틸 클래스, 프로젝트 내 여러 앱에서 재사용할 수 있도록 core에 정의
@@ -22,8 +80,21 @@ class S3Uploader:
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=aws_region,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            config=Config(
+                connect_timeout=5,
+                read_timeout=S3_UPLOAD_TIMEOUT,
+                max_pool_connections=S3_UPLOAD_MAX_WORKERS,
+            ),
         )
 
+    def get_url(self, s3_key: str) -> str:
+        return f"https://{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+
+    def get_key(self, s3_url: str) -> str:
+        # https://bucket.s3.region.amazonaws.com/answers/filename.jpg -> answers/filename.jpg
+        return s3_url.split(f"{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/")[-1]
+
     # 단일 파일 업로드 후 URL 반환. 실패 시 None 반환
     def upload_file(self, file_obj: UploadedFile, s3_key: str) -> Optional[str]:
 
@@ -34,29 +105,168 @@ class S3Uploader:
                 s3_key,
                 ExtraArgs={"ContentType": file_obj.content_type},
             )
-            return f"https://{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+            return self.get_url(s3_key)
 
         except NoCredentialsError:
             return None
 
+    # 메모리에 있는 데이터(이미지 변환본 등) 업로드 후 URL 반환
+    def upload_bytes(self, data: bytes, s3_key: str, content_type: str) -> str:
+        self.client.put_object(Bucket=self.bucket, Key=s3_key, Body=data, ContentType=content_type)
+        return self.get_url(s3_key)
+
+    def download_bytes(self, s3_key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=s3_key)["Body"].read()
+
+    # 클라이언트가 S3 에 직접 올릴 수 있는 presigned POST/PUT 발급. 완료 확인 시 사용할 서명된 upload_token 포함
+    def issue_presigned_upload(
+        self, policy: UploadPolicy, user_id: int, file_name: str, content_type: str, size: int
+    ) -> Dict[str, Any]:
+        ext = policy.validate(file_name, content_type, size)
+        s3_key = f"{policy.prefix}/{uuid.uuid4().hex}{ext}"
+
+        # POST 는 S3 에서 크기/Content-Type 을 강제하고, PUT 은 완료 확인(HEAD) 단계에서 검증
+        presigned_post = self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=s3_key,
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, policy.max_size]],
+            ExpiresIn=S3_PRESIGNED_EXPIRES,
+        )
+        put_url = self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": s3_key, "ContentType": content_type},
+            ExpiresIn=S3_PRESIGNED_EXPIRES,
+        )
+        upload_token = signing.dumps(
+            {"key": s3_key, "user_id": user_id, "prefix": policy.prefix, "file_name": file_name},
+            salt=PRESIGNED_UPLOAD_SALT,
+        )
+        return {
+            "upload_token": upload_token,
+            "file_url": self.get_url(s3_key),
+            "post_url": presigned_post["url"],
+            "post_fields": presigned_post["fields"],
+            "put_url": put_url,
+            "expires_in": S3_PRESIGNED_EXPIRES,
+        }
+
+    # 업로드 완료 확인: 토큰 검증 후 HEAD 요청으로 실제 객체의 크기/Content-Type 확인. (S3 URL, 원본 파일명) 반환
+    # 토큰은 한 번만 사용할 수 있다 (검증을 통과한 첫 요청만 성공)
+    # consume=False 면 사용 처리는 하지 않으므로, 등록 직전에 claim_presigned_upload 를 따로 호출해야 한다
+    def verify_presigned_upload(
+        self, policy: UploadPolicy, user_id: int, upload_token: str, consume: bool = True
+    ) -> Tuple[str, str]:
+        token = self._load_upload_token(upload_token)
+
+        if token["user_id"] != user_id or token["prefix"] != policy.prefix:
+            raise ValidationError({"upload_token": ["유효하지 않은 업로드 토큰입니다."]})
+
+        info = self.get_object_info(token["key"])
+        if info is None:
+            raise ValidationError({"upload_token": ["업로드된 파일을 찾을 수 없습니다."]})
+
+        try:
+            policy.validate(token["file_name"], info["content_type"], info["size"])
+        except ValidationError:
+            # 조건에 맞지 않는 파일(PUT 으로 크기 초과 등)은 바로 삭제
+            self.delete_files([self.get_url(token["key"])])
+            raise
+
+        # 업로드가 끝나기 전에 호출된 경우 등은 다시 시도할 수 있도록, 검증을 모두 통과한 뒤에 사용 처리
+        if consume:
+            self.claim_presigned_upload(user_id, upload_token)
+
+        return self.get_url(token["key"]), token["file_name"]
+
+    def claim_presigned_upload(self, user_id: int, upload_token: str) -> None:
+        """업로드 토큰 사용 처리 (SET NX). 이미 사용된 토큰이면 ValidationError"""
+        token = self._load_upload_token(upload_token)
+        used_key = PRESIGNED_UPLOAD_USED_KEY.format(s3_key=token["key"])
+        if not cache.add(used_key, user_id, timeout=S3_PRESIGNED_EXPIRES * 2):
+            raise ValidationError({"upload_token": ["이미 완료 처리된 업로드 토큰입니다."]})
+
+    def _load_upload_token(self, upload_token: str) -> Dict[str, Any]:
+        try:
+            return cast(
+                Dict[str, Any],
+                signing.loads(upload_token, salt=PRESIGNED_UPLOAD_SALT, max_age=S3_PRESIGNED_EXPIRES * 2),
+            )
+        except signing.BadSignature:
+            raise ValidationError({"upload_token": ["유효하지 않거나 만료된 업로드 토큰입니다."]})
+
+    def get_object_info(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """HEAD 요청으로 객체 크기/Content-Type 조회. 객체가 없으면 None"""
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=s3_key)
+        except ClientError:
+            return None
+        return {"size": response["ContentLength"], "content_type": response.get("ContentType", "")}
+
+    # 여러 파일을 스레드풀에서 동시에 업로드하고 입력 순서대로 URL 반환. 실패하거나 제한 시간을 넘긴 파일은 None
+    # timeout 은 파일 하나가 아니라 묶음 전체의 제한 시간 (공유 스레드풀에서 대기한 시간도 포함)
+    def upload_files(
+        self, files: List[Tuple[UploadedFile, str]], timeout: float = S3_UPLOAD_TIMEOUT
+    ) -> List[Optional[str]]:
+        futures = [_upload_executor.submit(self.upload_file, file_obj, s3_key) for file_obj, s3_key in files]
+        _, not_done = wait(futures, timeout=timeout)
+
+        urls: List[Optional[str]] = []
+        for future in futures:
+            if future in not_done:
+                # 아직 스레드풀에서 대기 중이면 취소하고, 이미 업로드 중이면 끝난 뒤에 바로 삭제 (응답에 포함되지 않음)
+                if not future.cancel():
+                    future.add_done_callback(self._delete_late_upload)
+                urls.append(None)
+            elif future.exception() is not None:
+                logger.warning("S3 upload failed: %s", future.exception())
+                urls.append(None)
+            else:
+                urls.append(future.result())
+        return urls
+
+    def _delete_late_upload(self, future: "Future[Optional[str]]") -> None:
+        if future.exception() is None and future.result():
+            self.delete_files([cast(str, future.result())])
+
     def delete_file(self, s3_url: str) -> bool:
         """S3 URL에서 파일 삭제"""
         try:
             # URL에서 S3 키 추출
-            # https://bucket.s3.region.amazonaws.com/answers/filename.jpg -> answers/filename.jpg
-            s3_key = s3_url.split(f"{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/")[-1]
+            s3_key = self.get_key(s3_url)
 
             self.client.delete_object(Bucket=self.bucket, Key=s3_key)
             return True
         except Exception as e:
             return False
 
+    def delete_files(self, s3_urls: List[str]) -> bool:
+        """여러 파일을 delete_objects 로 한 번에 삭제 (1000개 단위). 하나라도 실패하면 False"""
+        return self.delete_keys([self.get_key(s3_url) for s3_url in s3_urls])
+
+    def delete_keys(self, keys: List[str]) -> bool:
+        success = True
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start : start + S3_DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+                if response.get("Errors"):
+                    logger.warning("S3 delete_objects failed: %s", response["Errors"])
+                    success = False
+            except Exception as e:
+                logger.warning("S3 delete_objects failed: %s", e)
+                success = False
+        return success
+
     # 기존 파일 위치에 새 파일을 덮어쓰고 동일 URL 반환. 실패 시 None 반환
     def update_file(self, file_obj: UploadedFile, s3_url: str) -> Optional[str]:
 
         try:
             # S3 URL에서 Key 추출
-            s3_key = s3_url.split(f"{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/")[-1]
+            s3_key = self.get_key(s3_url)
             if not s3_key:
                 return None
 
@@ -0,0 +1,71 @@
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from django.db.models import Model
+from django.utils import timezone
+
+from core.utils.s3_file_upload import S3Uploader
+
+logger = logging.getLogger(__name__)
+
+# 업로드 후 아직 게시글/질문에 연결되지 않았을 수 있는 파일을 보호하는 기간
+S3_GC_GRACE_PERIOD = timedelta(hours=int(os.getenv("S3_GC_GRACE_HOURS", 24)))
+REFERENCE_CHUNK_SIZE = 2000
+
+
+def hash_key(s3_key: str) -> bytes:
+    # 키 전체 문자열 대신 16바이트 해시만 보관해서 대량 비교 시 메모리 사용량을 줄인다
+    return hashlib.blake2b(s3_key.encode("utf-8"), digest_size=16).digest()
+
+
+class S3OrphanCollector:
+    """지정한 S3 경로의 파일 중 어떤 모델에서도 참조하지 않는 파일(고아 파일)을 찾아 삭제 (mark-and-sweep)"""
+
+    def __init__(
+        self,
+        prefixes: List[str],
+        sources: List[Tuple[Type[Model], str]],
+        grace_period: timedelta = S3_GC_GRACE_PERIOD,
+    ) -> None:
+        self.prefixes = prefixes
+        self.sources = sources
+        self.grace_period = grace_period
+
+    def referenced_hashes(self, uploader: S3Uploader) -> Set[bytes]:
+        """mark: DB 에 저장된 파일 URL 의 키 해시 집합"""
+        hashes = set()
+        for model, field in self.sources:
+            urls = model._default_manager.exclude(**{f"{field}__isnull": True}).values_list(field, flat=True)
+            for url in urls.iterator(chunk_size=REFERENCE_CHUNK_SIZE):
+                if url:
+                    hashes.add(hash_key(uploader.get_key(url)))
+        return hashes
+
+    def listed_objects(self, uploader: S3Uploader, cutoff: datetime) -> Dict[bytes, str]:
+        """유예 기간보다 오래된 S3 객체 {키 해시: 키} (list_objects_v2 페이지 단위 조회)"""
+        objects = {}
+        paginator = uploader.client.get_paginator("list_objects_v2")
+        for prefix in self.prefixes:
+            for page in paginator.paginate(Bucket=uploader.bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    if obj["LastModified"] < cutoff:
+                        objects[hash_key(obj["Key"])] = obj["Key"]
+        return objects
+
+    def find_orphans(self, uploader: S3Uploader, now: Optional[datetime] = None) -> List[str]:
+        # 참조 목록을 먼저 만든 뒤 목록을 조회 -> 그 사이 새로 올라온 파일은 유예 기간으로 보호된다
+        referenced = self.referenced_hashes(uploader)
+        listed = self.listed_objects(uploader, (now or timezone.now()) - self.grace_period)
+        return sorted(listed[key_hash] for key_hash in listed.keys() - referenced)
+
+    def sweep(self, uploader: Optional[S3Uploader] = None, dry_run: bool = False) -> int:
+        """sweep: 고아 파일을 delete_objects 로 일괄 삭제하고 삭제(대상) 수 반환"""
+        uploader = uploader or S3Uploader()
+        orphans = self.find_orphans(uploader)
+        if orphans and not dry_run:
+            uploader.delete_keys(orphans)
+        logger.info("S3 orphan sweep %s: %d files%s", self.prefixes, len(orphans), " (dry run)" if dry_run else "")
+        return len(orphans)
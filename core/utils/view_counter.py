@@ -0,0 +1,138 @@
+# core/utils/view_counter.py
+
+import logging
+import time
+from typing import Iterable, List, Optional, Tuple, Type, cast
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django_redis import get_redis_connection  # type: ignore
+from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+# 같은 사용자(IP)의 반복 조회를 한 번으로 보는 시간 (초)
+VIEW_DEDUP_TTL = 60 * 10
+# UPDATE ... FROM (VALUES ...) 한 문장에 담을 최대 행 수
+FLUSH_BATCH_SIZE = 500
+
+
+def get_viewer_key(request: Request) -> str:
+    """조회 중복 제거에 사용할 식별자 (로그인 유저는 id, 비로그인은 IP)"""
+    if request.user and request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+
+    return f"ip:{get_client_ip(request)}"
+
+
+def get_client_ip(request: Request) -> str:
+    """클라이언트 IP. X-Forwarded-For 의 왼쪽 값은 클라이언트가 임의로 넣을 수 있으므로
+    신뢰하는 프록시가 덧붙인 오른쪽 hop 만 사용한다"""
+    remote_addr = request.META.get("REMOTE_ADDR", "")
+    proxy_count = settings.TRUSTED_PROXY_COUNT
+    if proxy_count <= 0:
+        return remote_addr
+
+    hops = [hop.strip() for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if hop.strip()]
+    if len(hops) < proxy_count:
+        return remote_addr
+    return hops[-proxy_count]
+
+
+# 조회수 버퍼 공통 유틸 클래스
+# 상세 조회 시에는 Redis 해시에만 증가분을 쌓고(HINCRBY), Celery beat 가 주기적으로 DB에 일괄 반영한다.
+class ViewCountBuffer:
+
+    def __init__(self, model: Type[models.Model], namespace: str) -> None:
+        self.model = model
+        self.pending_key = f"view_count:{namespace}:pending"
+        self.flushing_key = f"view_count:{namespace}:flushing"
+        self.lock_key = f"view_count:{namespace}:lock"
+        self.seen_key_prefix = f"view_count:{namespace}:seen"
+
+    def _seen_key(self, obj_id: int) -> str:
+        # TTL 구간마다 새 Set 을 사용해 오래된 조회 기록이 자동으로 만료되도록 함
+        window = int(time.time() // VIEW_DEDUP_TTL)
+        return f"{self.seen_key_prefix}:{obj_id}:{window}"
+
+    def incr(self, obj_id: int, viewer_key: Optional[str] = None) -> int:
+        """조회수 1 증가 후 아직 DB에 반영되지 않은 증가분을 반환. Redis 장애 시 조회는 계속 되도록 0 반환"""
+        try:
+            redis = get_redis_connection("default")
+
+            if viewer_key:
+                seen_key = self._seen_key(obj_id)
+                pipe = redis.pipeline()
+                pipe.sadd(seen_key, viewer_key)
+                pipe.expire(seen_key, VIEW_DEDUP_TTL * 2)
+                added, _ = pipe.execute()
+                if not added:
+                    return self.get_pending(obj_id)
+
+            pipe = redis.pipeline()
+            pipe.hincrby(self.pending_key, str(obj_id), 1)
+            pipe.hget(self.flushing_key, str(obj_id))
+            pending, flushing = pipe.execute()
+            return int(pending) + int(flushing or 0)
+        except Exception as e:
+            logger.warning(f"[ViewCount] 조회수 증가 실패: {self.pending_key}/{obj_id}/사유: {e}")
+            return 0
+
+    def get_pending(self, obj_id: int) -> int:
+        """DB에 아직 반영되지 않은 증가분 (flush 진행 중인 값 포함)"""
+        try:
+            redis = get_redis_connection("default")
+            pipe = redis.pipeline()
+            pipe.hget(self.pending_key, str(obj_id))
+            pipe.hget(self.flushing_key, str(obj_id))
+            pending, flushing = pipe.execute()
+            return int(pending or 0) + int(flushing or 0)
+        except Exception as e:
+            logger.warning(f"[ViewCount] 조회수 조회 실패: {self.pending_key}/{obj_id}/사유: {e}")
+            return 0
+
+    def flush(self) -> int:
+        """누적된 증가분을 DB에 일괄 반영하고 반영된 객체 수를 반환"""
+        redis = get_redis_connection("default")
+
+        lock = redis.lock(self.lock_key, timeout=60 * 5)
+        if not lock.acquire(blocking=False):
+            return 0
+
+        try:
+            # 이전 flush 가 실패해 남아있는 증가분이 있으면 그것부터 처리
+            if not redis.exists(self.flushing_key):
+                if not redis.exists(self.pending_key):
+                    return 0
+                redis.rename(self.pending_key, self.flushing_key)
+
+            deltas = [(int(obj_id), int(delta)) for obj_id, delta in redis.hgetall(self.flushing_key).items()]
+
+            with transaction.atomic():
+                for start in range(0, len(deltas), FLUSH_BATCH_SIZE):
+                    self._apply(deltas[start : start + FLUSH_BATCH_SIZE])
+
+            redis.delete(self.flushing_key)
+            return len(deltas)
+        finally:
+            lock.release()
+
+    def _apply(self, deltas: Iterable[Tuple[int, int]]) -> None:
+        rows: List[Tuple[int, int]] = [row for row in deltas if row[1] > 0]
+        if not rows:
+            return
+
+        quote = connection.ops.quote_name
+        table = quote(self.model._meta.db_table)
+        pk_column = quote(cast(str, self.model._meta.pk.column))  # type: ignore[union-attr]
+        values = ", ".join(["(%s, %s)"] * len(rows))
+
+        sql = (
+            f"UPDATE {table} SET view_count = {table}.view_count + v.delta "
+            f"FROM (VALUES {values}) AS v(id, delta) "
+            f"WHERE {table}.{pk_column} = v.id"
+        )
+        params = [value for row in rows for value in row]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)